@@ -0,0 +1,62 @@
+from numba import njit as jit
+import numpy as np
+
+__all__ = [
+    "douglas_peucker",
+]
+
+
+@jit
+def douglas_peucker(x, y, tol):
+    """Selects the vertices of a polyline kept by the Douglas-Peucker algorithm.
+
+    Every removed vertex lies closer than tol to the segment
+    between the kept vertices that surround it.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        Coordinates of the vertices.
+    tol : float
+        Maximum distance of the removed vertices to the simplified polyline.
+
+    Returns
+    -------
+    keep : numpy.ndarray
+        Boolean mask of the kept vertices, which always include both ends.
+
+    """
+    n = x.shape[0]
+    keep = np.zeros(n, dtype=np.bool_)
+    if n == 0:
+        return keep
+    keep[0] = keep[n - 1] = True
+
+    stack = np.empty((n, 2), dtype=np.int64)
+    stack[0, 0], stack[0, 1] = 0, n - 1
+    top = 1
+    while top > 0:
+        top -= 1
+        first, last = stack[top, 0], stack[top, 1]
+        if last - first < 2:
+            continue
+
+        dx, dy = x[last] - x[first], y[last] - y[first]
+        length = np.sqrt(dx**2 + dy**2)
+        d_max, i_max = -1.0, first
+        for i in range(first + 1, last):
+            if length > 0:
+                d = abs(dy * (x[i] - x[first]) - dx * (y[i] - y[first]))
+                d /= length
+            else:
+                d = np.sqrt((x[i] - x[first]) ** 2 + (y[i] - y[first]) ** 2)
+            if d > d_max:
+                d_max, i_max = d, i
+
+        if d_max > tol:
+            keep[i_max] = True
+            stack[top, 0], stack[top, 1] = first, i_max
+            stack[top + 1, 0], stack[top + 1, 1] = i_max, last
+            top += 2
+
+    return keep
@@ -1,7 +1,19 @@
+import sys
+
+from numba import njit as jit, prange
 import numpy as np
 from scipy.interpolate import interp1d
 
-__all__ = ["interp1d", "spline_interp", "sinc_interp"]
+__all__ = [
+    "interp1d",
+    "spline_interp",
+    "sinc_interp",
+    "hermite_interp_at",
+    "hermite_segments",
+    "lagrange_interp_many",
+    "chebyshev_segments_fit",
+    "chebyshev_segments_eval",
+]
 
 
 def spline_interp(y, x, u, *, kind="cubic"):
@@ -31,3 +43,209 @@ def sinc_interp(y, x, u):
     y_u = y @ np.sinc(sincM / T)
 
     return y_u
+
+
+@jit
+def hermite_interp_at(y, dy, x, t):
+    """Interpolates y, sampled at x instants with derivatives dy, at a single instant t
+    using cubic Hermite polynomials.
+
+    Parameters
+    ----------
+    y : numpy.ndarray
+        Sampled values, with shape (len(x), m).
+    dy : numpy.ndarray
+        Derivatives of the sampled values with respect to x, with shape (len(x), m).
+    x : numpy.ndarray
+        Strictly increasing sampling instants.
+    t : float
+        Instant to interpolate at. Values outside of the sampling interval
+        are extrapolated using the closest segment.
+
+    """
+    i = np.searchsorted(x, t, side="right") - 1
+    i = min(max(i, 0), x.shape[0] - 2)
+
+    h = x[i + 1] - x[i]
+    s = (t - x[i]) / h
+
+    h00 = (1 + 2 * s) * (1 - s) ** 2
+    h10 = s * (1 - s) ** 2
+    h01 = s**2 * (3 - 2 * s)
+    h11 = s**2 * (s - 1)
+
+    return h00 * y[i] + h10 * h * dy[i] + h01 * y[i + 1] + h11 * h * dy[i + 1]
+
+
+def hermite_segments(t, t0, t1, y0, dy0, y1, dy1):
+    """Interpolates many cubic Hermite segments, each one at its own instant.
+
+    Parameters
+    ----------
+    t : numpy.ndarray
+        Instants to interpolate at, with shape (n,).
+    t0, t1 : numpy.ndarray
+        Start and end of each segment, with shape (n,).
+    y0, dy0, y1, dy1 : numpy.ndarray
+        Values and derivatives at the start and end of each segment, with shape (n, m).
+
+    Returns
+    -------
+    numpy.ndarray
+        Interpolated values and derivatives concatenated, with shape (n, 2 * m).
+
+    """
+    h = (t1 - t0)[:, None]
+    s = (t - t0)[:, None] / h
+
+    y = (
+        (1 + 2 * s) * (1 - s) ** 2 * y0
+        + s * (1 - s) ** 2 * h * dy0
+        + s**2 * (3 - 2 * s) * y1
+        + s**2 * (s - 1) * h * dy1
+    )
+    dy = (
+        6 * s * (s - 1) * (y0 - y1) / h
+        + (1 - s) * (1 - 3 * s) * dy0
+        + s * (3 * s - 2) * dy1
+    )
+
+    return np.hstack((y, dy))
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def lagrange_interp_many(y, x, t, order):
+    """Interpolates y, sampled at x instants, at t instants using Lagrange polynomials
+    over a sliding window of order + 1 samples around every instant.
+
+    Parameters
+    ----------
+    y : numpy.ndarray
+        Sampled values, with shape (len(x), m).
+    x : numpy.ndarray
+        Strictly increasing sampling instants.
+    t : numpy.ndarray
+        Instants to interpolate at, with shape (n,).
+    order : int
+        Order of the polynomials, at most len(x) - 1.
+
+    Returns
+    -------
+    numpy.ndarray
+        Interpolated values, with shape (n, m).
+
+    """
+    n, m = t.shape[0], y.shape[1]
+    y_t = np.zeros((n, m))
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        j = np.searchsorted(x, t[i]) - (order + 1) // 2
+        j = min(max(j, 0), x.shape[0] - order - 1)
+
+        for p in range(j, j + order + 1):
+            weight = 1.0
+            for q in range(j, j + order + 1):
+                if q != p:
+                    weight *= (t[i] - x[q]) / (x[p] - x[q])
+            for k in range(m):
+                y_t[i, k] += weight * y[p, k]
+
+    return y_t
+
+
+def chebyshev_segments_fit(t, y, dy, bounds, degree):
+    """Fits a Chebyshev polynomial to values and derivatives in every segment.
+
+    Parameters
+    ----------
+    t : numpy.ndarray
+        Sampling instants, with shape (n,).
+    y, dy : numpy.ndarray
+        Sampled values and derivatives with respect to t, with shape (n, m).
+    bounds : numpy.ndarray
+        Strictly increasing bounds of the segments, with shape (s + 1,).
+    degree : int
+        Degree of the polynomials.
+
+    Returns
+    -------
+    coeffs : numpy.ndarray
+        Coefficients of the polynomials, with shape (s, degree + 1, m).
+
+    Notes
+    -----
+    Values and derivatives are fitted together in the least squares sense,
+    so that every segment needs at least (degree + 1) / 2 samples.
+
+    """
+    # Derivatives of the basis polynomials as combinations of lower degree ones
+    der = np.polynomial.chebyshev.chebder(np.eye(degree + 1))
+
+    coeffs = np.empty((len(bounds) - 1, degree + 1, y.shape[1]))
+    for j, (a, b) in enumerate(zip(bounds[:-1], bounds[1:])):
+        mask = (t >= a) & (t <= b)
+        if 2 * mask.sum() < degree + 1:
+            raise ValueError(
+                "Not enough samples in segment to fit the polynomial, "
+                "use longer segments or a lower degree"
+            )
+
+        half = (b - a) / 2
+        x = (t[mask] - (a + b) / 2) / half
+        A = np.vstack(
+            (
+                np.polynomial.chebyshev.chebvander(x, degree),
+                np.polynomial.chebyshev.chebvander(x, degree - 1) @ der,
+            )
+        )
+        rhs = np.vstack((y[mask], dy[mask] * half))
+        coeffs[j] = np.linalg.lstsq(A, rhs, rcond=None)[0]
+
+    return coeffs
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def chebyshev_segments_eval(bounds, coeffs, t):
+    """Evaluates piecewise Chebyshev polynomials and their derivatives.
+
+    Parameters
+    ----------
+    bounds : numpy.ndarray
+        Strictly increasing bounds of the segments, with shape (s + 1,).
+    coeffs : numpy.ndarray
+        Coefficients of the polynomials, with shape (s, degree + 1, m).
+    t : numpy.ndarray
+        Instants to evaluate at, with shape (n,).
+
+    Returns
+    -------
+    y, dy : tuple (numpy.ndarray)
+        Values and derivatives with respect to t, with shape (n, m).
+
+    """
+    n = t.shape[0]
+    s, d, m = coeffs.shape
+    y = np.empty((n, m))
+    dy = np.empty((n, m))
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        j = np.searchsorted(bounds, t[i], side="right") - 1
+        j = min(max(j, 0), s - 1)
+        half = (bounds[j + 1] - bounds[j]) / 2
+        x = (t[i] - bounds[j] - half) / half
+
+        # Clenshaw recurrence for the values and the derivatives
+        for k in range(m):
+            b1 = b2 = db1 = db2 = 0.0
+            for p in range(d - 1, 0, -1):
+                b0 = coeffs[j, p, k] + 2 * x * b1 - b2
+                db0 = 2 * b1 + 2 * x * db1 - db2
+                b2, b1 = b1, b0
+                db2, db1 = db1, db0
+
+            y[i, k] = coeffs[j, 0, k] + x * b1 - b2
+            dy[i, k] = (b1 + x * db1 - db2) / half
+
+    return y, dy
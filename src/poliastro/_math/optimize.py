@@ -1,3 +1,172 @@
+"""Scalar root finding and minimization vectorized over many problems."""
+import numpy as np
 from scipy.optimize import brentq
 
-__all__ = ["brentq"]
+__all__ = ["brentq", "brentq_many", "golden_section_many"]
+
+
+def brentq_many(
+    f, a, b, *, xtol=2e-12, rtol=8.881784197001252e-16, maxiter=100
+):
+    """Find the roots of many scalar functions in their brackets using Brent's method.
+
+    All the problems are advanced at the same time, so that ``f`` is evaluated
+    once per iteration for every problem that has not converged yet.
+    The iteration follows the same logic as `scipy.optimize.brentq`.
+
+    Parameters
+    ----------
+    f : callable
+        Function ``f(x, idx)`` returning the values of the problems with indices
+        ``idx`` evaluated at the points ``x``, both one dimensional arrays.
+    a, b : numpy.ndarray
+        Ends of the brackets, the functions must have opposite signs at them.
+    xtol, rtol : float, optional
+        Absolute and relative tolerances of the roots.
+    maxiter : int, optional
+        Maximum number of iterations.
+
+    Returns
+    -------
+    x : numpy.ndarray
+        Roots of the problems.
+    converged : numpy.ndarray
+        Whether each problem converged within ``maxiter`` iterations.
+
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    all_idx = np.arange(a.size)
+
+    xpre, xcur = a.copy(), b.copy()
+    fpre, fcur = f(xpre, all_idx), f(xcur, all_idx)
+    if np.any(fpre * fcur > 0):
+        raise ValueError("f(a) and f(b) must have different signs")
+
+    xblk = np.zeros_like(xpre)
+    fblk = np.zeros_like(xpre)
+    spre = np.zeros_like(xpre)
+    scur = np.zeros_like(xpre)
+
+    converged = (fpre == 0) | (fcur == 0)
+    xcur[fpre == 0] = xpre[fpre == 0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(maxiter):
+            active = ~converged
+            if not active.any():
+                break
+
+            # Keep the root bracketed between xcur and xblk
+            sign_change = active & (fpre * fcur < 0)
+            xblk[sign_change] = xpre[sign_change]
+            fblk[sign_change] = fpre[sign_change]
+            spre[sign_change] = scur[sign_change] = (
+                xcur[sign_change] - xpre[sign_change]
+            )
+
+            # Make xcur the best approximation so far
+            swap = active & (np.abs(fblk) < np.abs(fcur))
+            xpre[swap], xcur[swap], xblk[swap] = (
+                xcur[swap],
+                xblk[swap],
+                xcur[swap],
+            )
+            fpre[swap], fcur[swap], fblk[swap] = (
+                fcur[swap],
+                fblk[swap],
+                fcur[swap],
+            )
+
+            delta = (xtol + rtol * np.abs(xcur)) / 2
+            sbis = (xblk - xcur) / 2
+            converged |= active & ((fcur == 0) | (np.abs(sbis) < delta))
+            active = ~converged
+            if not active.any():
+                break
+
+            # Try interpolation (secant or inverse quadratic),
+            # falling back to bisection if it does not behave
+            interp = (
+                active & (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre))
+            )
+            secant = -fcur * (xcur - xpre) / (fcur - fpre)
+            dpre = (fpre - fcur) / (xpre - xcur)
+            dblk = (fblk - fcur) / (xblk - xcur)
+            quadratic = (
+                -fcur
+                * (fblk * dblk - fpre * dpre)
+                / (dblk * dpre * (fblk - fpre))
+            )
+            stry = np.where(xpre == xblk, secant, quadratic)
+            accept = interp & (
+                2 * np.abs(stry)
+                < np.minimum(np.abs(spre), 3 * np.abs(sbis) - delta)
+            )
+            bisect = active & ~accept
+
+            spre[accept], scur[accept] = scur[accept], stry[accept]
+            spre[bisect] = scur[bisect] = sbis[bisect]
+
+            xpre[active] = xcur[active]
+            fpre[active] = fcur[active]
+            step = np.where(
+                np.abs(scur) > delta, scur, np.where(sbis > 0, delta, -delta)
+            )
+            xcur[active] += step[active]
+
+            idx = all_idx[active]
+            fcur[idx] = f(xcur[idx], idx)
+
+    return xcur, converged
+
+
+def golden_section_many(f, a, b, *, maxiter=60):
+    """Find the minima of many unimodal scalar functions in their intervals
+    using golden section search.
+
+    Parameters
+    ----------
+    f : callable
+        Function ``f(x, idx)`` returning the values of the problems with indices
+        ``idx`` evaluated at the points ``x``, both one dimensional arrays.
+    a, b : numpy.ndarray
+        Ends of the intervals.
+    maxiter : int, optional
+        Number of iterations, each one shrinks the intervals by the golden ratio.
+
+    Returns
+    -------
+    x : numpy.ndarray
+        Location of the minima.
+    fx : numpy.ndarray
+        Values of the functions at the minima.
+
+    """
+    invphi = (np.sqrt(5) - 1) / 2
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+    idx = np.arange(a.size)
+
+    c = b - invphi * (b - a)
+    d = a + invphi * (b - a)
+    fc, fd = f(c, idx), f(d, idx)
+
+    for _ in range(maxiter):
+        left = fc < fd
+        b = np.where(left, d, b)
+        a = np.where(left, a, c)
+
+        # One of the interior points is reused,
+        # so that only one new evaluation is needed per iteration
+        new_x = np.where(left, b - invphi * (b - a), a + invphi * (b - a))
+        new_f = f(new_x, idx)
+        c, d, fc, fd = (
+            np.where(left, new_x, d),
+            np.where(left, c, new_x),
+            np.where(left, new_f, fd),
+            np.where(left, fc, new_f),
+        )
+
+    x = np.where(fc < fd, c, d)
+    return x, np.minimum(fc, fd)
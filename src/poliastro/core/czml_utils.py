@@ -1,4 +1,6 @@
-from numba import njit as jit
+import sys
+
+from numba import njit as jit, prange
 import numpy as np
 
 from poliastro._math.linalg import norm
@@ -99,3 +101,26 @@ def project_point_on_ellipsoid(x, y, z, a, b, c):
     norm_2 = norm(np.array([p2[0] - x, p2[1] - y, p2[2] - z]))
 
     return p1 if norm_1 <= norm_2 else p2
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def project_point_on_ellipsoid_many(rr, a, b, c):
+    """Parallel version of project_point_on_ellipsoid.
+
+    Parameters
+    ----------
+    rr : numpy.ndarray
+        Cartesian coordinates of the points, with shape (n, 3)
+    a, b, c : float
+        Semi-axes of the ellipsoid
+
+    """
+    n = rr.shape[0]
+    pr_rr = np.empty((n, 3))
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        pr_rr[i] = project_point_on_ellipsoid(
+            rr[i, 0], rr[i, 1], rr[i, 2], a, b, c
+        )
+
+    return pr_rr
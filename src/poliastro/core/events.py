@@ -1,6 +1,9 @@
-from numba import njit as jit
+import sys
+
+from numba import njit as jit, prange
 import numpy as np
 
+from poliastro._math.interpolate import hermite_interp_at
 from poliastro._math.linalg import norm
 from poliastro.core.elements import coe_rotation_matrix, rv2coe
 from poliastro.core.util import planetocentric_to_AltAz
@@ -60,6 +63,172 @@ def eclipse_function(k, u_, r_sec, R_sec, R_primary, umbra=True):
     return shadow_function
 
 
+@jit
+def eclipse_function_tabulated(
+    k, u_, t, tt, rr_sec, vv_sec, R_sec, R_primary, umbra=True
+):
+    """Calculates a continuous shadow function, interpolating the position
+    of the secondary body from tabulated states.
+
+    Parameters
+    ----------
+    k : float
+        Standard gravitational parameter (km^3 / s^2).
+    u_ : numpy.ndarray
+        Satellite position and velocity vector with respect to the primary body.
+    t : float
+        Time at which the shadow function is evaluated (s).
+    tt : numpy.ndarray
+        Strictly increasing times of the tabulated states (s).
+    rr_sec : numpy.ndarray
+        Tabulated positions of the secondary body with respect to the primary body (km).
+    vv_sec : numpy.ndarray
+        Tabulated velocities of the secondary body with respect to the primary body (km / s).
+    R_sec : float
+        Equatorial radius of the secondary body.
+    R_primary : float
+        Equatorial radius of the primary body.
+    umbra : bool
+        Whether to calculate the shadow function for umbra or penumbra, defaults to True
+        i.e. calculates for umbra.
+
+    Notes
+    -----
+    The position of the secondary body is interpolated with cubic Hermite polynomials,
+    so that sampling steps of a few hours keep the error well below a kilometer
+    for the Sun as seen from the Earth.
+
+    """
+    r_sec = hermite_interp_at(rr_sec, vv_sec, tt, t)
+    return eclipse_function(k, u_, r_sec, R_sec, R_primary, umbra)
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def eclipse_function_tabulated_many(
+    k, uu, t, tt, rr_sec, vv_sec, R_sec, R_primary, umbra=True
+):
+    """Parallel version of eclipse_function_tabulated.
+
+    Parameters
+    ----------
+    k : float
+        Standard gravitational parameter (km^3 / s^2).
+    uu : numpy.ndarray
+        Satellite position and velocity vectors with respect to the primary body,
+        with shape (n, 6).
+    t : numpy.ndarray
+        Times at which the shadow function is evaluated (s), with shape (n,).
+    tt : numpy.ndarray
+        Strictly increasing times of the tabulated states (s).
+    rr_sec : numpy.ndarray
+        Tabulated positions of the secondary body with respect to the primary body (km).
+    vv_sec : numpy.ndarray
+        Tabulated velocities of the secondary body with respect to the primary body (km / s).
+    R_sec : float
+        Equatorial radius of the secondary body.
+    R_primary : float
+        Equatorial radius of the primary body.
+    umbra : bool
+        Whether to calculate the shadow function for umbra or penumbra, defaults to True
+        i.e. calculates for umbra.
+
+    """
+    n = uu.shape[0]
+    values = np.zeros(n)
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        values[i] = eclipse_function_tabulated(
+            k, uu[i], t[i], tt, rr_sec, vv_sec, R_sec, R_primary, umbra
+        )
+
+    return values
+
+
+@jit
+def shadow_function(r, r_sec, R_sec, R_primary, umbra=True):
+    r"""Calculates a continuous shadow function from the position of the satellite only.
+
+    Parameters
+    ----------
+    r : numpy.ndarray
+        Satellite position vector with respect to the primary body.
+    r_sec : numpy.ndarray
+        Position vector of the secondary body with respect to the primary body.
+    R_sec : float
+        Equatorial radius of the secondary body.
+    R_primary : float
+        Equatorial radius of the primary body.
+    umbra : bool
+        Whether to calculate the shadow function for umbra or penumbra, defaults to True
+        i.e. calculates for umbra.
+
+    Returns
+    -------
+    shadow_function: float
+        Positive if the satellite is inside the shadow, negative otherwise.
+
+    Notes
+    -----
+    This is the shadow function of :py:func:`eclipse_function` divided by
+    :math:`(1 + e \cos{\nu})^2`, which has the same sign and does not require
+    computing the orbital elements. On the half space facing the secondary body,
+    where the original function has spurious roots, it is replaced by
+    :math:`R^2 - r^2`, which is negative outside of the primary body
+    and keeps the function continuous.
+
+    """
+    pm = 1 if umbra else -1
+
+    r_norm = norm(r)
+    r_sec_norm = norm(r_sec)
+    cos_psi = (r @ r_sec) / r_norm / r_sec_norm
+
+    if cos_psi >= 0:
+        return R_primary**2 - r_norm**2
+
+    sin_delta_shadow = np.sin((R_sec - pm * R_primary) / r_sec_norm)
+    return (
+        R_primary**2
+        - r_norm**2 * (1 - cos_psi**2)
+        + pm * 2 * R_primary * r_norm * cos_psi * sin_delta_shadow
+    )
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def shadow_function_many(rr, rr_sec, R_sec, R_primary, umbra=True):
+    """Parallel version of shadow_function over a time grid for many satellites.
+
+    Parameters
+    ----------
+    rr : numpy.ndarray
+        Satellite positions with respect to the primary body, with shape (n, m, 3)
+        for n satellites sampled at m epochs.
+    rr_sec : numpy.ndarray
+        Positions of the secondary body with respect to the primary body
+        at the same m epochs, with shape (m, 3).
+    R_sec : float
+        Equatorial radius of the secondary body.
+    R_primary : float
+        Equatorial radius of the primary body.
+    umbra : bool
+        Whether to calculate the shadow function for umbra or penumbra, defaults to True
+        i.e. calculates for umbra.
+
+    """
+    n, m = rr.shape[0], rr.shape[1]
+    values = np.zeros((n, m))
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        for j in range(m):
+            values[i, j] = shadow_function(
+                rr[i, j], rr_sec[j], R_sec, R_primary, umbra
+            )
+
+    return values
+
+
 @jit
 def line_of_sight(r1, r2, R):
     """Calculates the line of sight condition between two position vectors, r1 and r2.
@@ -90,6 +259,68 @@ def line_of_sight(r1, r2, R):
     return (theta_1 + theta_2) - theta
 
 
+@jit
+def line_of_sight_tabulated(r1, t, tt, rr2, vv2, R):
+    """Calculates the line of sight condition between a position vector r1
+    and a second object whose trajectory is given by tabulated states.
+
+    Parameters
+    ----------
+    r1 : numpy.ndarray
+        The position vector of the first object with respect to a central attractor.
+    t : float
+        Time at which the condition is evaluated.
+    tt : numpy.ndarray
+        Strictly increasing times of the tabulated states of the second object.
+    rr2 : numpy.ndarray
+        Tabulated positions of the second object with respect to a central attractor.
+    vv2 : numpy.ndarray
+        Tabulated velocities of the second object with respect to a central attractor.
+    R : float
+        The radius of the central attractor.
+
+    Returns
+    -------
+    delta_theta: float
+        Greater than or equal to zero, if there exists a LOS between both objects
+        at time t, else negative.
+
+    """
+    r2 = hermite_interp_at(rr2, vv2, tt, t)
+    return line_of_sight(r1, r2, R)
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def line_of_sight_tabulated_many(rr1, t, tt, rr2, vv2, R):
+    """Parallel version of line_of_sight_tabulated.
+
+    Parameters
+    ----------
+    rr1 : numpy.ndarray
+        Position vectors of the first object with respect to a central attractor,
+        with shape (n, 3).
+    t : numpy.ndarray
+        Times at which the condition is evaluated, with shape (n,).
+    tt : numpy.ndarray
+        Strictly increasing times of the tabulated states of the second object.
+    rr2 : numpy.ndarray
+        Tabulated positions of the second object with respect to a central attractor.
+    vv2 : numpy.ndarray
+        Tabulated velocities of the second object with respect to a central attractor.
+    R : float
+        The radius of the central attractor.
+
+    """
+    n = rr1.shape[0]
+    delta_theta = np.zeros(n)
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        delta_theta[i] = line_of_sight_tabulated(rr1[i], t[i], tt, rr2, vv2, R)
+
+    return delta_theta
+
+
 @jit
 def elevation_function(k, u_, phi, theta, R, R_p, H):
     """Calculates the elevation angle of an object in orbit with respect to
@@ -135,3 +366,35 @@ def elevation_function(k, u_, phi, theta, R, R_p, H):
     el = np.arcsin(new_rho[-1])
 
     return el
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def elevation_function_many(k, rr, phi, theta, R, R_p, H):
+    """Parallel version of elevation_function.
+
+    Parameters
+    ----------
+    k: float
+        Standard gravitational parameter.
+    rr: numpy.ndarray
+        Satellite position vectors with respect to the central attractor, with shape (n, 3).
+    phi: numpy.ndarray
+        Geodetic latitudes of the stations, with shape (n,).
+    theta: numpy.ndarray
+        Local sidereal times of the stations, with shape (n,).
+    R: float
+        Equatorial radius of the central attractor.
+    R_p: float
+        Polar radius of the central attractor.
+    H: numpy.ndarray
+        Elevations of the stations above the ellipsoidal surface, with shape (n,).
+
+    """
+    n = rr.shape[0]
+    el = np.zeros(n)
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        el[i] = elevation_function(k, rr[i], phi[i], theta[i], R, R_p, H[i])
+
+    return el
@@ -15,7 +15,9 @@ Celestial Mechanics And Dynamical Astronomy, 109(2), 101-135. doi: 10.1007/s1056
 
 """
 
-from numba import njit as jit
+import sys
+
+from numba import njit as jit, prange
 import numpy as np
 
 
@@ -25,15 +27,16 @@ def sun_rot_elements_at_epoch(T, d):
 
     Parameters
     ----------
-    T : float
+    T : float or numpy.ndarray
         Interval from the standard epoch, in Julian centuries i.e. 36525 days.
-    d : float
+    d : float or numpy.ndarray
         Interval in days from the standard epoch.
 
     Returns
     -------
-    ra, dec, W: tuple (float)
-        Right ascension and declination of north pole, and angle of the prime meridian.
+    ra, dec, W: tuple (float or numpy.ndarray)
+        Right ascension and declination of north pole, and angle of the prime meridian,
+        in degrees. Elements that do not change with time are returned as floats.
 
     """
     ra = 286.13
@@ -49,15 +52,16 @@ def mercury_rot_elements_at_epoch(T, d):
 
     Parameters
     ----------
-    T : float
+    T : float or numpy.ndarray
         Interval from the standard epoch, in Julian centuries.
-    d : float
+    d : float or numpy.ndarray
         Interval in days from the standard epoch.
 
     Returns
     -------
-    ra, dec, W: tuple (float)
-        Right ascension and declination of north pole, and angle of the prime meridian.
+    ra, dec, W: tuple (float or numpy.ndarray)
+        Right ascension and declination of north pole, and angle of the prime meridian,
+        in degrees. Elements that do not change with time are returned as floats.
 
     """
     M1 = np.deg2rad(174.7910857 + 4.092335 * d)
@@ -84,15 +88,16 @@ def venus_rot_elements_at_epoch(T, d):
 
     Parameters
     ----------
-    T : float
+    T : float or numpy.ndarray
         Interval from the standard epoch, in Julian centuries.
-    d : float
+    d : float or numpy.ndarray
         Interval in days from the standard epoch.
 
     Returns
     -------
-    ra, dec, W: tuple (float)
-        Right ascension and declination of north pole, and angle of the prime meridian.
+    ra, dec, W: tuple (float or numpy.ndarray)
+        Right ascension and declination of north pole, and angle of the prime meridian,
+        in degrees. Elements that do not change with time are returned as floats.
 
     """
     ra = 272.76
@@ -108,15 +113,16 @@ def mars_rot_elements_at_epoch(T, d):
 
     Parameters
     ----------
-    T : float
+    T : float or numpy.ndarray
         Interval from the standard epoch, in Julian centuries
-    d : float
+    d : float or numpy.ndarray
         Interval in days from the standard epoch
 
     Returns
     -------
-    ra, dec, W: tuple (float)
-        Right ascension and declination of north pole, and angle of the prime meridian.
+    ra, dec, W: tuple (float or numpy.ndarray)
+        Right ascension and declination of north pole, and angle of the prime meridian,
+        in degrees. Elements that do not change with time are returned as floats.
 
     """
     M1 = np.deg2rad(198.991226 + 19139.4819985 * T)
@@ -178,15 +184,16 @@ def jupiter_rot_elements_at_epoch(T, d):
 
     Parameters
     ----------
-    T : float
+    T : float or numpy.ndarray
         Interval from the standard epoch, in Julian centuries
-    d : float
+    d : float or numpy.ndarray
         Interval in days from the standard epoch
 
     Returns
     -------
-    ra, dec, W: tuple (float)
-        Right ascension and declination of north pole, and angle of the prime meridian.
+    ra, dec, W: tuple (float or numpy.ndarray)
+        Right ascension and declination of north pole, and angle of the prime meridian,
+        in degrees. Elements that do not change with time are returned as floats.
 
     """
     Ja = np.deg2rad(99.360714 + 4850.4046 * T)
@@ -224,15 +231,16 @@ def saturn_rot_elements_at_epoch(T, d):
 
     Parameters
     ----------
-    T : float
+    T : float or numpy.ndarray
         Interval from the standard epoch, in Julian centuries.
-    d : float
+    d : float or numpy.ndarray
         Interval in days from the standard epoch.
 
     Returns
     -------
-    ra, dec, W: tuple (float)
-        Right ascension and declination of north pole, and angle of the prime meridian.
+    ra, dec, W: tuple (float or numpy.ndarray)
+        Right ascension and declination of north pole, and angle of the prime meridian,
+        in degrees. Elements that do not change with time are returned as floats.
 
     """
     ra = 40.589 - 0.036 * T
@@ -248,15 +256,16 @@ def uranus_rot_elements_at_epoch(T, d):
 
     Parameters
     ----------
-    T : float
+    T : float or numpy.ndarray
         Interval from the standard epoch, in Julian centuries.
-    d : float
+    d : float or numpy.ndarray
         Interval in days from the standard epoch.
 
     Returns
     -------
-    ra, dec, W: tuple (float)
-        Right ascension and declination of north pole, and angle of the prime meridian.
+    ra, dec, W: tuple (float or numpy.ndarray)
+        Right ascension and declination of north pole, and angle of the prime meridian,
+        in degrees. Elements that do not change with time are returned as floats.
 
     """
     ra = 257.311
@@ -272,15 +281,16 @@ def neptune_rot_elements_at_epoch(T, d):
 
     Parameters
     ----------
-    T : float
+    T : float or numpy.ndarray
         Interval from the standard epoch, in Julian centuries.
-    d : float
+    d : float or numpy.ndarray
         Interval in days from the standard epoch.
 
     Returns
     -------
-    ra, dec, W: tuple (float)
-        Right ascension and declination of north pole, and angle of the prime meridian.
+    ra, dec, W: tuple (float or numpy.ndarray)
+        Right ascension and declination of north pole, and angle of the prime meridian,
+        in degrees. Elements that do not change with time are returned as floats.
 
     """
     N = np.deg2rad(357.85 + 52.316 * T)
@@ -298,15 +308,16 @@ def moon_rot_elements_at_epoch(T, d):
 
     Parameters
     ----------
-    T : float
+    T : float or numpy.ndarray
         Interval from the standard epoch, in Julian centuries.
-    d : float
+    d : float or numpy.ndarray
         Interval in days from the standard epoch.
 
     Returns
     -------
-    ra, dec, W: tuple (float)
-        Right ascension and declination of north pole, and angle of the prime meridian.
+    ra, dec, W: tuple (float or numpy.ndarray)
+        Right ascension and declination of north pole, and angle of the prime meridian,
+        in degrees. Elements that do not change with time are returned as floats.
 
     """
     E1 = np.deg2rad(125.045 - 0.0529921 * d)
@@ -366,3 +377,107 @@ def moon_rot_elements_at_epoch(T, d):
     )
 
     return ra, dec, W
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def equator_rotation_many(ra, dec, ra_dot, dec_dot):
+    """Rotation matrices to the equator of a body, given its north pole.
+
+    The matrices are :math:`R_x(90^\\circ - \\delta) R_z(90^\\circ + \\alpha)`,
+    which take the x axis to the ascending node of the equator of the body
+    on the reference plane and the z axis to its north pole.
+
+    Parameters
+    ----------
+    ra : numpy.ndarray
+        Right ascension of the north pole, in radians.
+    dec : numpy.ndarray
+        Declination of the north pole, in radians.
+    ra_dot : numpy.ndarray
+        Time derivative of the right ascension of the north pole.
+    dec_dot : numpy.ndarray
+        Time derivative of the declination of the north pole.
+
+    Returns
+    -------
+    QQ, QQ_dot : tuple (numpy.ndarray)
+        Rotation matrices and their time derivatives, with shape (n, 3, 3).
+
+    """
+    n = ra.shape[0]
+    QQ = np.zeros((n, 3, 3))
+    QQ_dot = np.zeros((n, 3, 3))
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        sa, ca = np.cos(ra[i]), -np.sin(ra[i])  # Angle 90 deg + ra
+        sb, cb = np.cos(dec[i]), np.sin(dec[i])  # Angle 90 deg - dec
+        a_dot, b_dot = ra_dot[i], -dec_dot[i]
+
+        QQ[i, 0, 0], QQ[i, 0, 1] = ca, sa
+        QQ[i, 1, 0], QQ[i, 1, 1], QQ[i, 1, 2] = -cb * sa, cb * ca, sb
+        QQ[i, 2, 0], QQ[i, 2, 1], QQ[i, 2, 2] = sb * sa, -sb * ca, cb
+
+        QQ_dot[i, 0, 0], QQ_dot[i, 0, 1] = -sa * a_dot, ca * a_dot
+        QQ_dot[i, 1, 0] = -cb * ca * a_dot + sb * sa * b_dot
+        QQ_dot[i, 1, 1] = -cb * sa * a_dot - sb * ca * b_dot
+        QQ_dot[i, 1, 2] = cb * b_dot
+        QQ_dot[i, 2, 0] = sb * ca * a_dot + cb * sa * b_dot
+        QQ_dot[i, 2, 1] = sb * sa * a_dot - cb * ca * b_dot
+        QQ_dot[i, 2, 2] = -sb * b_dot
+
+    return QQ, QQ_dot
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def rotate_to_body_fixed_many(theta, theta_dot, QQ, QQ_dot, rr, vv):
+    """Rotates states to a body fixed frame that spins around its z axis.
+
+    The rotation is decomposed as :math:`R_z(\\theta) Q`, where :math:`Q` is
+    the slowly varying orientation of the equator of the body and
+    :math:`\\theta` the angle of the prime meridian.
+
+    Parameters
+    ----------
+    theta : numpy.ndarray
+        Angle of the prime meridian, with shape (n,).
+    theta_dot : numpy.ndarray
+        Rotation rate of the body, with shape (n,).
+    QQ : numpy.ndarray
+        Rotation matrices to the true equator of the body, with shape (n, 3, 3).
+    QQ_dot : numpy.ndarray
+        Time derivatives of the rotation matrices, with shape (n, 3, 3).
+    rr : numpy.ndarray
+        Positions in the inertial frame, with shape (n, 3).
+    vv : numpy.ndarray
+        Velocities in the inertial frame, with shape (n, 3).
+
+    Returns
+    -------
+    rr_fixed, vv_fixed : tuple (numpy.ndarray)
+        Positions and velocities in the body fixed frame.
+
+    """
+    n = rr.shape[0]
+    rr_fixed = np.empty_like(rr)
+    vv_fixed = np.empty_like(vv)
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        r = QQ[i] @ rr[i]
+        v = QQ[i] @ vv[i] + QQ_dot[i] @ rr[i]
+        cos_t, sin_t = np.cos(theta[i]), np.sin(theta[i])
+
+        rr_fixed[i, 0] = cos_t * r[0] + sin_t * r[1]
+        rr_fixed[i, 1] = -sin_t * r[0] + cos_t * r[1]
+        rr_fixed[i, 2] = r[2]
+
+        vv_fixed[i, 0] = (
+            cos_t * v[0] + sin_t * v[1] + theta_dot[i] * rr_fixed[i, 1]
+        )
+        vv_fixed[i, 1] = (
+            -sin_t * v[0] + cos_t * v[1] - theta_dot[i] * rr_fixed[i, 0]
+        )
+        vv_fixed[i, 2] = v[2]
+
+    return rr_fixed, vv_fixed
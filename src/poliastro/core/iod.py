@@ -1,10 +1,19 @@
-from numba import njit as jit
+import sys
+
+from numba import njit as jit, prange
 import numpy as np
 from numpy import cross, pi
 
 from poliastro._math.linalg import norm
 from poliastro._math.special import hyp2f1b, stumpff_c2 as c2, stumpff_c3 as c3
 
+# Status codes of the Lambert solvers that do not raise errors
+_LAMBERT_OK = 0
+_LAMBERT_COLLINEAR = 1
+_LAMBERT_INFEASIBLE = 2
+_LAMBERT_NOT_CONVERGED = 3
+_LAMBERT_DEGENERATE = 4
+
 
 @jit
 def vallado(k, r0, r, tof, M, prograde, lowpath, numiter, rtol):
@@ -108,6 +117,34 @@ def vallado(k, r0, r, tof, M, prograde, lowpath, numiter, rtol):
             "Multi-revolution scenario not supported for Vallado. See issue https://github.com/poliastro/poliastro/issues/858"
         )
 
+    # Check preconditions
+    assert tof > 0
+    assert k > 0
+
+    v0, v, status, _ = _vallado(
+        k, r0, r, tof, M, prograde, lowpath, numiter, rtol
+    )
+    if status == _LAMBERT_COLLINEAR:
+        raise RuntimeError("Cannot compute orbit, phase angle is 180 degrees")
+    elif status == _LAMBERT_NOT_CONVERGED:
+        raise RuntimeError("Maximum number of iterations reached")
+
+    return v0, v
+
+
+@jit
+def _vallado(k, r0, r, tof, M, prograde, lowpath, numiter, rtol):
+    """Vallado algorithm returning a status code instead of raising errors.
+
+    Returns the velocities, the status code and the number of iterations.
+    Velocities are NaN unless the status is :py:data:`_LAMBERT_OK`,
+    so that it can be used inside parallel loops.
+
+    """
+    nan_vector = np.full(3, np.nan)
+    if M > 0 or not (tof > 0 and k > 0):
+        return nan_vector, nan_vector, _LAMBERT_INFEASIBLE, 0
+
     t_m = 1 if prograde else -1
 
     norm_r0 = norm(r0)
@@ -120,7 +157,7 @@ def vallado(k, r0, r, tof, M, prograde, lowpath, numiter, rtol):
     A = t_m * (norm_r * norm_r0 * (1 + cos_dnu)) ** 0.5
 
     if A == 0.0:
-        raise RuntimeError("Cannot compute orbit, phase angle is 180 degrees")
+        return nan_vector, nan_vector, _LAMBERT_COLLINEAR, 0
 
     psi = 0.0
     psi_low = -4 * np.pi**2
@@ -159,7 +196,7 @@ def vallado(k, r0, r, tof, M, prograde, lowpath, numiter, rtol):
 
         psi = (psi_up + psi_low) / 2
     else:
-        raise RuntimeError("Maximum number of iterations reached")
+        return nan_vector, nan_vector, _LAMBERT_NOT_CONVERGED, count
 
     f = 1 - y / norm_r0
     g = A * np.sqrt(y / k)
@@ -169,7 +206,66 @@ def vallado(k, r0, r, tof, M, prograde, lowpath, numiter, rtol):
     v0 = (r - f * r0) / g
     v = (gdot * r - r0) / g
 
-    return v0, v
+    return v0, v, _LAMBERT_OK, count + 1
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def vallado_many(k, r0, r, tof, M, prograde, lowpath, numiter, rtol):
+    """Solves many Lambert's problems in parallel with the Vallado algorithm.
+
+    Parameters
+    ----------
+    k : float
+        Gravitational Parameter
+    r0 : numpy.ndarray
+        Initial position vectors, with shape (n, 3)
+    r : numpy.ndarray
+        Final position vectors, with shape (n, 3)
+    tof : numpy.ndarray
+        Times of flight, with shape (n,)
+    M : int
+        Number of revolutions
+    prograde: boolean
+        Controls the desired inclination of the transfer orbit.
+    lowpath: boolean
+        If `True` or `False`, gets the transfer orbit whose vacant focus is
+        below or above the chord line, respectively.
+    numiter : int
+        Number of iterations
+    rtol : float
+        Error tolerance
+
+    Returns
+    -------
+    v0: numpy.ndarray
+        Initial velocity vectors, with shape (n, 3)
+    v: numpy.ndarray
+        Final velocity vectors, with shape (n, 3)
+    status: numpy.ndarray
+        Status code of every problem, zero for the solved ones
+    iterations: numpy.ndarray
+        Number of bisection iterations of every problem
+
+    Notes
+    -----
+    Instead of raising errors, the velocities are NaN for the problems
+    without solution, because of opposite positions, non positive times
+    of flight or multiple revolutions, or for which the algorithm does not converge.
+
+    """
+    n = r0.shape[0]
+    v0 = np.empty((n, 3))
+    v = np.empty((n, 3))
+    status = np.empty(n, dtype=np.int64)
+    iterations = np.empty(n, dtype=np.int64)
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        v0[i], v[i], status[i], iterations[i] = _vallado(
+            k, r0[i], r[i], tof[i], M, prograde, lowpath, numiter, rtol
+        )
+
+    return v0, v, status, iterations
 
 
 @jit
@@ -210,11 +306,61 @@ def izzo(k, r1, r2, tof, M, prograde, lowpath, numiter, rtol):
     assert tof > 0
     assert k > 0
 
-    # Check collinearity of r1 and r2
-    if not cross(r1, r2).any():
+    v1, v2, status, _ = _izzo(
+        k, r1, r2, tof, M, prograde, lowpath, numiter, rtol
+    )
+    _raise_lambert_status(status)
+
+    return v1, v2
+
+
+@jit
+def _raise_lambert_status(status):
+    if status == _LAMBERT_COLLINEAR:
         raise ValueError(
             "Lambert solution cannot be computed for collinear vectors"
         )
+    elif status == _LAMBERT_INFEASIBLE:
+        raise ValueError("No feasible solution, try lower M")
+    elif status == _LAMBERT_NOT_CONVERGED:
+        raise RuntimeError("Failed to converge")
+    elif status == _LAMBERT_DEGENERATE:
+        raise ValueError(
+            "Lambert solution cannot be computed for a degenerate geometry "
+            "or time of flight"
+        )
+
+
+@jit
+def _izzo(k, r1, r2, tof, M, prograde, lowpath, numiter, rtol):
+    """Izzo algorithm returning a status code instead of raising errors.
+
+    Returns the velocities, the status code and the number of iterations.
+    Velocities are NaN unless the status is :py:data:`_LAMBERT_OK`,
+    so that it can be used inside parallel loops.
+
+    """
+    v1, v2, status, iterations, _ = _izzo_x0(
+        k, r1, r2, tof, M, prograde, lowpath, numiter, rtol, np.nan
+    )
+    return v1, v2, status, iterations
+
+
+@jit
+def _izzo_x0(k, r1, r2, tof, M, prograde, lowpath, numiter, rtol, x_0):
+    """Izzo algorithm starting the iterations from a given x, if it is not NaN.
+
+    Returns the same values as :py:func:`_izzo` and the converged x,
+    which can start the iterations of a similar problem.
+
+    """
+    nan_vector = np.full(3, np.nan)
+    if not (tof > 0 and k > 0):
+        return nan_vector, nan_vector, _LAMBERT_DEGENERATE, 0, np.nan
+
+    # Check collinearity of r1 and r2
+    if not cross(r1, r2).any():
+        return nan_vector, nan_vector, _LAMBERT_COLLINEAR, 0, np.nan
 
     # Chord
     c = r2 - r1
@@ -245,7 +391,9 @@ def izzo(k, r1, r2, tof, M, prograde, lowpath, numiter, rtol):
     T = np.sqrt(2 * k / s**3) * tof
 
     # Find solutions
-    x, y = _find_xy(ll, T, M, numiter, lowpath, rtol)
+    x, y, status, iterations = _find_xy(ll, T, M, numiter, lowpath, rtol, x_0)
+    if status != _LAMBERT_OK:
+        return nan_vector, nan_vector, status, iterations, np.nan
 
     # Reconstruct
     gamma = np.sqrt(k * s / 2)
@@ -261,7 +409,146 @@ def izzo(k, r1, r2, tof, M, prograde, lowpath, numiter, rtol):
     v1 = V_r1 * (r1 / r1_norm) + V_t1 * i_t1
     v2 = V_r2 * (r2 / r2_norm) + V_t2 * i_t2
 
-    return v1, v2
+    return v1, v2, _LAMBERT_OK, iterations, x
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def izzo_many(k, r1, r2, tof, M, prograde, lowpath, numiter, rtol):
+    """Solves many Lambert's problems in parallel with the Izzo algorithm.
+
+    Parameters
+    ----------
+    k : float
+        Gravitational Constant
+    r1 : numpy.ndarray
+        Initial position vectors, with shape (n, 3)
+    r2 : numpy.ndarray
+        Final position vectors, with shape (n, 3)
+    tof : numpy.ndarray
+        Times of flight between both positions, with shape (n,)
+    M : int
+        Number of revolutions
+    prograde: boolean
+        Controls the desired inclination of the transfer orbit.
+    lowpath: boolean
+        If `True` or `False`, gets the transfer orbit whose vacant focus is
+        below or above the chord line, respectively.
+    numiter : int
+        Number of iterations
+    rtol : float
+        Error tolerance
+
+    Returns
+    -------
+    v1: numpy.ndarray
+        Initial velocity vectors, with shape (n, 3)
+    v2: numpy.ndarray
+        Final velocity vectors, with shape (n, 3)
+    status: numpy.ndarray
+        Status code of every problem, zero for the solved ones
+    iterations: numpy.ndarray
+        Number of Householder iterations of every problem
+
+    Notes
+    -----
+    Instead of raising errors, the velocities are NaN for the problems
+    without solution, because of collinear positions, non positive times
+    of flight or too many revolutions, or for which the algorithm does not converge.
+
+    """
+    n = r1.shape[0]
+    v1 = np.empty((n, 3))
+    v2 = np.empty((n, 3))
+    status = np.empty(n, dtype=np.int64)
+    iterations = np.empty(n, dtype=np.int64)
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        v1[i], v2[i], status[i], iterations[i] = _izzo(
+            k, r1[i], r2[i], tof[i], M, prograde, lowpath, numiter, rtol
+        )
+
+    return v1, v2, status, iterations
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def izzo_grid(k, r1, r2, tof, M, prograde, lowpath, numiter, rtol, warm_start):
+    """Solves in parallel the Lambert's problems between two sets of positions.
+
+    Every problem of the grid goes from one of the initial positions to one of
+    the final positions, as in porkchop plots. The rows of the grid are solved
+    in parallel and, if ``warm_start`` is True, the iterations of every problem
+    start from the solution of the previous one in the same row, which is close
+    to it when the positions and times of flight change smoothly along the rows.
+
+    Parameters
+    ----------
+    k : float
+        Gravitational Constant
+    r1 : numpy.ndarray
+        Initial position vectors, with shape (n, 3)
+    r2 : numpy.ndarray
+        Final position vectors, with shape (m, 3)
+    tof : numpy.ndarray
+        Times of flight between every final and initial position, with shape (m, n)
+    M : int
+        Number of revolutions
+    prograde: boolean
+        Controls the desired inclination of the transfer orbit.
+    lowpath: boolean
+        If `True` or `False`, gets the transfer orbit whose vacant focus is
+        below or above the chord line, respectively.
+    numiter : int
+        Number of iterations
+    rtol : float
+        Error tolerance
+    warm_start : boolean
+        Whether to start the iterations from the solution of the previous problem.
+
+    Returns
+    -------
+    v1: numpy.ndarray
+        Initial velocity vectors, with shape (m, n, 3)
+    v2: numpy.ndarray
+        Final velocity vectors, with shape (m, n, 3)
+    status: numpy.ndarray
+        Status code of every problem, zero for the solved ones
+    iterations: numpy.ndarray
+        Number of Householder iterations of every problem
+
+    Notes
+    -----
+    Only direct transfers are warm started, because for multiple revolutions the
+    solution of the previous problem might lead the iterations to the other branch.
+    If a warm started problem does not converge, it is solved again from the
+    usual initial guess, and the iterations of both attempts are counted.
+
+    """
+    m, n = tof.shape
+    v1 = np.empty((m, n, 3))
+    v2 = np.empty((m, n, 3))
+    status = np.empty((m, n), dtype=np.int64)
+    iterations = np.empty((m, n), dtype=np.int64)
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(m):  # pylint: disable=not-an-iterable
+        x = np.nan
+        for j in range(n):
+            x_0 = x if warm_start else np.nan
+            v1[i, j], v2[i, j], status[i, j], iterations[i, j], x = _izzo_x0(
+                k,
+                r1[j],
+                r2[i],
+                tof[i, j],
+                M,
+                prograde,
+                lowpath,
+                numiter,
+                rtol,
+                x_0,
+            )
+
+    return v1, v2, status, iterations
 
 
 @jit
@@ -275,11 +562,18 @@ def _reconstruct(x, y, r1, r2, ll, gamma, rho, sigma):
 
 
 @jit
-def _find_xy(ll, T, M, numiter, lowpath, rtol):
-    """Computes all x, y for given number of revolutions."""
+def _find_xy(ll, T, M, numiter, lowpath, rtol, x_0):
+    """Computes all x, y for given number of revolutions.
+
+    Returns x, y, a status code, see :py:func:`_izzo`,
+    and the number of Householder iterations. The iterations start
+    from ``x_0`` for direct transfers, unless it is NaN.
+
+    """
     # For abs(ll) == 1 the derivative is not continuous
-    assert abs(ll) < 1
-    assert T > 0  # Mistake in the original paper
+    # and T > 0 is a mistake in the original paper
+    if not (abs(ll) < 1 and T > 0):
+        return np.nan, np.nan, _LAMBERT_DEGENERATE, 0
 
     M_max = np.floor(T / pi)
     T_00 = np.arccos(ll) + ll * np.sqrt(1 - ll**2)  # T_xM
@@ -287,22 +581,32 @@ def _find_xy(ll, T, M, numiter, lowpath, rtol):
     # Refine maximum number of revolutions if necessary
     if T < T_00 + M_max * pi and M_max > 0:
         _, T_min = _compute_T_min(ll, M_max, numiter, rtol)
+        if np.isnan(T_min):
+            return np.nan, np.nan, _LAMBERT_NOT_CONVERGED, 0
         if T < T_min:
             M_max -= 1
 
     # Check if a feasible solution exist for the given number of revolutions
     # This departs from the original paper in that we do not compute all solutions
     if M > M_max:
-        raise ValueError("No feasible solution, try lower M")
+        return np.nan, np.nan, _LAMBERT_INFEASIBLE, 0
 
-    # Initial guess
-    x_0 = _initial_guess(T, ll, M, lowpath)
+    # Initial guess, unless a solution of a similar problem is given
+    warm_start = M == 0 and not np.isnan(x_0)
+    if not warm_start:
+        x_0 = _initial_guess(T, ll, M, lowpath)
 
     # Start Householder iterations from x_0 and find x, y
-    x = _householder(x_0, T, ll, M, rtol, numiter)
+    x, iterations = _householder(x_0, T, ll, M, rtol, numiter)
+    if np.isnan(x) and warm_start:
+        x_0 = _initial_guess(T, ll, M, lowpath)
+        x, cold_iterations = _householder(x_0, T, ll, M, rtol, numiter)
+        iterations += cold_iterations
+    if np.isnan(x):
+        return np.nan, np.nan, _LAMBERT_NOT_CONVERGED, iterations
     y = _compute_y(x, ll)
 
-    return x, y
+    return x, y, _LAMBERT_OK, iterations
 
 
 @jit
@@ -442,7 +746,8 @@ def _halley(p0, T0, ll, tol, maxiter):
     Notes
     -----
     This function is private because it assumes a calling convention specific to
-    this module and is not really reusable.
+    this module and is not really reusable. It returns NaN if the derivative
+    vanishes or the iterations do not converge.
 
     """
     for ii in range(maxiter):
@@ -450,7 +755,7 @@ def _halley(p0, T0, ll, tol, maxiter):
         fder = _tof_equation_p(p0, y, T0, ll)
         fder2 = _tof_equation_p2(p0, y, T0, fder, ll)
         if fder2 == 0:
-            raise RuntimeError("Derivative was zero")
+            return np.nan
         fder3 = _tof_equation_p3(p0, y, T0, fder, fder2, ll)
 
         # Halley step (cubic)
@@ -460,7 +765,7 @@ def _halley(p0, T0, ll, tol, maxiter):
             return p
         p0 = p
 
-    raise RuntimeError("Failed to converge")
+    return np.nan
 
 
 @jit
@@ -470,7 +775,8 @@ def _householder(p0, T0, ll, M, tol, maxiter):
     Notes
     -----
     This function is private because it assumes a calling convention specific to
-    this module and is not really reusable.
+    this module and is not really reusable. It returns the zero and the number
+    of iterations, and the zero is NaN if the iterations do not converge.
 
     """
     for ii in range(maxiter):
@@ -488,7 +794,7 @@ def _householder(p0, T0, ll, M, tol, maxiter):
         )
 
         if abs(p - p0) < tol:
-            return p
+            return p, ii + 1
         p0 = p
 
-    raise RuntimeError("Failed to converge")
+    return np.nan, maxiter
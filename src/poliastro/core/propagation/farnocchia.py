@@ -1,4 +1,6 @@
-from numba import njit as jit
+import sys
+
+from numba import njit as jit, prange
 import numpy as np
 
 from poliastro.core.angles import (
@@ -337,3 +339,37 @@ def farnocchia_rv(k, r0, v0, tof):
     nu = farnocchia_coe(k, p, ecc, inc, raan, argp, nu0, tof)
 
     return coe2rv(k, p, ecc, inc, raan, argp, nu)
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def farnocchia_rv_many(k, r0, v0, tofs):
+    """Parallel version of farnocchia_rv for many times of flight.
+
+    Parameters
+    ----------
+    k : float
+        Standar Gravitational parameter
+    r0 : numpy.ndarray
+        Initial position vector wrt attractor center.
+    v0 : numpy.ndarray
+        Initial velocity vector.
+    tofs : numpy.ndarray
+        Times of flight (s).
+
+    Returns
+    -------
+    rr, vv : tuple (numpy.ndarray)
+        Positions and velocities with shape (n, 3).
+
+    """
+    p, ecc, inc, raan, argp, nu0 = rv2coe(k, r0, v0)
+
+    n = tofs.shape[0]
+    rr = np.empty((n, 3))
+    vv = np.empty((n, 3))
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        nu = farnocchia_coe(k, p, ecc, inc, raan, argp, nu0, tofs[i])
+        rr[i], vv[i] = coe2rv(k, p, ecc, inc, raan, argp, nu)
+
+    return rr, vv
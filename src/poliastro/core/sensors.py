@@ -1,6 +1,10 @@
-from numba import njit as jit
+import sys
+
+from numba import njit as jit, prange
 import numpy as np
 
+from poliastro._math.linalg import norm
+
 
 @jit
 def min_and_max_ground_range(h, η_fov, η_center, R):
@@ -106,3 +110,82 @@ def ground_range_diff_at_azimuth(h, η_fov, η_center, β, φ_nadir, λ_nadir, R
     delta_λ = (Λ_max - Λ_min) / 2
 
     return delta_λ, φ_tgt, λ_tgt
+
+
+@jit
+def nadir_footprint_ground_range(h, η, R):
+    """Calculates the ground-range angle of the edge of the footprint of a nadir pointing sensor.
+
+    Parameters
+    ----------
+    h : float
+        Altitude over surface.
+    η : float
+        Half angle of the cone that the sensor can observe.
+    R : float
+        Attractor equatorial radius.
+
+    Returns
+    -------
+    Λ: float
+        Earth central angle between the nadir point and the edge of the footprint,
+        limited by the horizon of the satellite.
+
+    """
+    r_sat = R + h
+    if r_sat * np.sin(η) >= R:
+        return np.arccos(R / r_sat)
+
+    _, Λ_max = min_and_max_ground_range(h, 2 * η, 0.0, R)
+    return Λ_max
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def coverage_many(cells, cells_lat, rr, η, R):
+    """Determines which cells are inside the footprint of any nadir pointing sensor at every epoch.
+
+    Parameters
+    ----------
+    cells : numpy.ndarray
+        Unit position vectors of the cells in the body fixed frame, with shape (c, 3),
+        sorted by latitude.
+    cells_lat : numpy.ndarray
+        Geocentric latitudes of the cells in ascending order, with shape (c,).
+    rr : numpy.ndarray
+        Positions of the satellites in the body fixed frame, with shape (m, n, 3)
+        for n satellites at m epochs.
+    η : float
+        Half angle of the cone that the sensors can observe.
+    R : float
+        Attractor equatorial radius.
+
+    Returns
+    -------
+    covered : numpy.ndarray
+        Boolean array with shape (m, c).
+
+    Notes
+    -----
+    The attractor is assumed to be spherical. For every satellite,
+    only the cells inside the latitude band spanned by its footprint are tested.
+
+    """
+    m, n = rr.shape[0], rr.shape[1]
+    covered = np.zeros((m, cells.shape[0]), dtype=np.bool_)
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for j in prange(m):  # pylint: disable=not-an-iterable
+        for i in range(n):
+            r = norm(rr[j, i])
+            Λ = nadir_footprint_ground_range(r - R, η, R)
+            cos_Λ = np.cos(Λ)
+            u = rr[j, i] / r
+            lat = np.arcsin(u[2])
+
+            lo = np.searchsorted(cells_lat, lat - Λ)
+            hi = np.searchsorted(cells_lat, lat + Λ, side="right")
+            for k in range(lo, hi):
+                if not covered[j, k] and cells[k] @ u >= cos_Λ:
+                    covered[j, k] = True
+
+    return covered
@@ -1,6 +1,8 @@
 """Low level calculations for oblate spheroid locations."""
 
-from numba import njit as jit
+import sys
+
+from numba import njit as jit, prange
 import numpy as np
 
 from poliastro._math.linalg import norm
@@ -194,3 +196,164 @@ def cartesian_to_ellipsoidal(a, c, x, y, z):
     )
 
     return lon, lat, h
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def cartesian_cords_many(a, c, lon, lat, h):
+    """Parallel version of cartesian_cords.
+
+    Parameters
+    ----------
+    a : float
+        Semi-major axis
+    c : float
+        Semi-minor axis
+    lon : numpy.ndarray
+        Geodetic longitudes
+    lat : numpy.ndarray
+        Geodetic latitudes
+    h : numpy.ndarray
+        Geodetic heights
+
+    Returns
+    -------
+    cartesian_cords : numpy.ndarray
+        Cartesian coordinates, with shape (n, 3)
+
+    """
+    n = lon.shape[0]
+    cords = np.zeros((n, 3))
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        cords[i, 0], cords[i, 1], cords[i, 2] = cartesian_cords(
+            a, c, lon[i], lat[i], h[i]
+        )
+
+    return cords
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def N_many(a, b, c, cartesian_cords):
+    """Parallel version of N.
+
+    Parameters
+    ----------
+    a : float
+        Semi-major axis
+    b : float
+        Equatorial radius
+    c : float
+        Semi-minor axis
+    cartesian_cords : numpy.ndarray
+        Cartesian coordinates, with shape (n, 3)
+
+    """
+    n = cartesian_cords.shape[0]
+    NN = np.zeros((n, 3))
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        NN[i] = N(a, b, c, cartesian_cords[i])
+
+    return NN
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def distance_many(cartesian_cords, points):
+    """Calculates the distances from many points to many locations.
+
+    Parameters
+    ----------
+    cartesian_cords : numpy.ndarray
+        Cartesian coordinates of the locations, with shape (n, 3)
+    points : numpy.ndarray
+        Cartesian coordinates of the points, with shape (p, 3)
+
+    Returns
+    -------
+    d : numpy.ndarray
+        Distances, with shape (n, p)
+
+    """
+    n, p = cartesian_cords.shape[0], points.shape[0]
+    d = np.zeros((n, p))
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        for j in range(p):
+            d[i, j] = np.sqrt(
+                (cartesian_cords[i, 0] - points[j, 0]) ** 2
+                + (cartesian_cords[i, 1] - points[j, 1]) ** 2
+                + (cartesian_cords[i, 2] - points[j, 2]) ** 2
+            )
+
+    return d
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def is_visible_many(cartesian_cords, points, N):
+    """Determine whether objects located at many points are visible from many locations.
+
+    Parameters
+    ----------
+    cartesian_cords : numpy.ndarray
+        Cartesian coordinates of the locations, with shape (n, 3)
+    points : numpy.ndarray
+        Cartesian coordinates of the points, with shape (p, 3)
+    N : numpy.ndarray
+        Normal vectors of the ellipsoid at the locations, with shape (n, 3)
+
+    Returns
+    -------
+    visible : numpy.ndarray
+        Visibility of every point from every location, with shape (n, p)
+
+    """
+    n, p = cartesian_cords.shape[0], points.shape[0]
+    visible = np.zeros((n, p), dtype=np.bool_)
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        d = -(
+            N[i, 0] * cartesian_cords[i, 0]
+            + N[i, 1] * cartesian_cords[i, 1]
+            + N[i, 2] * cartesian_cords[i, 2]
+        )
+        for j in range(p):
+            visible[i, j] = (
+                N[i, 0] * points[j, 0]
+                + N[i, 1] * points[j, 1]
+                + N[i, 2] * points[j, 2]
+                + d
+            ) >= 0
+
+    return visible
+
+
+@jit(parallel=sys.maxsize > 2**31)
+def cartesian_to_ellipsoidal_many(a, c, x, y, z):
+    """Parallel version of cartesian_to_ellipsoidal.
+
+    Parameters
+    ----------
+    a : float
+        Semi-major axis
+    c : float
+        Semi-minor axis
+    x : numpy.ndarray
+        x coordinates
+    y : numpy.ndarray
+        y coordinates
+    z : numpy.ndarray
+        z coordinates
+
+    """
+    n = x.shape[0]
+    lon, lat, h = np.zeros(n), np.zeros(n), np.zeros(n)
+
+    # Disabling pylint warning, see https://github.com/PyCQA/pylint/issues/2910
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        lon[i], lat[i], h[i] = cartesian_to_ellipsoidal(a, c, x[i], y[i], z[i])
+
+    return lon, lat, h
@@ -0,0 +1,184 @@
+"""Coverage and revisit statistics of constellations over a grid of locations."""
+
+from astropy import units as u
+from astropy.table import QTable
+import numpy as np
+
+from poliastro.bodies import Earth
+from poliastro.core.sensors import coverage_many as coverage_many_fast
+from poliastro.ephem import states_on_grid
+from poliastro.spheroid_location import (
+    SpheroidLocation,
+    SpheroidLocationArray,
+)
+
+
+def _rotation_to_body_fixed(rr, theta_g):
+    cos_t, sin_t = np.cos(theta_g)[:, None], np.sin(theta_g)[:, None]
+    rr_fixed = np.empty_like(rr)
+    rr_fixed[..., 0] = cos_t * rr[..., 0] + sin_t * rr[..., 1]
+    rr_fixed[..., 1] = -sin_t * rr[..., 0] + cos_t * rr[..., 1]
+    rr_fixed[..., 2] = rr[..., 2]
+    return rr_fixed
+
+
+def compute_coverage(
+    attractor,
+    states,
+    locations,
+    half_angle,
+    epochs=None,
+    *,
+    sidereal_time=None,
+    chunk_size=1024,
+):
+    """Compute access intervals and revisit statistics of a constellation over a grid.
+
+    Every satellite carries a nadir pointing sensor with a conical field of view.
+    At every sampling epoch, the satellite positions are rotated to the body fixed
+    frame and the cells inside any footprint are found in parallel, testing only the
+    cells in the latitude band spanned by each footprint. Epochs are processed in
+    chunks so that memory stays bounded for long spans and dense grids.
+
+    Parameters
+    ----------
+    attractor : ~poliastro.bodies.Body
+        Central body, with respect to which the states are given.
+    states : ~poliastro.ephem.Ephem, list or tuple
+        Ephemerides of the satellites in a frame whose z axis is the rotation axis
+        of the attractor, or tuple of positions and velocities with shape (n, m, 3)
+        for n satellites sampled at m epochs.
+    locations : ~poliastro.spheroid_location.SpheroidLocationArray, ~poliastro.spheroid_location.SpheroidLocation or list
+        Cells of the grid, see :py:meth:`~poliastro.spheroid_location.SpheroidLocationArray.from_grid`.
+    half_angle : ~astropy.units.Quantity
+        Half angle of the cone that the sensors can observe.
+    epochs : ~astropy.time.Time, optional
+        Sampling epochs, required if the states are given as arrays.
+        If not given, the ones of the first ephemerides are used.
+    sidereal_time : ~astropy.units.Quantity, optional
+        Angle of the prime meridian of the attractor at the sampling epochs.
+        Computed as the Greenwich mean sidereal time for the Earth,
+        required for any other attractor.
+    chunk_size : int, optional
+        Number of epochs processed at once, defaults to 1024.
+
+    Returns
+    -------
+    statistics : ~astropy.table.QTable
+        Table with the ``lon`` and ``lat`` of every cell, the ``coverage`` as the
+        percentage of the sampling epochs with access, the number of ``accesses``
+        and the ``max_revisit_gap`` and ``mean_revisit_gap`` between them,
+        which are NaN for cells with less than two accesses.
+    intervals : ~astropy.table.QTable
+        Table with the ``cell`` index, ``start``, ``end`` and ``duration``
+        of every access interval, sorted by cell and epoch.
+        Intervals are resolved at the sampling epochs and clipped to them.
+
+    Notes
+    -----
+    The footprints are computed over a sphere with the equatorial radius of the
+    attractor, and the cells are projected radially onto it.
+
+    """
+    if isinstance(locations, SpheroidLocation):
+        locations = [locations]
+    if not isinstance(locations, SpheroidLocationArray):
+        locations = SpheroidLocationArray.from_locations(locations)
+
+    rr, _, epochs = states_on_grid(states, epochs)
+
+    if sidereal_time is None:
+        if attractor is not Earth:
+            raise ValueError(
+                "sidereal_time must be given for attractors other than the Earth"
+            )
+        sidereal_time = epochs.utc.sidereal_time("mean", "greenwich")
+    theta_g = sidereal_time.to_value(u.rad)
+
+    cells = locations.cartesian_cords.to_value(u.km)
+    cells /= np.linalg.norm(cells, axis=1)[:, None]
+    cells_lat = np.arcsin(cells[:, 2])
+    order = np.argsort(cells_lat)
+    cells, cells_lat = np.ascontiguousarray(cells[order]), cells_lat[order]
+
+    R = attractor.R.to_value(u.km)
+    eta = half_angle.to_value(u.rad)
+    m, c = len(epochs), len(locations)
+
+    # Edges of the access intervals, tracked across chunks
+    covered_count = np.zeros(c, dtype=int)
+    previous = np.zeros(c, dtype=bool)
+    rise_cell, rise_idx, fall_cell, fall_idx = [], [], [], []
+    for start in range(0, m, chunk_size):
+        stop = min(start + chunk_size, m)
+        rr_fixed = _rotation_to_body_fixed(
+            rr[:, start:stop].swapaxes(0, 1), theta_g[start:stop]
+        )
+        covered = coverage_many_fast(
+            cells, cells_lat, np.ascontiguousarray(rr_fixed), eta, R
+        )
+        covered_count += covered.sum(axis=0)
+
+        changes = np.diff(
+            np.vstack((previous, covered)).astype(np.int8), axis=0
+        )
+        ii, kk = np.nonzero(changes > 0)
+        rise_cell.append(kk)
+        rise_idx.append(start + ii)
+        ii, kk = np.nonzero(changes < 0)
+        fall_cell.append(kk)
+        fall_idx.append(start + ii - 1)
+        previous = covered[-1]
+
+    end_inside = np.flatnonzero(previous)
+    fall_cell.append(end_inside)
+    fall_idx.append(np.full(end_inside.size, m - 1))
+
+    rise_cell, rise_idx, fall_cell, fall_idx = (
+        np.concatenate(edges)
+        for edges in (rise_cell, rise_idx, fall_cell, fall_idx)
+    )
+    rise_order = np.lexsort((rise_idx, rise_cell))
+    fall_order = np.lexsort((fall_idx, fall_cell))
+    interval_cell = rise_cell[rise_order]
+    tt = (epochs - epochs[0]).to_value(u.s)
+    t_start, t_end = tt[rise_idx[rise_order]], tt[fall_idx[fall_order]]
+
+    # Revisit gaps between consecutive intervals of the same cell
+    accesses = np.bincount(interval_cell, minlength=c)
+    same_cell = interval_cell[1:] == interval_cell[:-1]
+    gap_cell = interval_cell[1:][same_cell]
+    gaps = (t_start[1:] - t_end[:-1])[same_cell]
+    max_gap = np.full(c, -np.inf)
+    np.maximum.at(max_gap, gap_cell, gaps)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_gap = np.bincount(gap_cell, gaps, minlength=c) / (accesses - 1)
+    max_gap[accesses < 2] = np.nan
+    mean_gap[accesses < 2] = np.nan
+
+    # Undo the sorting by latitude
+    cell_index = order[interval_cell]
+    unsorted = np.empty_like(order)
+    unsorted[order] = np.arange(c)
+    interval_order = np.lexsort((t_start, cell_index))
+
+    statistics = QTable(
+        {
+            "lon": locations.lon,
+            "lat": locations.lat,
+            "coverage": (covered_count / m * 100)[unsorted] * u.percent,
+            "accesses": accesses[unsorted],
+            "max_revisit_gap": max_gap[unsorted] * u.s,
+            "mean_revisit_gap": mean_gap[unsorted] * u.s,
+        }
+    )
+    intervals = QTable(
+        {
+            "cell": cell_index[interval_order],
+            "start": epochs[0] + t_start[interval_order] * u.s,
+            "end": epochs[0] + t_end[interval_order] * u.s,
+            "duration": (t_end - t_start)[interval_order] * u.s,
+        }
+    )
+
+    return statistics, intervals
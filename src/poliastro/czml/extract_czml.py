@@ -2,7 +2,7 @@ from datetime import timezone
 
 from astropy import units as u
 from astropy.coordinates import CartesianRepresentation
-from astropy.time import Time, TimeDelta
+from astropy.time import Time
 from czml3.core import Document, Packet, Preamble
 from czml3.enums import InterpolationAlgorithms, ReferenceFrames
 from czml3.properties import (
@@ -21,8 +21,9 @@ import numpy as np
 
 from poliastro.bodies import Earth
 from poliastro.core.czml_utils import (
-    project_point_on_ellipsoid as project_point_on_ellipsoid_fast,
+    project_point_on_ellipsoid_many as project_point_on_ellipsoid_many_fast,
 )
+from poliastro.twobody.propagation import FarnocchiaPropagator
 
 PIC_SATELLITE = (
     "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAAX"
@@ -43,6 +44,15 @@ PIC_GROUNDSTATION = (
 )
 
 
+def _rounding_factor(rtol):
+    """Get rounding factor given the relative tolerance."""
+    rf = 0
+    while rtol < 1:
+        rtol *= 10
+        rf += 1
+    return rf
+
+
 class CZMLExtractor:
     """A class for extracting orbitary data to Cesium."""
 
@@ -54,6 +64,7 @@ class CZMLExtractor:
         attractor=None,
         pr_map=None,
         scene3D=True,
+        stream=None,
     ):
         """Orbital constructor.
 
@@ -73,8 +84,13 @@ class CZMLExtractor:
         scene3D : bool
             Determines the scene mode. If set to true, the scene is set to 3D
             mode, otherwise it's the orthographic projection.
+        stream : file-like, optional
+            If given, packets are written to it as soon as they are added
+            instead of being kept in memory, and `close` must be called
+            to finish the document.
 
         """
+        self.stream = stream
         self.packets = []  # type: List[Packet]
         self.trajectories = []  # type: List[Any]
         self.attractor = attractor
@@ -111,8 +127,10 @@ class CZMLExtractor:
 
         self._change_custom_params(*self.cust_prop)
 
-    def _init_orbit_packet_cords_(self, i, rtol):
-        """Parameters
+    def _sample_orbit_(self, i, rtol):
+        """Samples the referenced orbit at all the epochs of its packet at once.
+
+        Parameters
         ----------
         i : int
             Index of referenced orbit
@@ -121,87 +139,75 @@ class CZMLExtractor:
 
         Returns
         -------
-        coordinate list
+        samples : numpy.ndarray
+            Array with the time since the epoch of the orbit and
+            the position of every sample, rounded given the tolerance
         """
-        cart_cords = []  # type: List[float]
-
-        h = (self.end_epoch - self.orbits[i][2]).to(u.s) / self.orbits[i][1]
-
-        # Get rounding factor given the relative tolerance
-        rf = 0
-        while rtol < 1:
-            rtol *= 10
-            rf += 1
-
-        for k in range(self.orbits[i][1] + 2):
-            # FIXME: Unused rtol with default propagation method,
-            # should we just get rid of it?
-            cords = (
-                self.orbits[i][0]
-                .propagate(TimeDelta(k * h))
-                .r.to_value(u.m)[..., None]
-            )
-
-            cords = np.insert(cords, 0, h.value * k, axis=0)
+        orbit, N, epoch = self.orbits[i]
+        h = (self.end_epoch - epoch).to(u.s) / N
 
-            # Flatten list
-            cart_cords += list(map(lambda x: round(x[0], rf), cords.tolist()))
+        # FIXME: Unused rtol with default propagation method,
+        # should we just get rid of it?
+        tofs = np.arange(N + 2) * h
+        rr, _ = FarnocchiaPropagator().propagate_many(orbit._state, tofs)
 
-        return cart_cords
+        return np.round(
+            np.column_stack((tofs.to_value(u.s), rr.to_value(u.m))),
+            _rounding_factor(rtol),
+        )
 
-    def _init_groundtrack_packet_cords_(self, i, rtol):
+    def _init_orbit_packet_cords_(self, samples):
         """Parameters
         ----------
-        i : int
-            Index of referenced orbit
-        rtol : float
-            Maximum relative error permitted
+        samples : numpy.ndarray
+            Samples of the referenced orbit, see `_sample_orbit_`
 
         Returns
         -------
         coordinate list
         """
-        cart_cords = []  # type: List[float]
-
-        h = (self.end_epoch - self.orbits[i][2]).to(u.s) / self.orbits[i][1]
+        return samples.ravel().tolist()
 
-        # Get rounding factor given the relative tolerance
-        rf = 0
-        while rtol < 1:
-            rtol *= 10
-            rf += 1
+    def _init_groundtrack_packet_cords_(self, samples):
+        """Parameters
+        ----------
+        samples : numpy.ndarray
+            Samples of the referenced orbit, see `_sample_orbit_`
 
+        Returns
+        -------
+        coordinate list
+        """
         ellipsoid = self.cust_prop[0]
 
-        for k in range(self.orbits[i][1] + 2):
-            # FIXME: Unused rtol with default propagation method,
-            # should we just get rid of it?
-            cords = (
-                self.orbits[i][0]
-                .propagate(TimeDelta(k * h))
-                .r.to_value(u.m)[..., None]
-            )
+        pr_rr = project_point_on_ellipsoid_many_fast(
+            np.ascontiguousarray(samples[:, 1:]), *ellipsoid
+        )
+        # Add a small number to ensure that our point lies above the surface of the
+        # ellipsoid. We do this because small losses in precision may cause the point
+        # to lie slightly below the surface. An iterative method could be used instead
+        # but the error margin is too small to be worth it.
 
-            cords = np.insert(cords, 0, h.value * k, axis=0)
+        return np.column_stack((samples[:, 0], pr_rr + 0.1)).ravel().tolist()
 
-            # Flatten list
-            cords = list(map(lambda x: round(x[0], rf), cords.tolist()))
-            t, p = cords[0], cords[1:]
-            pr_p = project_point_on_ellipsoid_fast(
-                p[0], p[1], p[2], ellipsoid[0], ellipsoid[1], ellipsoid[2]
-            )
-            # Add a small number to ensure that our point lies above the surface of the
-            # ellipsoid. We do this because small losses in precision may cause the point
-            # to lie slightly below the surface. An iterative method could be used instead
-            # but the error margin is too small to be worth it.
+    def _add_packet_(self, pckt):
+        """Keeps the packet in memory or writes it to the stream."""
+        if self._closed:
+            raise ValueError("The CZML document was already closed")
 
-            _cords = t, pr_p[0] + 0.1, pr_p[1] + 0.1, pr_p[2] + 0.1
-            cart_cords += _cords
+        if self.stream is None:
+            self.packets.append(pckt)
+            return
 
-        return cart_cords
+        self.stream.write(", " if self._n_written else "[")
+        pckt.dump(self.stream)
+        self._n_written += 1
 
     def _init_czml_(self):
         """Only called at the initialization of the extractor Builds packets."""
+        self._n_written = 0
+        self._closed = False
+
         pckt = Preamble(
             name="document_packet",
             clock=IntervalValue(
@@ -215,7 +221,7 @@ class CZMLExtractor:
                 ),
             ),
         )
-        self.packets.append(pckt)
+        self._add_packet_(pckt)
 
     def _change_custom_params(self, ellipsoid, pr_map, scene3D):
         """Change the custom properties package.
@@ -247,7 +253,7 @@ class CZMLExtractor:
 
         pckt = Packet(id="custom_properties", properties=custom_props)
 
-        self.packets.append(pckt)
+        self._add_packet_(pckt)
 
     def add_ground_station(
         self,
@@ -326,7 +332,7 @@ class CZMLExtractor:
             billboard=Billboard(image=PIC_GROUNDSTATION, show=True),
         )
 
-        self.packets.append(pckt)
+        self._add_packet_(pckt)
         self.gs_n += 1
 
     def add_orbit(
@@ -408,7 +414,9 @@ class CZMLExtractor:
             )
 
         self.orbits.append([orbit, N, orbit.epoch])
-        cartesian_cords = self._init_orbit_packet_cords_(self.i, rtol=rtol)
+        # The orbit is propagated once for both the path and the groundtrack
+        samples = self._sample_orbit_(self.i, rtol=rtol)
+        cartesian_cords = self._init_orbit_packet_cords_(samples)
 
         start_epoch = Time(
             min(self.orbits[self.i][2], self.start_epoch), format="isot"
@@ -461,14 +469,12 @@ class CZMLExtractor:
             billboard=Billboard(image=PIC_SATELLITE, show=True),
         )
 
-        self.packets.append(pckt)
+        self._add_packet_(pckt)
 
         if groundtrack_show:
             groundtrack_color = path_color
 
-            groundtrack_cords = self._init_groundtrack_packet_cords_(
-                self.i, rtol=rtol
-            )
+            groundtrack_cords = self._init_groundtrack_packet_cords_(samples)
             pckt = Packet(
                 id="groundtrack" + str(self.i),
                 availability=TimeInterval(
@@ -505,7 +511,7 @@ class CZMLExtractor:
                     else 100,
                 ),
             )
-            self.packets.append(pckt)
+            self._add_packet_(pckt)
 
         self.i += 1
 
@@ -528,6 +534,7 @@ class CZMLExtractor:
         label_font=None,
         label_text=None,
         label_show=None,
+        rtol=1e-1,
     ):
         """Adds trajectory.
 
@@ -568,8 +575,16 @@ class CZMLExtractor:
             Set label text
         label_show : bool
             Indicates whether the label is visible
+        rtol : float
+            Maximum relative error permitted, which sets the number
+            of decimals of the positions in meters
 
         """
+        if rtol <= 0 or rtol >= 1:
+            raise ValueError(
+                "The relative tolerance must be a value in the range (0, 1)"
+            )
+
         positions = (
             positions.represent_as(CartesianRepresentation)
             .get_xyz(1)
@@ -581,16 +596,15 @@ class CZMLExtractor:
         if len(epochs) != len(positions):
             raise ValueError("Number of Points and Epochs must be equal.")
 
-        epochs = np.fromiter(
-            map(lambda epoch: (epoch - epochs[0]).to_value(u.s), epochs),
-            dtype=float,
-        )
+        epochs = (epochs - epochs[0]).to_value(u.s)
 
         positions = np.around(
-            np.concatenate([epochs[..., None], positions], axis=1).ravel(), 1
+            np.concatenate([epochs[..., None], positions], axis=1).ravel(),
+            _rounding_factor(rtol),
         ).tolist()
 
-        self.trajectories.append([positions, None, label_text, path_color])
+        if self.stream is None:
+            self.trajectories.append([positions, None, label_text, path_color])
 
         start_epoch = Time(self.start_epoch, format="isot")
 
@@ -641,7 +655,7 @@ class CZMLExtractor:
             billboard=Billboard(image=PIC_SATELLITE, show=True),
         )
 
-        self.packets.append(pckt)
+        self._add_packet_(pckt)
 
         if groundtrack_show:
             raise NotImplementedError(
@@ -652,4 +666,26 @@ class CZMLExtractor:
 
     def get_document(self):
         """Retrieves CZML document."""
+        if self.stream is not None:
+            raise ValueError(
+                "Packets are not kept in memory when writing to a stream"
+            )
         return Document(self.packets)
+
+    def close(self):
+        """Finishes the CZML document written to the stream.
+
+        The stream itself is not closed.
+
+        """
+        if self.stream is None or self._closed:
+            return
+
+        self.stream.write("]")
+        self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,5 +1,8 @@
 """Plotting routines focused on Earth capabilities."""
 
-from poliastro.earth.plotting.groundtrack import GroundtrackPlotter
+from poliastro.earth.plotting.groundtrack import (
+    GroundtrackPlotter,
+    compute_groundtracks,
+)
 
-__all__ = ["GroundtrackPlotter"]
+__all__ = ["GroundtrackPlotter", "compute_groundtracks"]
@@ -2,19 +2,111 @@
 
 from astropy import units as u
 from astropy.coordinates import (
-    GCRS,
     ITRS,
     CartesianDifferential,
     CartesianRepresentation,
     SphericalRepresentation,
 )
+from astropy.table import QTable
+import numpy as np
 import plotly.graph_objects as go
 
+from poliastro._math.geometry import douglas_peucker
 from poliastro.bodies import Earth
+from poliastro.earth import EarthSatellite
 from poliastro.earth.plotting.utils import EARTH_PALETTE
+from poliastro.ephem import Ephem
+from poliastro.frames.rotation import ITRSRotationCache
 from poliastro.twobody.sampling import EpochsArray
 
 
+def compute_groundtracks(states, epochs=None, *, tolerance=None):
+    """Computes the groundtracks of many Earth satellites at once.
+
+    Positions are rotated to ITRS in bulk with a cached rotation,
+    and every groundtrack is split into segments at the antimeridian.
+
+    Parameters
+    ----------
+    states : list or ~astropy.units.Quantity
+        List of ~poliastro.earth.EarthSatellite, ~poliastro.twobody.Orbit or
+        ~poliastro.ephem.Ephem, or GCRS positions with shape (n, m, 3)
+        for n satellites sampled at m epochs.
+    epochs : ~astropy.time.Time, optional
+        Sampling epochs, required unless the states are ephemerides,
+        in which case the ones of the first ephemerides are used.
+    tolerance : ~astropy.units.Quantity, optional
+        If given, every segment is decimated with the Douglas-Peucker algorithm
+        so that the removed samples lie closer than this angle to the simplified
+        track in the longitude-latitude plane.
+
+    Returns
+    -------
+    groundtracks : ~astropy.table.QTable
+        Table with the ``satellite`` and ``segment`` indices, and the ``epoch``,
+        geocentric ``lon`` and ``lat`` of the kept samples, sorted by satellite
+        and epoch.
+
+    """
+    if isinstance(states, u.Quantity):
+        if epochs is None:
+            raise ValueError("epochs must be given if states are arrays")
+        rr = states.to_value(u.km)
+    else:
+        if not isinstance(states, (list, tuple)):
+            states = [states]
+        if epochs is None:
+            if not isinstance(states[0], Ephem):
+                raise ValueError(
+                    "epochs must be given if states are not ephemerides"
+                )
+            epochs = states[0].epochs
+
+        ephems = []
+        for state in states:
+            if isinstance(state, EarthSatellite):
+                state = state.orbit
+            if not isinstance(state, Ephem):
+                state = state.to_ephem(EpochsArray(epochs))
+            ephems.append(state)
+        rr = np.stack([ephem.rv(epochs)[0].to_value(u.km) for ephem in ephems])
+
+    RR = ITRSRotationCache.from_epochs(epochs).matrices(epochs)
+    rr_itrs = np.einsum("mij,nmj->nmi", RR, rr)
+    lon = np.rad2deg(np.arctan2(rr_itrs[..., 1], rr_itrs[..., 0]))
+    lat = np.rad2deg(
+        np.arcsin(rr_itrs[..., 2] / np.linalg.norm(rr_itrs, axis=-1))
+    )
+
+    # Segments start after every jump across the antimeridian
+    segment = np.zeros(lon.shape, dtype=int)
+    segment[:, 1:] = np.cumsum(np.abs(np.diff(lon, axis=1)) > 180, axis=1)
+
+    keep = np.ones(lon.shape, dtype=bool)
+    if tolerance is not None:
+        tol = tolerance.to_value(u.deg)
+        for sat in range(lon.shape[0]):
+            bounds = np.flatnonzero(np.diff(segment[sat])) + 1
+            for first, last in zip(
+                np.concatenate(([0], bounds)),
+                np.concatenate((bounds, [lon.shape[1]])),
+            ):
+                keep[sat, first:last] = douglas_peucker(
+                    lon[sat, first:last], lat[sat, first:last], tol
+                )
+
+    sat, ii = np.nonzero(keep)
+    return QTable(
+        {
+            "satellite": sat,
+            "segment": segment[sat, ii],
+            "epoch": epochs[ii],
+            "lon": lon[sat, ii] * u.deg,
+            "lat": lat[sat, ii] * u.deg,
+        }
+    )
+
+
 class GroundtrackPlotter:
     """Generates two-dimensional ground-track."""
 
@@ -77,6 +169,54 @@ class GroundtrackPlotter:
         """Adds trace to custom figure."""
         self.fig.add_trace(trace)
 
+    def plot_groundtracks(
+        self, groundtracks, labels=None, colors=None, line_style=None
+    ):
+        """Plots groundtracks computed with `compute_groundtracks`.
+
+        Every satellite is drawn as a single trace, broken at the antimeridian.
+
+        Parameters
+        ----------
+        groundtracks : ~astropy.table.QTable
+            Groundtracks of the satellites.
+        labels : list, optional
+            Labels of the satellites.
+        colors : list, optional
+            Colors of the satellites.
+        line_style : dict, optional
+            Dictionary for customizing the groundtrack line traces
+
+        Returns
+        -------
+        fig: ~plotly.graph_objects.Figure
+            Output figure
+
+        """
+        sat = np.asarray(groundtracks["satellite"])
+        segment = np.asarray(groundtracks["segment"])
+        lon = groundtracks["lon"].to_value(u.deg)
+        lat = groundtracks["lat"].to_value(u.deg)
+
+        for index in np.unique(sat):
+            mask = sat == index
+            breaks = np.flatnonzero(np.diff(segment[mask])) + 1
+            style = dict(line_style or {})
+            if colors is not None:
+                style.setdefault("color", colors[index])
+
+            self.add_trace(
+                go.Scattergeo(
+                    lat=np.insert(lat[mask], breaks, np.nan),
+                    lon=np.insert(lon[mask], breaks, np.nan),
+                    mode="lines",
+                    name=labels[index] if labels is not None else None,
+                    line=style,
+                )
+            )
+
+        return self.fig
+
     def _get_raw_coords(self, orb, t_deltas):
         """Generates raw orbit coordinates for given epochs.
 
@@ -122,13 +262,16 @@ class GroundtrackPlotter:
             A collection of coordinates in ITRS frame
 
         """
-        # Build GCRS and ITRS coordinates
-        gcrs_xyz = GCRS(
-            raw_xyz,
+        # Rotate the positions with the cached GCRS to ITRS rotation
+        if isinstance(raw_xyz, CartesianRepresentation):
+            raw_xyz = raw_xyz.xyz.T
+        rotation = ITRSRotationCache.from_epochs(raw_obstime)
+        itrs_xyz = ITRS(
+            CartesianRepresentation(
+                rotation.rotate(raw_xyz, raw_obstime), xyz_axis=-1
+            ),
             obstime=raw_obstime,
-            representation_type=CartesianRepresentation,
         )
-        itrs_xyz = gcrs_xyz.transform_to(ITRS(obstime=raw_obstime))
 
         return itrs_xyz
 
@@ -1,3 +1,8 @@
+from collections import OrderedDict
+import hashlib
+import json
+import os
+from pathlib import Path
 from warnings import warn
 
 from astropy import units as u
@@ -7,18 +12,186 @@ from astropy.coordinates import (
     CartesianDifferential,
     CartesianRepresentation,
     get_body_barycentric_posvel,
+    solar_system_ephemeris,
 )
+from astropy.time import Time
 from astroquery.jplhorizons import Horizons
-
-from poliastro._math.interpolate import interp1d, sinc_interp, spline_interp
+import numpy as np
+
+from poliastro._math.interpolate import (
+    chebyshev_segments_eval,
+    chebyshev_segments_fit,
+    hermite_segments,
+    interp1d,
+    lagrange_interp_many,
+    sinc_interp,
+)
 from poliastro.bodies import Earth
 from poliastro.frames import Planes
+from poliastro.frames.affine import icrs_to_attractor_states
 from poliastro.frames.util import get_frame
+from poliastro.query_cache import cached_query, get_query_cache
 from poliastro.twobody.sampling import EpochsArray
 from poliastro.warnings import TimeScaleWarning
 
 EPHEM_FORMAT = "Ephemerides at {num} epochs from {start} ({start_scale}) to {end} ({end_scale})"
 
+# Binary layout of saved ephemerides: magic bytes, length of the JSON header,
+# header padded to a multiple of 64 bytes and rows of float64 values
+# (seconds since the reference epoch, x, y, z in km and vx, vy, vz in km/s)
+_EPHEM_FILE_MAGIC = b"POLEPH\x00\x01"
+_EPHEM_FILE_COLUMNS = 7
+_EPHEM_FILE_CHUNK = 2**20
+
+
+class BodyEphemerisCache:
+    """Content addressed cache of states of Solar System bodies.
+
+    States are keyed by the body, the frame in which they are expressed,
+    the Solar System ephemeris in use and the epochs at which they were computed,
+    so that any repeated request for the same body, frame and grid of epochs skips
+    the evaluation of the ephemeris and the frame transformation. The most recently
+    used entries are kept in memory, and they can optionally be stored on disk as
+    ``.npz`` files so that they are shared between sessions.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of entries kept in memory, defaults to 64.
+    directory : str or ~pathlib.Path, optional
+        Directory of the on disk store, if not given entries are only kept in memory.
+
+    """
+
+    def __init__(self, maxsize=64, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries or (
+            self.directory is not None and self._path(key).exists()
+        )
+
+    @staticmethod
+    def key(body, frame, epochs):
+        """Key of the states of a body, sampled at certain epochs.
+
+        Parameters
+        ----------
+        body : str
+            Name of the body.
+        frame : str
+            Description of the frame in which the states are expressed.
+        epochs : ~astropy.time.Time
+            Epochs of the states.
+
+        """
+        epochs = epochs.tdb
+        digest = hashlib.sha256()
+        for part in (body.lower(), frame, str(solar_system_ephemeris.get())):
+            digest.update(part.encode())
+            digest.update(b"\x00")
+        digest.update(str(epochs.shape).encode())
+        digest.update(np.ascontiguousarray(epochs.jd1, dtype=float).tobytes())
+        digest.update(np.ascontiguousarray(epochs.jd2, dtype=float).tobytes())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return Path(self.directory) / f"{key}.npz"
+
+    def _store(self, key, rr, vv):
+        self._entries[key] = rr, vv
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key, compute):
+        """Returns the states of an entry, computing them if they are not cached.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry, see :py:meth:`key`.
+        compute : callable
+            Function without arguments returning the positions in km and
+            velocities in km / s of the entry as arrays.
+
+        Returns
+        -------
+        rr, vv : numpy.ndarray
+            Read only positions in km and velocities in km / s.
+
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        path = None if self.directory is None else self._path(key)
+        if path is not None and path.exists():
+            with np.load(path) as data:
+                rr, vv = data["rr"], data["vv"]
+        else:
+            rr, vv = (np.array(x, dtype=float) for x in compute())
+            if path is not None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file first, so that concurrent
+                # readers never see a partially written entry
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "wb") as fh:
+                    np.savez(fh, rr=rr, vv=vv)
+                os.replace(tmp_path, path)
+
+        rr.flags.writeable = vv.flags.writeable = False
+        self._store(key, rr, vv)
+        return rr, vv
+
+    def clear(self):
+        """Removes all the entries kept in memory, the on disk store is kept."""
+        self._entries.clear()
+
+
+body_ephemeris_cache = BodyEphemerisCache()
+
+
+def body_barycentric_posvel(body, epochs):
+    """Position and velocity of a body w.r.t. the Solar System Barycenter.
+
+    Equivalent to :py:func:`~astropy.coordinates.get_body_barycentric_posvel`,
+    but the results are kept in :py:data:`body_ephemeris_cache`.
+
+    Parameters
+    ----------
+    body : ~poliastro.bodies.SolarSystemPlanet
+        Body.
+    epochs : ~astropy.time.Time
+        Epochs to sample the body states.
+
+    Returns
+    -------
+    r, v : ~astropy.coordinates.CartesianRepresentation
+        Position and velocity in the ICRS frame.
+
+    """
+    key = BodyEphemerisCache.key(body.name, "icrs", epochs)
+
+    def compute():
+        r, v = get_body_barycentric_posvel(body.name, epochs)
+        return (
+            r.xyz.to_value(u.km).reshape(3, -1).T,
+            v.xyz.to_value(u.km / u.s).reshape(3, -1).T,
+        )
+
+    rr, vv = body_ephemeris_cache.get(key, compute)
+    shape = (3,) + epochs.shape
+    return (
+        CartesianRepresentation(rr.T.reshape(shape) * u.km),
+        CartesianRepresentation(vv.T.reshape(shape) * (u.km / u.s)),
+    )
+
 
 def build_ephem_interpolant(body, epochs, attractor=Earth):
     """Interpolates ephemerides data.
@@ -49,11 +222,52 @@ def build_ephem_interpolant(body, epochs, attractor=Earth):
 
 
 class BaseInterpolator:
+    """Base class of the interpolators of ephemerides.
+
+    Interpolators that compare equal are considered to have the same configuration,
+    so that ephemerides can reuse the interpolants built by any of them.
+    Local interpolators only depend on the samples around every epoch,
+    so file backed ephemerides only read a window of samples for them.
+
+    """
+
+    local = True
+
+    def build(self, reference_epochs, coordinates):
+        """Builds an interpolant for the given samples.
+
+        Parameters
+        ----------
+        reference_epochs : ~astropy.time.Time
+            Epochs of the samples.
+        coordinates : ~astropy.coordinates.CartesianRepresentation
+            Sampled coordinates with velocities.
+
+        Returns
+        -------
+        interpolant : callable
+            Function that receives epochs and returns the interpolated coordinates.
+
+        """
+
+        def interpolant(epochs):
+            return self.interpolate(epochs, reference_epochs, coordinates)
+
+        return interpolant
+
     def interpolate(self, epochs, reference_epochs, coordinates):
         raise NotImplementedError
 
 
-class SincInterpolator:
+class SincInterpolator(BaseInterpolator):
+    local = False
+
+    def __eq__(self, other):
+        return type(other) is type(self)
+
+    def __hash__(self):
+        return hash(type(self))
+
     def interpolate(self, epochs, reference_epochs, coordinates):
         def _interp_1d(arr):
             return sinc_interp(arr, reference_epochs.jd, epochs.jd)
@@ -80,37 +294,255 @@ class SincInterpolator:
         )
 
 
-class SplineInterpolator:
+class SplineInterpolator(BaseInterpolator):
     def __init__(self, kind="cubic"):
         self._kind = kind
 
-    def interpolate(self, epochs, reference_epochs, coordinates):
+    def __eq__(self, other):
+        return type(other) is type(self) and other._kind == self._kind
+
+    def __hash__(self):
+        return hash((type(self), self._kind))
+
+    def build(self, reference_epochs, coordinates):
         xyz_unit = coordinates.xyz.unit
         d_xyz_unit = coordinates.differentials["s"].d_xyz.unit
 
-        result_xyz = (
-            spline_interp(
-                coordinates.xyz.value,
-                reference_epochs.jd,
-                epochs.jd,
-                kind=self._kind,
+        # Positions and velocities share a single spline
+        spline = interp1d(
+            reference_epochs.jd,
+            np.vstack(
+                (
+                    coordinates.xyz.value,
+                    coordinates.differentials["s"].d_xyz.value,
+                )
+            ),
+            kind=self._kind,
+        )
+
+        def interpolant(epochs):
+            result = spline(epochs.jd)
+            return CartesianRepresentation(
+                result[:3] << xyz_unit,
+                differentials=CartesianDifferential(result[3:] << d_xyz_unit),
             )
-            << xyz_unit
+
+        return interpolant
+
+    def interpolate(self, epochs, reference_epochs, coordinates):
+        return self.build(reference_epochs, coordinates)(epochs)
+
+
+def _samples_to_arrays(reference_epochs, coordinates):
+    t = (reference_epochs - reference_epochs[0]).to_value(u.s)
+    xyz_unit = coordinates.xyz.unit
+    d_xyz = coordinates.differentials["s"].d_xyz.to_value(xyz_unit / u.s)
+    return t, np.ascontiguousarray(coordinates.xyz.value.T), d_xyz.T, xyz_unit
+
+
+def _check_interpolation_range(t, reference_t):
+    if np.any(t < reference_t[0]) or np.any(t > reference_t[-1]):
+        raise ValueError(
+            "Epochs must lie inside the span of the sampled epochs"
+        )
+
+
+class HermiteInterpolator(BaseInterpolator):
+    """Interpolates positions with cubic Hermite polynomials using the sampled velocities.
+
+    Velocities are computed as the derivatives of the interpolated positions,
+    and every epoch only involves the two samples around it.
+
+    """
+
+    def __eq__(self, other):
+        return type(other) is type(self)
+
+    def __hash__(self):
+        return hash(type(self))
+
+    def build(self, reference_epochs, coordinates):
+        t_ref, rr, vv, xyz_unit = _samples_to_arrays(
+            reference_epochs, coordinates
         )
-        result_d_xyz = (
-            spline_interp(
-                coordinates.differentials["s"].d_xyz.value,
-                reference_epochs.jd,
-                epochs.jd,
-                kind=self._kind,
+        d_xyz_unit = coordinates.differentials["s"].d_xyz.unit
+
+        def interpolant(epochs):
+            t = (epochs - reference_epochs[0]).to_value(u.s)
+            _check_interpolation_range(t, t_ref)
+
+            ii = np.clip(
+                np.searchsorted(t_ref, t, side="right") - 1, 0, len(t_ref) - 2
+            )
+            result = hermite_segments(
+                t,
+                t_ref[ii],
+                t_ref[ii + 1],
+                rr[ii],
+                vv[ii],
+                rr[ii + 1],
+                vv[ii + 1],
             )
-            << d_xyz_unit
+            return CartesianRepresentation(
+                result[:, :3] << xyz_unit,
+                xyz_axis=1,
+                differentials=CartesianDifferential(
+                    (result[:, 3:] << (xyz_unit / u.s)).to(d_xyz_unit),
+                    xyz_axis=1,
+                ),
+            )
+
+        return interpolant
+
+    def interpolate(self, epochs, reference_epochs, coordinates):
+        return self.build(reference_epochs, coordinates)(epochs)
+
+
+class LagrangeInterpolator(BaseInterpolator):
+    """Interpolates positions and velocities with Lagrange polynomials
+    over a sliding window of samples around every epoch.
+
+    Parameters
+    ----------
+    order : int, optional
+        Order of the polynomials, the window has order + 1 samples. Default to 8.
+
+    """
+
+    def __init__(self, order=8):
+        self._order = order
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other._order == self._order
+
+    def __hash__(self):
+        return hash((type(self), self._order))
+
+    def build(self, reference_epochs, coordinates):
+        if len(reference_epochs) <= self._order:
+            raise ValueError(
+                f"At least {self._order + 1} samples are needed "
+                f"for interpolation of order {self._order}"
+            )
+
+        t_ref, rr, vv, xyz_unit = _samples_to_arrays(
+            reference_epochs, coordinates
         )
+        rv = np.ascontiguousarray(np.hstack((rr, vv)))
+        d_xyz_unit = coordinates.differentials["s"].d_xyz.unit
 
-        return CartesianRepresentation(
-            result_xyz, differentials=CartesianDifferential(result_d_xyz)
+        def interpolant(epochs):
+            t = (epochs - reference_epochs[0]).to_value(u.s)
+            _check_interpolation_range(t, t_ref)
+
+            result = lagrange_interp_many(
+                rv, t_ref, np.asarray(t, dtype=float), self._order
+            )
+            return CartesianRepresentation(
+                result[:, :3] << xyz_unit,
+                xyz_axis=1,
+                differentials=CartesianDifferential(
+                    (result[:, 3:] << (xyz_unit / u.s)).to(d_xyz_unit),
+                    xyz_axis=1,
+                ),
+            )
+
+        return interpolant
+
+    def interpolate(self, epochs, reference_epochs, coordinates):
+        return self.build(reference_epochs, coordinates)(epochs)
+
+
+def _horizons_query_params(name, epochs, attractor, plane, id_type):
+    refplanes_dict = {
+        Planes.EARTH_EQUATOR: "earth",
+        Planes.EARTH_ECLIPTIC: "ecliptic",
+    }
+    refplane = refplanes_dict[plane]
+
+    if attractor is not None:
+        bodies_dict = {
+            "sun": 10,
+            "mercury": 199,
+            "venus": 299,
+            "earth": 399,
+            "mars": 499,
+            "jupiter": 599,
+            "saturn": 699,
+            "uranus": 799,
+            "neptune": 899,
+        }
+        location = f"500@{bodies_dict[attractor.name.lower()]}"
+    else:
+        location = "@ssb"
+
+    return {
+        "id": name,
+        "location": location,
+        "epochs": epochs.jd,
+        "id_type": id_type,
+        "refplane": refplane,
+    }
+
+
+def _fetch_horizons_vectors(id, location, epochs, id_type, refplane):
+    return Horizons(
+        id=id, location=location, epochs=epochs, id_type=id_type
+    ).vectors(refplane=refplane)
+
+
+def prefetch_horizons(
+    names,
+    epochs,
+    *,
+    attractor=None,
+    plane=Planes.EARTH_EQUATOR,
+    id_type=None,
+    max_workers=8,
+):
+    """Queries JPL Horizons for several objects concurrently and caches the responses.
+
+    Subsequent calls to :py:meth:`Ephem.from_horizons` with the same arguments
+    are then answered from the active query cache, without network access.
+
+    Parameters
+    ----------
+    names : list
+        Names of the bodies to query for.
+    epochs : ~astropy.time.Time
+        Epochs to sample the body positions.
+    attractor : ~poliastro.bodies.SolarSystemPlanet, optional
+        Body to use as central location,
+        if not given the Solar System Barycenter will be used.
+    plane : ~poliastro.frames.Planes, optional
+        Fundamental plane of the frame, default to Earth Equator.
+    id_type : NoneType or str, optional
+        Use "smallbody" for Asteroids and Comets and None (default) to first
+        search for Planets and Satellites.
+    max_workers : int, optional
+        Maximum number of concurrent queries, defaults to 8.
+
+    """
+    cache = get_query_cache()
+    if cache is None:
+        raise ValueError(
+            "A query cache must be set to prefetch queries, "
+            "see poliastro.query_cache.set_query_cache"
         )
 
+    if epochs.isscalar:
+        epochs = epochs.reshape(1)
+
+    cache.prefetch(
+        "horizons",
+        [
+            _horizons_query_params(name, epochs, attractor, plane, id_type)
+            for name in names
+        ],
+        _fetch_horizons_vectors,
+        max_workers=max_workers,
+    )
+
 
 def _get_destination_frame(attractor, plane, epochs):
     if attractor is not None:
@@ -149,13 +581,28 @@ class Ephem:
         self._coordinates = coordinates
         self._plane = Planes(plane)
 
+        # Offsets from a reference epoch, only kept for file backed ephemerides
+        self._epoch0 = None
+        self._tt = None
+
+        self._interpolants = {}
+
+    # Samples read around the requested epochs by file backed ephemerides
+    _WINDOW_MARGIN = 8
+
     def __str__(self):
+        if self._tt is not None:
+            start = self._epoch0 + self._tt[0] * u.s
+            end = self._epoch0 + self._tt[-1] * u.s
+        else:
+            start, end = self.epochs[0], self.epochs[-1]
+
         return EPHEM_FORMAT.format(
-            num=len(self.epochs),
-            start=self.epochs[0],
-            start_scale=self.epochs[0].scale.upper(),
-            end=self.epochs[-1],
-            end_scale=self.epochs[-1].scale.upper(),
+            num=len(self._coordinates),
+            start=start,
+            start_scale=start.scale.upper(),
+            end=end,
+            end_scale=end.scale.upper(),
         )
 
     def __repr__(self):
@@ -164,6 +611,8 @@ class Ephem:
     @property
     def epochs(self):
         """Epochs at which the ephemerides was originally sampled."""
+        if self._epochs is None:
+            self._epochs = self._epoch0 + self._tt * u.s
         return self._epochs
 
     @property
@@ -189,6 +638,11 @@ class Ephem:
         plane : ~poliastro.frames.Planes, optional
             Fundamental plane of the frame, default to Earth Equator.
 
+        Notes
+        -----
+        The states are kept in :py:data:`body_ephemeris_cache`,
+        so that requesting them again for the same epochs is almost free.
+
         """
         if epochs.isscalar:
             epochs = epochs.reshape(1)
@@ -202,19 +656,51 @@ class Ephem:
                 stacklevel=2,
             )
 
-        r, v = get_body_barycentric_posvel(body.name, epochs)
-        coordinates = r.with_differentials(
-            v.represent_as(CartesianDifferential)
-        )
-
         destination_frame = _get_destination_frame(attractor, plane, epochs)
-
-        if destination_frame is not None:
-            coordinates = (
-                ICRS(coordinates)
+        if destination_frame is None:
+            r, v = body_barycentric_posvel(body, epochs)
+            coordinates = r.with_differentials(
+                v.represent_as(CartesianDifferential)
+            )
+            return cls(coordinates, epochs, plane)
+
+        def compute():
+            r, v = body_barycentric_posvel(body, epochs)
+            try:
+                return icrs_to_attractor_states(
+                    r.xyz.to_value(u.km).T,
+                    v.xyz.to_value(u.km / u.s).T,
+                    epochs,
+                    attractor,
+                    plane,
+                )
+            except NotImplementedError:
+                pass
+
+            transformed = (
+                ICRS(
+                    r.with_differentials(v.represent_as(CartesianDifferential))
+                )
                 .transform_to(destination_frame)
                 .represent_as(CartesianRepresentation, CartesianDifferential)
             )
+            return (
+                transformed.xyz.to_value(u.km).T,
+                transformed.differentials["s"].d_xyz.to_value(u.km / u.s).T,
+            )
+
+        frame = (
+            f"{'ssb' if attractor is None else attractor.name.lower()}"
+            f"/{Planes(plane).name.lower()}"
+        )
+        rr, vv = body_ephemeris_cache.get(
+            BodyEphemerisCache.key(body.name, frame, epochs), compute
+        )
+        coordinates = CartesianRepresentation(
+            rr * u.km,
+            xyz_axis=1,
+            differentials=CartesianDifferential(vv * (u.km / u.s), xyz_axis=1),
+        )
 
         return cls(coordinates, epochs, plane)
 
@@ -245,35 +731,20 @@ class Ephem:
             Use "smallbody" for Asteroids and Comets and None (default) to first
             search for Planets and Satellites.
 
+        Notes
+        -----
+        The query goes through the active query cache, see
+        :py:mod:`poliastro.query_cache` and :py:func:`prefetch_horizons`.
+
         """
         if epochs.isscalar:
             epochs = epochs.reshape(1)
 
-        refplanes_dict = {
-            Planes.EARTH_EQUATOR: "earth",
-            Planes.EARTH_ECLIPTIC: "ecliptic",
-        }
-        refplane = refplanes_dict[plane]
-
-        if attractor is not None:
-            bodies_dict = {
-                "sun": 10,
-                "mercury": 199,
-                "venus": 299,
-                "earth": 399,
-                "mars": 499,
-                "jupiter": 599,
-                "saturn": 699,
-                "uranus": 799,
-                "neptune": 899,
-            }
-            location = f"500@{bodies_dict[attractor.name.lower()]}"
-        else:
-            location = "@ssb"
-
-        obj = Horizons(
-            id=name, location=location, epochs=epochs.jd, id_type=id_type
-        ).vectors(refplane=refplane)
+        obj = cached_query(
+            "horizons",
+            _horizons_query_params(name, epochs, attractor, plane, id_type),
+            _fetch_horizons_vectors,
+        )
 
         x = obj["x"]
         y = obj["y"]
@@ -321,7 +792,9 @@ class Ephem:
             if not given the original one from the object will be used.
         interpolator : ~poliastro.ephem.BaseInterpolator, optional
             Interpolation method to use for epochs outside of the original ones,
-            default to splines.
+            default to splines. The interpolant is built once per interpolator
+            configuration and kept until `clear_interpolants` is called,
+            except for file backed ephemerides, see `load`.
 
         Returns
         -------
@@ -329,16 +802,165 @@ class Ephem:
             Sampled coordinates with velocities.
 
         """
-        if epochs is None or epochs.isscalar and (epochs == self.epochs).all():
+        if epochs is None:
             return self._coordinates
 
-        coordinates = interpolator.interpolate(
-            epochs.reshape(-1),
-            self.epochs,
-            self._coordinates,
+        if epochs.isscalar:
+            if self._tt is None:
+                same_epochs = (epochs == self.epochs).all()
+            else:
+                # Compare offsets to avoid building the epochs of the whole file
+                t = (epochs - self._epoch0).to_value(u.s)
+                same_epochs = self._tt[0] == t == self._tt[-1]
+            if same_epochs:
+                return self._coordinates
+
+        epochs = epochs.reshape(-1)
+        if self._tt is None:
+            try:
+                interpolant = self._interpolants[interpolator]
+            except KeyError:
+                interpolant = self._interpolants[
+                    interpolator
+                ] = interpolator.build(self.epochs, self._coordinates)
+            return interpolant(epochs)
+
+        # Only read the samples around the requested epochs
+        lo, hi = 0, len(self._tt)
+        if interpolator.local:
+            t = (epochs - self._epoch0).to_value(u.s)
+            lo = max(
+                np.searchsorted(self._tt, t.min()) - self._WINDOW_MARGIN, lo
+            )
+            hi = min(
+                np.searchsorted(self._tt, t.max(), side="right")
+                + self._WINDOW_MARGIN,
+                hi,
+            )
+
+        return interpolator.interpolate(
+            epochs,
+            self._epoch0 + np.array(self._tt[lo:hi]) * u.s,
+            self._coordinates[lo:hi],
         )
 
-        return coordinates
+    def clear_interpolants(self):
+        """Discards the interpolants built by previous calls to `sample`."""
+        self._interpolants.clear()
+
+    def save(self, path):
+        """Saves the ephemerides to a binary file that can be memory mapped.
+
+        Epochs are stored as float64 offsets in seconds from the first one,
+        followed by positions in km and velocities in km/s.
+
+        Parameters
+        ----------
+        path : str or ~os.PathLike
+            Destination file.
+
+        """
+        epoch0 = self._epoch0 if self._tt is not None else self.epochs[0]
+        header = json.dumps(
+            {
+                "epoch": [epoch0.jd1, epoch0.jd2],
+                "scale": epoch0.scale,
+                "format": epoch0.format,
+                "out_subfmt": epoch0.out_subfmt,
+                "plane": self.plane.name,
+                "num": len(self._coordinates),
+            }
+        ).encode()
+        header = header.ljust(
+            -(-(len(header) + len(_EPHEM_FILE_MAGIC) + 8) // 64) * 64
+            - len(_EPHEM_FILE_MAGIC)
+            - 8
+        )
+
+        with open(path, "wb") as f:
+            f.write(_EPHEM_FILE_MAGIC)
+            f.write(np.array(len(header), dtype="<u8").tobytes())
+            f.write(header)
+
+            for start in range(0, len(self._coordinates), _EPHEM_FILE_CHUNK):
+                chunk = slice(start, start + _EPHEM_FILE_CHUNK)
+                coordinates = self._coordinates[chunk]
+                if self._tt is not None:
+                    t = self._tt[chunk]
+                else:
+                    t = (self.epochs[chunk] - epoch0).to_value(u.s)
+
+                np.column_stack(
+                    (
+                        t,
+                        coordinates.xyz.to_value(u.km).T,
+                        coordinates.differentials["s"]
+                        .d_xyz.to_value(u.km / u.s)
+                        .T,
+                    )
+                ).astype("<f8").tofile(f)
+
+    @classmethod
+    def load(cls, path, *, mmap=True):
+        """Loads ephemerides saved with `save`.
+
+        Parameters
+        ----------
+        path : str or ~os.PathLike
+            Source file.
+        mmap : bool, optional
+            Whether to memory map the file instead of reading it, default to True.
+            Sampling then only reads the pages around the requested epochs,
+            and several processes can share the same file without copying it.
+
+        Notes
+        -----
+        File backed ephemerides interpolate using only a few samples around
+        the requested epochs, which for splines might give slightly different
+        results than fitting all the samples. Global interpolators like
+        `SincInterpolator` still use all the samples.
+
+        """
+        with open(path, "rb") as f:
+            if f.read(len(_EPHEM_FILE_MAGIC)) != _EPHEM_FILE_MAGIC:
+                raise ValueError(f"{path} is not a poliastro ephemerides file")
+            header_size = int(np.frombuffer(f.read(8), dtype="<u8")[0])
+            header = json.loads(f.read(header_size))
+
+        offset = len(_EPHEM_FILE_MAGIC) + 8 + header_size
+        shape = (header["num"], _EPHEM_FILE_COLUMNS)
+        if mmap:
+            data = np.memmap(
+                path, dtype="<f8", mode="r", offset=offset, shape=shape
+            )
+        else:
+            data = np.fromfile(path, dtype="<f8", offset=offset).reshape(shape)
+
+        coordinates = CartesianRepresentation(
+            data[:, 1] << u.km,
+            data[:, 2] << u.km,
+            data[:, 3] << u.km,
+            differentials=CartesianDifferential(
+                data[:, 4] << (u.km / u.s),
+                data[:, 5] << (u.km / u.s),
+                data[:, 6] << (u.km / u.s),
+                copy=False,
+            ),
+            copy=False,
+        )
+
+        ephem = cls.__new__(cls)
+        ephem._epochs = None
+        ephem._coordinates = coordinates
+        ephem._plane = Planes[header["plane"]]
+        ephem._epoch0 = Time(
+            *header["epoch"], format="jd", scale=header["scale"]
+        )
+        ephem._epoch0.format = header["format"]
+        ephem._epoch0.out_subfmt = header.get("out_subfmt", "*")
+        ephem._tt = data[:, 0]
+        ephem._interpolants = {}
+        return ephem
 
     def rv(self, epochs=None, **kwargs):
         """Position and velocity vectors at given epochs.
@@ -360,3 +982,206 @@ class Ephem:
             return r[0], v[0]
         else:
             return r, v
+
+
+class ChebyshevEphem:
+    """Time history of position and velocity stored as piecewise Chebyshev polynomials.
+
+    The time span is split into segments, and the position in every segment is
+    represented by a Chebyshev polynomial whose derivative gives the velocity,
+    like in the type 2 segments of SPICE kernels. Only the coefficients are kept,
+    and positions and velocities are evaluated in parallel at any epoch.
+
+    Instead of creating ChebyshevEphem objects directly, use `from_ephem`.
+
+    Parameters
+    ----------
+    epoch : astropy.time.Time
+        Reference epoch of the segments.
+    bounds : numpy.ndarray
+        Bounds of the segments, in seconds since the reference epoch.
+    coeffs : numpy.ndarray
+        Coefficients of the positions in km, with shape (segments, degree + 1, 3).
+    plane : ~poliastro.frames.Planes
+        Reference plane of the coordinates.
+
+    """
+
+    def __init__(self, epoch, bounds, coeffs, plane):
+        self._epoch = epoch
+        self._bounds = np.asarray(bounds, dtype=float)
+        self._coeffs = np.ascontiguousarray(coeffs, dtype=float)
+        self._plane = Planes(plane)
+
+    def __str__(self):
+        return (
+            f"Chebyshev ephemerides with {self._coeffs.shape[0]} segments "
+            f"of degree {self.degree} from {self.epochs[0]} "
+            f"({self.epochs[0].scale.upper()}) to {self.epochs[-1]} "
+            f"({self.epochs[-1].scale.upper()})"
+        )
+
+    def __repr__(self):
+        return self.__str__()
+
+    @property
+    def epochs(self):
+        """Bounds of the segments."""
+        return self._epoch + self._bounds * u.s
+
+    @property
+    def plane(self):
+        """Reference plane of the ephemerides."""
+        return self._plane
+
+    @property
+    def degree(self):
+        """Degree of the polynomials."""
+        return self._coeffs.shape[1] - 1
+
+    @classmethod
+    def from_ephem(cls, ephem, segment_duration, *, degree=11):
+        """Fits piecewise Chebyshev polynomials to an ephemerides.
+
+        Positions and velocities of the samples inside every segment are fitted
+        together in the least squares sense, so that every segment needs at least
+        (degree + 1) / 2 samples.
+
+        Parameters
+        ----------
+        ephem : ~poliastro.ephem.Ephem
+            Ephemerides to fit.
+        segment_duration : ~astropy.units.Quantity
+            Duration of the segments. The last one covers the rest of the time span,
+            and is merged into the previous one if it has too few samples to be fitted.
+        degree : int, optional
+            Degree of the polynomials, default to 11.
+
+        Notes
+        -----
+        The sampled velocities must be consistent with the positions,
+        since they are fitted as the derivative of the same polynomial.
+
+        """
+        epochs = ephem.epochs
+        t = (epochs - epochs[0]).to_value(u.s)
+        duration = segment_duration.to_value(u.s)
+        bounds = np.arange(0, t[-1], duration)
+        # Merge a last segment that is degenerate or has too few samples
+        if len(bounds) > 1 and (
+            t[-1] - bounds[-1] < 1e-6 * duration
+            or 2 * np.count_nonzero(t >= bounds[-1]) < degree + 1
+        ):
+            bounds = bounds[:-1]
+        bounds = np.append(bounds, t[-1])
+
+        rr, vv = ephem.rv()
+        coeffs = chebyshev_segments_fit(
+            t,
+            rr.to_value(u.km),
+            vv.to_value(u.km / u.s),
+            bounds,
+            degree,
+        )
+
+        return cls(epochs[0], bounds, coeffs, ephem.plane)
+
+    def sample(self, epochs=None):
+        """Returns coordinates at specified epochs.
+
+        Parameters
+        ----------
+        epochs : ~astropy.time.Time, optional
+            Epochs to sample the ephemerides,
+            if not given the bounds of the segments will be used.
+
+        Returns
+        -------
+        CartesianRepresentation
+            Sampled coordinates with velocities.
+
+        """
+        if epochs is None:
+            epochs = self.epochs
+
+        t = np.atleast_1d((epochs - self._epoch).to_value(u.s))
+        if np.any(t < self._bounds[0]) or np.any(t > self._bounds[-1]):
+            raise ValueError(
+                "Epochs must lie inside the span of the ephemerides"
+            )
+
+        rr, vv = chebyshev_segments_eval(
+            self._bounds, self._coeffs, t.astype(float)
+        )
+        return CartesianRepresentation(
+            rr << u.km,
+            xyz_axis=1,
+            differentials=CartesianDifferential(
+                vv << (u.km / u.s), xyz_axis=1
+            ),
+        )
+
+    def rv(self, epochs=None):
+        """Position and velocity vectors at given epochs.
+
+        Parameters
+        ----------
+        epochs : ~astropy.time.Time, optional
+            Epochs to sample the ephemerides,
+            if not given the bounds of the segments will be used.
+
+        """
+        coordinates = self.sample(epochs)
+
+        r = coordinates.get_xyz(xyz_axis=1)
+        v = coordinates.differentials["s"].get_d_xyz(xyz_axis=1)
+
+        if epochs is not None and epochs.isscalar:
+            return r[0], v[0]
+        else:
+            return r, v
+
+
+def states_on_grid(states, epochs=None):
+    """Positions and velocities of many objects on a common grid of epochs.
+
+    Parameters
+    ----------
+    states : ~poliastro.ephem.Ephem, list or tuple
+        Ephemerides of the objects, or tuple of positions and velocities
+        with shape (n, m, 3) for n objects sampled at m epochs.
+    epochs : ~astropy.time.Time, optional
+        Sampling epochs, required if the states are given as arrays.
+        If not given, the ones of the first ephemerides are used.
+
+    Returns
+    -------
+    rr, vv : numpy.ndarray
+        Contiguous positions in km and velocities in km / s with shape (n, m, 3).
+    epochs : ~astropy.time.Time
+        Sampling epochs.
+
+    """
+    if isinstance(states, Ephem):
+        states = [states]
+
+    if isinstance(states, tuple):
+        if epochs is None:
+            raise ValueError("epochs must be given if states are arrays")
+        rr, vv = states
+        rr, vv = rr.to_value(u.km), vv.to_value(u.km / u.s)
+    else:
+        if epochs is None:
+            epochs = states[0].epochs
+        rvs = [ephem.rv(epochs) for ephem in states]
+        rr = np.stack([r.to_value(u.km) for r, _ in rvs])
+        vv = np.stack([v.to_value(u.km / u.s) for _, v in rvs])
+
+    rr, vv = np.ascontiguousarray(rr), np.ascontiguousarray(vv)
+    if rr.ndim != 3 or rr.shape != vv.shape or rr.shape[1] != len(epochs):
+        raise ValueError(
+            "Positions and velocities must have shape (n, m, 3), "
+            "with m the number of epochs"
+        )
+
+    return rr, vv, epochs
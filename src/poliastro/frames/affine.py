@@ -0,0 +1,143 @@
+"""Direct evaluation of frame transformations that are rotations and translations.
+
+Changing between the Earth equator and the Earth ecliptic planes around the Sun,
+the Earth or the Solar System Barycenter is a constant rotation, and moving from
+the ICRS to the frame of any planet other than the Earth is a translation by the
+barycentric state of the planet. The functions in this module apply those
+transformations to batches of states with array operations, skipping the search
+of the astropy transformation graph, and raise :py:exc:`NotImplementedError` for
+any other transformation so that callers can fall back to astropy.
+
+"""
+from functools import lru_cache
+
+from astropy import units as u
+from astropy.coordinates import (
+    ICRS,
+    BarycentricMeanEcliptic,
+    CartesianRepresentation,
+)
+import numpy as np
+
+from poliastro.bodies import Earth, Sun
+from poliastro.constants import J2000
+from poliastro.frames.enums import Planes
+from poliastro.frames.util import _FRAME_MAPPING, get_frame
+
+__all__ = [
+    "plane_rotation_matrix",
+    "icrs_to_attractor_states",
+]
+
+_ROTATION_PLANES = (Planes.EARTH_EQUATOR, Planes.EARTH_ECLIPTIC)
+
+
+def _get_frame_or_barycentric(attractor, plane):
+    if attractor is not None:
+        return get_frame(attractor, plane, J2000)
+    elif plane is Planes.EARTH_ECLIPTIC:
+        return BarycentricMeanEcliptic()
+    return ICRS()
+
+
+@lru_cache(maxsize=None)
+def plane_rotation_matrix(attractor, from_plane, to_plane):
+    """Returns the constant rotation between two fundamental planes.
+
+    Parameters
+    ----------
+    attractor : ~poliastro.bodies.Body or None
+        Body that serves as the center of both frames,
+        None for the Solar System Barycenter.
+    from_plane : ~poliastro.frames.Planes
+        Fundamental plane of the original frame.
+    to_plane : ~poliastro.frames.Planes
+        Fundamental plane of the destination frame.
+
+    Returns
+    -------
+    R : numpy.ndarray
+        Read only rotation matrix, such that ``R @ r`` expresses in the destination
+        frame a vector ``r`` given in the original frame.
+
+    Raises
+    ------
+    NotImplementedError
+        If the change of plane is not a constant rotation.
+
+    """
+    from_plane, to_plane = Planes(from_plane), Planes(to_plane)
+    if (
+        attractor not in (None, Sun, Earth)
+        or from_plane not in _ROTATION_PLANES
+        or to_plane not in _ROTATION_PLANES
+    ):
+        raise NotImplementedError(
+            f"Changing from plane {from_plane} to {to_plane} around body "
+            f"{attractor} is not a constant rotation"
+        )
+
+    # Images of the basis vectors, one astronomical unit long so that the
+    # translations to and from the barycenter do not lose precision
+    basis = CartesianRepresentation(np.eye(3) * u.au, xyz_axis=0)
+    R = (
+        _get_frame_or_barycentric(attractor, from_plane)
+        .realize_frame(basis)
+        .transform_to(_get_frame_or_barycentric(attractor, to_plane))
+        .cartesian.xyz.to_value(u.au)
+    )
+    R.flags.writeable = False
+    return R
+
+
+def icrs_to_attractor_states(rr, vv, epochs, attractor, plane):
+    """Transforms barycentric states in the ICRS to the frame of an attractor.
+
+    Parameters
+    ----------
+    rr : numpy.ndarray
+        Positions in km, with shape (n, 3).
+    vv : numpy.ndarray
+        Velocities in km / s, with shape (n, 3).
+    epochs : ~astropy.time.Time
+        Epochs of the states, with shape (n,).
+    attractor : ~poliastro.bodies.SolarSystemPlanet or None
+        Body that serves as the center of the destination frame,
+        None for the Solar System Barycenter.
+    plane : ~poliastro.frames.Planes
+        Fundamental plane of the destination frame.
+
+    Returns
+    -------
+    rr, vv : numpy.ndarray
+        Positions in km and velocities in km / s in the destination frame.
+
+    Raises
+    ------
+    NotImplementedError
+        If the transformation is not a translation followed by a constant rotation,
+        as it happens for the frames centered at the Earth.
+
+    """
+    # Avoid circular import
+    from poliastro.ephem import body_barycentric_posvel
+
+    if attractor is not None:
+        if (
+            attractor is Earth
+            or attractor not in _FRAME_MAPPING
+            or Planes(plane) not in _FRAME_MAPPING[attractor]
+        ):
+            raise NotImplementedError(
+                f"The transformation to the frame with plane {plane} "
+                f"around body {attractor} is not a translation"
+            )
+        r_body, v_body = body_barycentric_posvel(attractor, epochs)
+        rr = rr - r_body.xyz.to_value(u.km).T
+        vv = vv - v_body.xyz.to_value(u.km / u.s).T
+
+    if Planes(plane) is Planes.EARTH_EQUATOR:
+        return rr, vv
+
+    R = plane_rotation_matrix(attractor, Planes.EARTH_EQUATOR, plane)
+    return rr @ R.T, vv @ R.T
@@ -49,7 +49,10 @@ GCRS = _GCRS
 class _PlanetaryICRS(BaseRADecFrame):
     obstime = TimeAttribute(default=DEFAULT_OBSTIME)
 
-    def __new__(cls, *args, **kwargs):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Transformations are registered once, when every frame is defined
         frame_transform_graph.transform(AffineTransform, cls, ICRS)(
             cls.to_icrs
         )
@@ -60,8 +63,6 @@ class _PlanetaryICRS(BaseRADecFrame):
             FunctionTransformWithFiniteDifference, cls, cls
         )(cls.self_transform)
 
-        return super().__new__(cls)
-
     @staticmethod
     def to_icrs(planet_coo, _):
         # This is just an origin translation so without a distance it cannot go ahead
@@ -9,6 +9,7 @@ from astropy.coordinates import (
 )
 from astropy.coordinates.builtin_frames.utils import DEFAULT_OBSTIME
 from astropy.coordinates.matrix_utilities import rotation_matrix
+import numpy as np
 
 from poliastro.bodies import (
     Jupiter,
@@ -63,7 +64,10 @@ ITRS = _ITRS
 class _PlanetaryFixed(BaseRADecFrame):
     obstime = TimeAttribute(default=DEFAULT_OBSTIME)
 
-    def __new__(cls, *args, **kwargs):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Transformations are registered once, when every frame is defined
         frame_transform_graph.transform(
             FunctionTransform, cls, cls.equatorial
         )(cls.to_equatorial)
@@ -71,8 +75,6 @@ class _PlanetaryFixed(BaseRADecFrame):
             FunctionTransform, cls.equatorial, cls
         )(cls.from_equatorial)
 
-        return super().__new__(cls)
-
     @staticmethod
     def to_equatorial(fixed_coo, equatorial_frame):
         # TODO replace w/ something smart (Sun/Earth special cased)
@@ -129,17 +131,21 @@ class _PlanetaryFixed(BaseRADecFrame):
         Parameters
         ----------
         epoch : ~astropy.time.Time, optional
-            Epoch, default to J2000.
+            Epoch or array of epochs, default to J2000.
 
         Returns
         -------
         ra, dec, W: tuple (~astropy.units.Quantity)
-            Right ascension and declination of north pole, and angle of the prime meridian.
+            Right ascension and declination of north pole, and angle of the prime meridian,
+            with the same shape as the epochs.
 
         """
         T = (epoch.tdb - J2000).to_value(u.d) / 36525
         d = (epoch.tdb - J2000).to_value(u.d)
-        return cls._rot_elements_at_epoch(T, d)
+        return tuple(
+            np.broadcast_to(element, np.shape(d), subok=True)
+            for element in cls._rot_elements_at_epoch(T, d)
+        )
 
     @staticmethod
     def _rot_elements_at_epoch(T, d):
@@ -0,0 +1,279 @@
+"""Rotations from inertial to body fixed frames for batches of states.
+
+Transforming every sample through the astropy frame graph is accurate but slow
+for long time spans and many satellites. The Earth rotation is evaluated on a
+coarse grid of epochs once and interpolated to the epochs of the samples, and
+the rotation of the other bodies is evaluated directly from their rotational
+elements, and then the states are rotated with batched matrix products.
+
+"""
+from astropy import units as u
+from astropy.coordinates import GCRS, ITRS, CartesianRepresentation
+import numpy as np
+
+from poliastro.constants import J2000
+from poliastro.core.fixed import (
+    equator_rotation_many as equator_rotation_many_fast,
+    rotate_to_body_fixed_many as rotate_to_body_fixed_many_fast,
+)
+from poliastro.util import time_range
+
+__all__ = [
+    "ITRSRotationCache",
+    "PlanetaryFixedRotation",
+]
+
+# Turns of the Earth rotation angle per UT1 day, see IERS Conventions (2010), eq. 5.15
+_ERA_RATE = 1.00273781191135448
+
+
+class _BodyFixedRotation:
+    """Rotation to a body fixed frame.
+
+    The rotation is decomposed as :math:`R_z(\\theta) Q`, where :math:`\\theta` is the
+    angle of the prime meridian and :math:`Q` is the slowly varying orientation of the
+    equator, which subclasses evaluate together with their time derivatives.
+
+    """
+
+    def _elements(self, epochs):
+        raise NotImplementedError
+
+    def matrices(self, epochs):
+        """Rotation matrices from the inertial to the body fixed frame.
+
+        Parameters
+        ----------
+        epochs : ~astropy.time.Time
+            Epochs, inside the span of the grid for interpolated rotations.
+
+        Returns
+        -------
+        RR : numpy.ndarray
+            Rotation matrices with shape (n, 3, 3).
+
+        """
+        theta, _, QQ, _ = self._elements(epochs)
+        cos_t, sin_t = np.cos(theta), np.sin(theta)
+        Rz = np.zeros((len(theta), 3, 3))
+        Rz[:, 0, 0] = Rz[:, 1, 1] = cos_t
+        Rz[:, 0, 1] = sin_t
+        Rz[:, 1, 0] = -sin_t
+        Rz[:, 2, 2] = 1.0
+        return Rz @ QQ
+
+    def rotate(self, rr, epochs, vv=None):
+        """Rotates positions, and optionally velocities, to the body fixed frame.
+
+        Parameters
+        ----------
+        rr : ~astropy.units.Quantity
+            Positions in the inertial frame, with shape (n, 3) or (3,).
+        epochs : ~astropy.time.Time
+            Epochs of the positions, inside the span of the grid
+            for interpolated rotations.
+        vv : ~astropy.units.Quantity, optional
+            Velocities in the inertial frame, with the same shape as the positions.
+
+        Returns
+        -------
+        rr_fixed : ~astropy.units.Quantity
+            Positions in the body fixed frame.
+        vv_fixed : ~astropy.units.Quantity
+            Velocities in the body fixed frame, only if velocities are given.
+
+        """
+        theta, theta_dot, QQ, QQ_dot = self._elements(epochs)
+        shape = rr.shape
+        rr_ = np.ascontiguousarray(
+            np.broadcast_to(rr.to_value(u.km).reshape(-1, 3), (len(theta), 3))
+        )
+        if vv is None:
+            vv_ = np.zeros_like(rr_)
+        else:
+            vv_ = np.ascontiguousarray(
+                np.broadcast_to(
+                    vv.to_value(u.km / u.s).reshape(-1, 3), (len(theta), 3)
+                )
+            )
+
+        rr_fixed, vv_fixed = rotate_to_body_fixed_many_fast(
+            theta, theta_dot, QQ, QQ_dot, rr_, vv_
+        )
+        rr_fixed = (rr_fixed * u.km).reshape(shape).to(rr.unit)
+
+        if vv is None:
+            return rr_fixed
+        return rr_fixed, (vv_fixed * u.km / u.s).reshape(shape).to(vv.unit)
+
+
+class _RotationCache(_BodyFixedRotation):
+    r"""Rotation to a body fixed frame interpolated on a grid of epochs.
+
+    The angle of the prime meridian must be given without jumps of :math:`2 \pi`,
+    and is interpolated linearly. The orientation of the equator is interpolated
+    linearly element wise.
+
+    """
+
+    def __init__(self, epochs, theta, QQ):
+        self._epoch0 = epochs[0].tt
+        self._tt = (epochs.tt - self._epoch0).to_value(u.s)
+        self._theta = theta
+        self._QQ = QQ
+
+    @property
+    def epochs(self):
+        """Epochs of the grid."""
+        return self._epoch0 + self._tt * u.s
+
+    def _elements(self, epochs):
+        t = np.atleast_1d((epochs.tt - self._epoch0).to_value(u.s))
+        if np.any(t < self._tt[0]) or np.any(t > self._tt[-1]):
+            raise ValueError("Epochs must lie inside the span of the cache")
+
+        ii = np.clip(
+            np.searchsorted(self._tt, t, side="right") - 1,
+            0,
+            len(self._tt) - 2,
+        )
+        dt = self._tt[ii + 1] - self._tt[ii]
+        s = (t - self._tt[ii]) / dt
+
+        theta_dot = (self._theta[ii + 1] - self._theta[ii]) / dt
+        theta = self._theta[ii] + s * theta_dot * dt
+        QQ_dot = (self._QQ[ii + 1] - self._QQ[ii]) / dt[:, None, None]
+        QQ = self._QQ[ii] + (s * dt)[:, None, None] * QQ_dot
+
+        return theta, theta_dot, QQ, QQ_dot
+
+
+class ITRSRotationCache(_RotationCache):
+    """Cached rotation from GCRS to ITRS.
+
+    The full astropy transformation, including precession, nutation and polar
+    motion, is evaluated on a grid of epochs. The Earth rotation angle is a linear
+    function of UT1, and it is interpolated linearly in TT, which is exact up to
+    the slow drift of UT1 with respect to TT, and the remaining rotation only changes through precession,
+    nutation and polar motion seen from the rotating Earth. The interpolation
+    error decreases with the square of the step, and is dominated by the polar
+    motion, which completes a turn every day as seen from the rotating frame.
+    With the default step of one hour the interpolated rotation differs from the
+    astropy one by less than :math:`2 \\cdot 10^{-8}` rad, this is, less than
+    0.15 m at the altitude of a low Earth orbit and 1 m at geostationary altitude.
+    The angle is unwrapped with its known rate, so that steps longer than
+    half a day do not alias the Earth rotation.
+
+    Parameters
+    ----------
+    start : ~astropy.time.Time
+        First epoch of the cache.
+    end : ~astropy.time.Time
+        Last epoch of the cache.
+    step : ~astropy.units.Quantity, optional
+        Maximum step of the grid of epochs, defaults to one hour.
+
+    """
+
+    def __init__(self, start, end, step=1 * u.h):
+        if end <= start:
+            end = start + step
+        num_values = max(int(np.ceil(((end - start) / step).decompose())), 1)
+        epochs = time_range(start, end=end, num_values=num_values + 1)
+
+        # Images of the basis vectors, shape (3, grid)
+        basis = (
+            np.broadcast_to(np.eye(3)[:, :, None], (3, 3, len(epochs))) * u.km
+        )
+        itrs = GCRS(
+            CartesianRepresentation(basis, xyz_axis=0), obstime=epochs
+        ).transform_to(ITRS(obstime=epochs))
+        RR = np.moveaxis(
+            itrs.cartesian.xyz.to_value(u.km), (0, 1, 2), (1, 2, 0)
+        )
+
+        theta = epochs.earth_rotation_angle(longitude=0 * u.deg).to_value(
+            u.rad
+        )
+        # Add the full turns between grid epochs, which np.unwrap
+        # would miss for steps longer than half a turn
+        ut1 = (epochs.ut1 - epochs[0].ut1).to_value(u.d)
+        theta_linear = theta[0] + 2 * np.pi * _ERA_RATE * ut1
+        theta = theta + 2 * np.pi * np.round(
+            (theta_linear - theta) / (2 * np.pi)
+        )
+        cos_t, sin_t = np.cos(theta), np.sin(theta)
+        RzT = np.zeros((len(theta), 3, 3))
+        RzT[:, 0, 0] = RzT[:, 1, 1] = cos_t
+        RzT[:, 0, 1] = -sin_t
+        RzT[:, 1, 0] = sin_t
+        RzT[:, 2, 2] = 1.0
+
+        super().__init__(epochs, theta, RzT @ RR)
+
+    @classmethod
+    def from_epochs(cls, epochs, step=1 * u.h):
+        """Creates a cache spanning the given epochs.
+
+        Parameters
+        ----------
+        epochs : ~astropy.time.Time
+            Epochs to be covered by the cache.
+        step : ~astropy.units.Quantity, optional
+            Maximum step of the grid of epochs, defaults to one hour.
+
+        """
+        epochs = epochs.reshape(-1)
+        return cls(epochs.min(), epochs.max(), step)
+
+
+class PlanetaryFixedRotation(_BodyFixedRotation):
+    """Rotation from the equatorial to the body fixed frame of a Solar System body.
+
+    The rotational elements of the body are evaluated for all the epochs at once,
+    and their rates are computed with central differences, so that velocities
+    include the rotation of the body. The results match the transformation of
+    the positions from the equatorial frame of the body, for instance
+    :py:class:`~poliastro.frames.equatorial.MarsICRS`, to its fixed frame,
+    for instance :py:class:`~poliastro.frames.fixed.MarsFixed`.
+
+    Parameters
+    ----------
+    fixed_frame : type
+        Body fixed frame class, for instance
+        :py:class:`~poliastro.frames.fixed.MarsFixed`.
+
+    """
+
+    # Step of the central differences, in days
+    _STEP = 1 / 1440
+
+    def __init__(self, fixed_frame):
+        self._fixed_frame = fixed_frame
+
+    @property
+    def fixed_frame(self):
+        """Body fixed frame class."""
+        return self._fixed_frame
+
+    def _rot_elements(self, d):
+        ra, dec, W = self._fixed_frame._rot_elements_at_epoch(d / 36525, d)
+        return (
+            np.broadcast_to(angle.to_value(u.rad), d.shape)
+            for angle in (ra, dec, W)
+        )
+
+    def _elements(self, epochs):
+        d = np.atleast_1d((epochs.tdb - J2000).to_value(u.d))
+        ra, dec, W = self._rot_elements(d)
+        ra_1, dec_1, W_1 = self._rot_elements(d + self._STEP)
+        ra_0, dec_0, W_0 = self._rot_elements(d - self._STEP)
+
+        step = 2 * self._STEP * 86400
+        QQ, QQ_dot = equator_rotation_many_fast(
+            np.ascontiguousarray(ra),
+            np.ascontiguousarray(dec),
+            (ra_1 - ra_0) / step,
+            (dec_1 - dec_0) / step,
+        )
+        return np.ascontiguousarray(W), (W_1 - W_0) / step, QQ, QQ_dot
@@ -5,6 +5,7 @@ import numpy as np
 
 from poliastro.bodies import Sun
 from poliastro.frames import Planes
+from poliastro.query_cache import cached_query, get_query_cache
 from poliastro.twobody.angles import (
     D_to_nu,
     E_to_nu,
@@ -16,8 +17,44 @@ from poliastro.twobody.angles import (
 from poliastro.twobody.orbit import Orbit
 
 
+def _fetch_sbdb(name, **kwargs):
+    return SBDB.query(name, full_precision=True, **kwargs)
+
+
+def prefetch_sbdb(names, *, max_workers=8, **kwargs):
+    """Queries the JPL Small-Body Database for several objects concurrently.
+
+    The responses are stored in the active query cache, so that subsequent
+    calls to :py:func:`orbit_from_sbdb` with the same arguments
+    do not need network access.
+
+    Parameters
+    ----------
+    names : list
+        Names of the bodies to query for.
+    max_workers : int, optional
+        Maximum number of concurrent queries, defaults to 8.
+    **kwargs
+        Extra kwargs for astroquery.
+
+    """
+    cache = get_query_cache()
+    if cache is None:
+        raise ValueError(
+            "A query cache must be set to prefetch queries, "
+            "see poliastro.query_cache.set_query_cache"
+        )
+
+    cache.prefetch(
+        "sbdb",
+        [{"name": name, **kwargs} for name in names],
+        _fetch_sbdb,
+        max_workers=max_workers,
+    )
+
+
 def orbit_from_sbdb(name, **kwargs):
-    obj = SBDB.query(name, full_precision=True, **kwargs)
+    obj = cached_query("sbdb", {"name": name, **kwargs}, _fetch_sbdb)
 
     if "count" in obj:
         # No error till now ---> more than one object has been found
@@ -1,4 +1,5 @@
 # Select default algorithm
-from poliastro.iod.izzo import lambert
+from poliastro.iod._batch import LambertSolutions
+from poliastro.iod.izzo import lambert, lambert_many
 
-__all__ = ["lambert"]
+__all__ = ["lambert", "lambert_many", "LambertSolutions"]
@@ -0,0 +1,64 @@
+from collections import namedtuple
+
+from astropy import units as u
+import numpy as np
+
+kms = u.km / u.s
+
+LambertSolutions = namedtuple(
+    "LambertSolutions", ["v0", "v", "converged", "iterations"]
+)
+LambertSolutions.__doc__ = """Solutions of a batch of Lambert problems.
+
+Parameters
+----------
+v0 : ~astropy.units.Quantity
+    Initial velocities, NaN for the problems without solution.
+v : ~astropy.units.Quantity
+    Final velocities, NaN for the problems without solution.
+converged : numpy.ndarray
+    Whether every problem was solved.
+iterations : numpy.ndarray
+    Number of iterations of every problem.
+
+"""
+
+
+def _lambert_many(
+    kernel, k, r0s, rs, tofs, M, prograde, lowpath, numiter, rtol
+):
+    """Solves a batch of Lambert problems with a parallel kernel.
+
+    Positions and times of flight are broadcast against each other,
+    so that one of the positions can be shared by all the problems.
+
+    """
+    k_ = k.to_value(u.km**3 / u.s**2)
+    tofs_ = tofs.to_value(u.s)
+    r0s_, rs_ = np.broadcast_arrays(r0s.to_value(u.km), rs.to_value(u.km))
+    shape = np.broadcast_shapes(r0s_.shape[:-1], np.shape(tofs_))
+
+    v0, v, status, iterations = kernel(
+        k_,
+        np.ascontiguousarray(np.broadcast_to(r0s_, shape + (3,))).reshape(
+            -1, 3
+        ),
+        np.ascontiguousarray(np.broadcast_to(rs_, shape + (3,))).reshape(
+            -1, 3
+        ),
+        np.ascontiguousarray(
+            np.broadcast_to(tofs_, shape), dtype=float
+        ).ravel(),
+        M,
+        prograde,
+        lowpath,
+        numiter,
+        rtol,
+    )
+
+    return LambertSolutions(
+        v0.reshape(shape + (3,)) << kms,
+        v.reshape(shape + (3,)) << kms,
+        (status == 0).reshape(shape),
+        iterations.reshape(shape),
+    )
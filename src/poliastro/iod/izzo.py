@@ -1,7 +1,8 @@
 """Izzo's algorithm for Lambert's problem."""
 from astropy import units as u
 
-from poliastro.core.iod import izzo as izzo_fast
+from poliastro.core.iod import izzo as izzo_fast, izzo_many as izzo_many_fast
+from poliastro.iod._batch import _lambert_many
 
 kms = u.km / u.s
 
@@ -48,3 +49,56 @@ def lambert(
 
     v0, v = izzo_fast(k_, r0_, r_, tof_, M, prograde, lowpath, numiter, rtol)
     return v0 << kms, v << kms
+
+
+def lambert_many(
+    k, r0s, rs, tofs, M=0, prograde=True, lowpath=True, numiter=35, rtol=1e-8
+):
+    """Solves a batch of Lambert problems in parallel using the Izzo algorithm.
+
+    Instead of raising errors, the velocities of the problems without solution
+    or for which the algorithm does not converge are NaN, so that large trade
+    studies are not interrupted by a single failure.
+
+    Parameters
+    ----------
+    k : ~astropy.units.Quantity
+        Gravitational constant of main attractor (km^3 / s^2).
+    r0s : ~astropy.units.Quantity
+        Initial positions (km), with shape (..., 3).
+    rs : ~astropy.units.Quantity
+        Final positions (km), with shape (..., 3).
+    tofs : ~astropy.units.Quantity
+        Times of flight (s), broadcastable with the positions
+        without their last axis.
+    M : int, optional
+        Number of full revolutions, default to 0.
+    prograde: boolean
+        Controls the desired inclination of the transfer orbit.
+    lowpath: boolean
+        If `True` or `False`, gets the transfer orbit whose vacant focus is
+        below or above the chord line, respectively.
+    numiter : int, optional
+        Maximum number of iterations, default to 35.
+    rtol : float, optional
+        Relative tolerance of the algorithm, default to 1e-8.
+
+    Returns
+    -------
+    solutions : ~poliastro.iod.LambertSolutions
+        Initial and final velocities, convergence flags and
+        number of Householder iterations of every problem.
+
+    """
+    return _lambert_many(
+        izzo_many_fast,
+        k,
+        r0s,
+        rs,
+        tofs,
+        M,
+        prograde,
+        lowpath,
+        numiter,
+        rtol,
+    )
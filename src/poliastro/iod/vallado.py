@@ -1,7 +1,11 @@
 """Initial orbit determination."""
 from astropy import units as u
 
-from poliastro.core.iod import vallado as vallado_fast
+from poliastro.core.iod import (
+    vallado as vallado_fast,
+    vallado_many as vallado_many_fast,
+)
+from poliastro.iod._batch import _lambert_many
 
 kms = u.km / u.s
 
@@ -62,3 +66,61 @@ def lambert(
     )
 
     return v0 << kms, v << kms
+
+
+def lambert_many(
+    k, r0s, rs, tofs, M=0, prograde=True, lowpath=True, numiter=35, rtol=1e-8
+):
+    """Solves a batch of Lambert problems in parallel using the Vallado algorithm.
+
+    Instead of raising errors, the velocities of the problems without solution
+    or for which the algorithm does not converge are NaN, so that large trade
+    studies are not interrupted by a single failure.
+
+    Parameters
+    ----------
+    k : ~astropy.units.Quantity
+        Gravitational constant of main attractor (km^3 / s^2).
+    r0s : ~astropy.units.Quantity
+        Initial positions (km), with shape (..., 3).
+    rs : ~astropy.units.Quantity
+        Final positions (km), with shape (..., 3).
+    tofs : ~astropy.units.Quantity
+        Times of flight (s), broadcastable with the positions
+        without their last axis.
+    M : int, optional
+        Number of full revolutions, default to 0.
+    prograde: boolean
+        Controls the desired inclination of the transfer orbit.
+    lowpath: boolean
+        If `True` or `False`, gets the transfer orbit whose vacant focus is
+        below or above the chord line, respectively.
+    numiter : int, optional
+        Maximum number of iterations, default to 35.
+    rtol : float, optional
+        Relative tolerance of the algorithm, default to 1e-8.
+
+    Returns
+    -------
+    solutions : ~poliastro.iod.LambertSolutions
+        Initial and final velocities, convergence flags and
+        number of bisection iterations of every problem.
+
+    Notes
+    -----
+    Multiple revolutions are not supported, and the problems with ``M > 0``
+    are flagged as not converged.
+
+    """
+    return _lambert_many(
+        vallado_many_fast,
+        k,
+        r0s,
+        rs,
+        tofs,
+        M,
+        prograde,
+        lowpath,
+        numiter,
+        rtol,
+    )
@@ -0,0 +1,358 @@
+"""Search of multiple gravity assist trajectories.
+
+A trajectory visits a sequence of bodies, on encounter dates taken from a window
+of candidate dates for every body, with Lambert transfers between consecutive
+encounters. Gravity assists are modelled as patched conics: the hyperbolic excess
+velocities before and after every flyby must be matched by the turn of the
+hyperbola, and any difference between their magnitudes is paid with an impulse
+at the periapsis of the flyby at minimum altitude.
+
+The legs are solved in batch for all the candidate dates, and the sequences of
+encounter dates are explored with a beam search whose partial trajectories are
+pruned with the bound given by a first, narrower search, and with the range of
+distances that can be reached from every flyby according to the Tisserand graph.
+
+"""
+from collections import namedtuple
+
+from astropy import units as u
+from astropy.time import Time
+import numpy as np
+
+from poliastro.core.iod import izzo_grid as izzo_grid_fast
+from poliastro.porkchop import get_body_states
+
+MGATrajectory = namedtuple(
+    "MGATrajectory",
+    ["epochs", "cost", "launch_vinf", "flyby_dv", "arrival_vinf"],
+)
+MGATrajectory.__doc__ = """Multiple gravity assist trajectory found by :py:func:`search_mga`.
+
+Parameters
+----------
+epochs : ~astropy.time.Time
+    Encounter dates of every body of the sequence.
+cost : ~astropy.units.Quantity
+    Sum of the launch hyperbolic excess velocity, the flyby impulses and,
+    if included, the arrival hyperbolic excess velocity.
+launch_vinf : ~astropy.units.Quantity
+    Hyperbolic excess velocity at launch.
+flyby_dv : ~astropy.units.Quantity
+    Impulse at the periapsis of every flyby, at the minimum flyby altitude.
+arrival_vinf : ~astropy.units.Quantity
+    Hyperbolic excess velocity at arrival.
+
+"""
+
+
+def _reachable_radii(k, r, v, vinf):
+    """Range of distances to the attractor reachable after a flyby.
+
+    Follows the Tisserand graph, which assumes a circular orbit of the flyby body:
+    the extreme distances are the apsides of the orbits whose velocity at the flyby
+    is aligned with that of the body, with magnitude ``v + vinf`` and ``v - vinf``.
+
+    """
+    x_max = (v + vinf) ** 2 * r / k
+    x_min = np.maximum(v - vinf, 0) ** 2 * r / k
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_max = np.where(
+            x_max < 2, np.maximum(r, r * x_max / (2 - x_max)), np.inf
+        )
+        r_min = np.minimum(r, r * x_min / (2 - x_min))
+    return r_min, r_max
+
+
+def _flyby_dv(k, r_p, vinf_in, vinf_out):
+    """Impulse at periapsis that changes the hyperbolic excess velocity of a flyby."""
+    return np.abs(
+        np.sqrt(vinf_out**2 + 2 * k / r_p)
+        - np.sqrt(vinf_in**2 + 2 * k / r_p)
+    )
+
+
+def _max_vinf_out(k, r_p, vinf_in, dv):
+    """Maximum hyperbolic excess velocity after a flyby with a given impulse."""
+    return np.sqrt(
+        np.maximum(
+            (np.sqrt(vinf_in**2 + 2 * k / r_p) + dv) ** 2 - 2 * k / r_p, 0
+        )
+    )
+
+
+def _max_turn_angle(k, r_p, vinf):
+    """Half of the turn angle of a hyperbola with given periapsis radius."""
+    return np.arcsin(1 / (1 + r_p * vinf**2 / k))
+
+
+class _Leg:
+    """Lambert transfers of a leg, solved in batch for new departure dates."""
+
+    def __init__(self, k, rr_dpt, vv_dpt, t_dpt, rr_arr, vv_arr, t_arr):
+        self.k = k
+        self.rr_dpt, self.vv_dpt, self.t_dpt = rr_dpt, vv_dpt, t_dpt
+        self.rr_arr, self.vv_arr, self.t_arr = rr_arr, vv_arr, t_arr
+        m, n = len(t_arr), len(t_dpt)
+        self._solved = np.zeros(n, dtype=bool)
+        self.vinf_dpt = np.full((n, m, 3), np.nan)
+        self.vinf_arr = np.full((n, m, 3), np.nan)
+
+    def solve(self, dates):
+        """Solves the transfers from the given departure dates, if they are new."""
+        new = np.unique(dates[~self._solved[dates]])
+        if new.size == 0:
+            return
+
+        v1, v2, _, _ = izzo_grid_fast(
+            self.k,
+            np.ascontiguousarray(self.rr_dpt[new]),
+            self.rr_arr,
+            np.ascontiguousarray(self.t_arr[:, np.newaxis] - self.t_dpt[new]),
+            0,
+            True,
+            True,
+            35,
+            1e-8,
+            True,
+        )
+        self.vinf_dpt[new] = (v1 - self.vv_dpt[new]).transpose(1, 0, 2)
+        self.vinf_arr[new] = (v2 - self.vv_arr[:, np.newaxis]).transpose(
+            1, 0, 2
+        )
+        self._solved[new] = True
+
+
+def _beam_search(
+    legs,
+    bodies,
+    radii,
+    launch_dates,
+    *,
+    beam_width,
+    bound,
+    max_launch_vinf,
+    max_flyby_dv,
+    min_periapsis,
+    include_arrival,
+):
+    """Explores the encounter dates, keeping the best partial trajectories per leg.
+
+    Returns the encounter date indices and the costs of the complete trajectories,
+    sorted by cost.
+
+    """
+    paths = launch_dates[:, np.newaxis]
+    vinf = np.full((len(launch_dates), 3), np.nan)
+    cost = np.zeros(len(launch_dates))
+
+    for ii, leg in enumerate(legs):
+        leg.solve(paths[:, -1])
+        vinf_dpt = leg.vinf_dpt[paths[:, -1]]
+        vinf_arr = leg.vinf_arr[paths[:, -1]]
+        vinf_out = np.linalg.norm(vinf_dpt, axis=-1)
+
+        if ii == 0:
+            step = vinf_out
+            feasible = vinf_out <= max_launch_vinf
+        else:
+            # Flyby of the departure body of the leg
+            body = bodies[ii]
+            k, r_p = body.k.to_value(u.km**3 / u.s**2), min_periapsis[ii]
+            vinf_in = np.linalg.norm(vinf, axis=-1)[:, np.newaxis]
+            cos_turn = np.einsum("ik,ijk->ij", vinf, vinf_dpt) / (
+                vinf_in * vinf_out
+            )
+            turn = np.arccos(np.clip(cos_turn, -1, 1))
+            step = _flyby_dv(k, r_p, vinf_in, vinf_out)
+            feasible = (step <= max_flyby_dv) & (
+                turn
+                <= _max_turn_angle(k, r_p, vinf_in)
+                + _max_turn_angle(k, r_p, vinf_out)
+            )
+
+        new_cost = cost[:, np.newaxis] + step
+        vinf_next = np.linalg.norm(vinf_arr, axis=-1)
+        if ii == len(legs) - 1 and include_arrival:
+            new_cost = new_cost + vinf_next
+        feasible &= np.isfinite(new_cost) & (new_cost <= bound)
+
+        if ii < len(legs) - 1:
+            # The next leg must reach the following body after the flyby
+            r_min, r_max = _reachable_radii(
+                leg.k,
+                np.linalg.norm(leg.rr_arr, axis=-1),
+                np.linalg.norm(leg.vv_arr, axis=-1),
+                _max_vinf_out(
+                    bodies[ii + 1].k.to_value(u.km**3 / u.s**2),
+                    min_periapsis[ii + 1],
+                    vinf_next,
+                    max_flyby_dv,
+                ),
+            )
+            feasible &= (r_max >= radii[ii + 2][0]) & (
+                r_min <= radii[ii + 2][1]
+            )
+
+        pp, jj = np.nonzero(feasible)
+        if len(pp) > beam_width:
+            best = np.argpartition(new_cost[pp, jj], beam_width - 1)
+            pp, jj = pp[best[:beam_width]], jj[best[:beam_width]]
+
+        paths = np.column_stack([paths[pp], jj])
+        vinf = vinf_arr[pp, jj]
+        cost = new_cost[pp, jj]
+
+    order = np.argsort(cost, kind="stable")
+    return paths[order], cost[order]
+
+
+def search_mga(
+    sequence,
+    windows,
+    *,
+    attractor=None,
+    max_launch_vinf=np.inf * u.km / u.s,
+    max_flyby_dv=np.inf * u.km / u.s,
+    min_flyby_altitude=200 * u.km,
+    include_arrival=True,
+    beam_width=1000,
+    num_solutions=10,
+):
+    """Searches multiple gravity assist trajectories along a sequence of bodies.
+
+    Parameters
+    ----------
+    sequence : list
+        Bodies of the sequence, from the departure body to the target body.
+    windows : list
+        :py:class:`~astropy.time.Time` arrays of candidate encounter dates
+        of every body of the sequence.
+    attractor : ~poliastro.bodies.Body, optional
+        Main attractor of the transfers, default to the parent of the departure body.
+    max_launch_vinf : ~astropy.units.Quantity, optional
+        Maximum hyperbolic excess velocity at launch, default to no limit.
+    max_flyby_dv : ~astropy.units.Quantity, optional
+        Maximum impulse of every flyby, default to no limit. Use zero to search
+        unpowered gravity assists only.
+    min_flyby_altitude : ~astropy.units.Quantity, optional
+        Minimum altitude of the flybys, default to 200 km.
+    include_arrival : bool, optional
+        Whether the hyperbolic excess velocity at arrival adds to the cost,
+        as in rendezvous or orbit insertion, default to True.
+    beam_width : int, optional
+        Maximum number of partial trajectories kept after every leg, default to 1000.
+    num_solutions : int, optional
+        Maximum number of trajectories to return, default to 10.
+
+    Returns
+    -------
+    trajectories : list
+        :py:class:`MGATrajectory` found, sorted by cost.
+
+    Notes
+    -----
+    The legs are direct prograde Lambert transfers. Before exploring the whole beam,
+    a search keeping ``num_solutions`` partial trajectories per leg bounds the cost
+    of the trajectories to return, so that costlier partial trajectories are pruned.
+    Partial trajectories are also pruned when the next body of the sequence cannot
+    be reached after the flyby according to the Tisserand graph, and departure dates
+    are only solved once they belong to a partial trajectory that is not pruned.
+
+    """
+    if len(sequence) < 2:
+        raise ValueError("The sequence must have at least two bodies")
+    if len(windows) != len(sequence):
+        raise ValueError(
+            "There must be a window of encounter dates for every body"
+        )
+
+    if attractor is None:
+        attractor = sequence[0].parent
+    k = attractor.k.to_value(u.km**3 / u.s**2)
+
+    windows = [window.reshape(-1) for window in windows]
+    states = [
+        get_body_states(body, window)
+        for body, window in zip(sequence, windows)
+    ]
+    radii = [
+        (r.min(), r.max())
+        for r in (np.linalg.norm(rr, axis=-1) for rr, _ in states)
+    ]
+    tt = [(window - windows[0][0]).to_value(u.s) for window in windows]
+    legs = [
+        _Leg(k, *states[ii], tt[ii], *states[ii + 1], tt[ii + 1])
+        for ii in range(len(sequence) - 1)
+    ]
+
+    max_launch_vinf = max_launch_vinf.to_value(u.km / u.s)
+    max_flyby_dv = max_flyby_dv.to_value(u.km / u.s)
+
+    # Skip the launch dates from which the first target cannot be reached
+    r_min, r_max = _reachable_radii(
+        k,
+        np.linalg.norm(states[0][0], axis=-1),
+        np.linalg.norm(states[0][1], axis=-1),
+        max_launch_vinf,
+    )
+    (launch_dates,) = np.nonzero(
+        (r_max >= radii[1][0]) & (r_min <= radii[1][1])
+    )
+
+    kwargs = {
+        "max_launch_vinf": max_launch_vinf,
+        "max_flyby_dv": max_flyby_dv,
+        "min_periapsis": [
+            (body.R + min_flyby_altitude).to_value(u.km) for body in sequence
+        ],
+        "include_arrival": include_arrival,
+    }
+    _, costs = _beam_search(
+        legs,
+        sequence,
+        radii,
+        launch_dates,
+        beam_width=num_solutions,
+        bound=np.inf,
+        **kwargs,
+    )
+    bound = costs[num_solutions - 1] if len(costs) >= num_solutions else np.inf
+    paths, costs = _beam_search(
+        legs,
+        sequence,
+        radii,
+        launch_dates,
+        beam_width=max(beam_width, num_solutions),
+        bound=bound,
+        **kwargs,
+    )
+
+    k_bodies = [body.k.to_value(u.km**3 / u.s**2) for body in sequence]
+    trajectories = []
+    for path, cost in zip(paths[:num_solutions], costs):
+        vinf = [
+            np.linalg.norm(leg.vinf_dpt[path[ii], path[ii + 1]])
+            for ii, leg in enumerate(legs)
+        ]
+        vinf_in = [
+            np.linalg.norm(leg.vinf_arr[path[ii], path[ii + 1]])
+            for ii, leg in enumerate(legs)
+        ]
+        trajectories.append(
+            MGATrajectory(
+                Time([window[idx] for window, idx in zip(windows, path)]),
+                cost * u.km / u.s,
+                vinf[0] * u.km / u.s,
+                _flyby_dv(
+                    np.array(k_bodies[1:-1]),
+                    np.array(kwargs["min_periapsis"][1:-1]),
+                    np.array(vinf_in[:-1]),
+                    np.array(vinf[1:]),
+                )
+                * u.km
+                / u.s,
+                vinf_in[-1] * u.km / u.s,
+            )
+        )
+
+    return trajectories
@@ -0,0 +1,310 @@
+"""Prediction of passes of satellites over ground stations."""
+
+from astropy import units as u
+from astropy.table import QTable
+import numpy as np
+
+from poliastro._math.interpolate import hermite_segments
+from poliastro._math.optimize import brentq_many, golden_section_many
+from poliastro.bodies import Earth
+from poliastro.core.events import (
+    elevation_function_many as elevation_function_many_fast,
+)
+from poliastro.ephem import states_on_grid
+from poliastro.spheroid_location import (
+    SpheroidLocation,
+    SpheroidLocationArray,
+)
+from poliastro.util import epochs_from_offsets
+
+
+class _PassGeometry:
+    """Elevation of satellites over stations at arbitrary times inside the grid."""
+
+    def __init__(self, attractor, rr, vv, tt, theta_g, stations, min_el):
+        self.k = attractor.k.to_value(u.km**3 / u.s**2)
+        self.R = attractor.R.to_value(u.km)
+        self.R_p = attractor.R_polar.to_value(u.km)
+        self.rr, self.vv, self.tt, self.theta_g = rr, vv, tt, theta_g
+        self.lon = stations.lon.to_value(u.rad)
+        self.lat = stations.lat.to_value(u.rad)
+        self.h = stations.h.to_value(u.km)
+        self.min_el = min_el
+
+    def on_grid(self, station):
+        n, m = self.rr.shape[:2]
+        el = elevation_function_many_fast(
+            self.k,
+            self.rr.reshape(-1, 3),
+            np.full(n * m, self.lat[station]),
+            np.tile(self.theta_g + self.lon[station], n),
+            self.R,
+            self.R_p,
+            np.full(n * m, self.h[station]),
+        )
+        return el.reshape(n, m) - self.min_el
+
+    def at(self, t, sat, station):
+        ii = np.clip(
+            np.searchsorted(self.tt, t, side="right") - 1, 0, len(self.tt) - 2
+        )
+        t0, t1 = self.tt[ii], self.tt[ii + 1]
+        uu = hermite_segments(
+            t,
+            t0,
+            t1,
+            self.rr[sat, ii],
+            self.vv[sat, ii],
+            self.rr[sat, ii + 1],
+            self.vv[sat, ii + 1],
+        )
+        s = (t - t0) / (t1 - t0)
+        theta = (1 - s) * self.theta_g[ii] + s * self.theta_g[ii + 1]
+
+        el = elevation_function_many_fast(
+            self.k,
+            np.ascontiguousarray(uu[:, :3]),
+            np.full(t.size, self.lat[station]),
+            theta + self.lon[station],
+            self.R,
+            self.R_p,
+            np.full(t.size, self.h[station]),
+        )
+        return el - self.min_el
+
+
+def predict_passes(
+    attractor,
+    states,
+    stations,
+    epochs=None,
+    *,
+    min_elevation=0 * u.deg,
+    sidereal_time=None,
+    screening_margin=2 * u.deg,
+    xtol=1e-3 * u.s,
+    maxiter=100,
+):
+    """Predict the passes of many satellites over many ground stations.
+
+    The elevation of every satellite over every station is evaluated
+    in parallel on the sampling epochs. Acquisition (AOS) and loss (LOS)
+    of signal are bracketed by sign changes of the elevation over the mask,
+    and local maxima of the sampled elevation are screened with a parabolic
+    estimate to catch short passes that peak between samples. Crossings are
+    refined with Brent's method and maxima with golden section search,
+    interpolating the satellite positions with cubic Hermite polynomials.
+
+    Parameters
+    ----------
+    attractor : ~poliastro.bodies.Body
+        Central body, with respect to which the states are given.
+    states : ~poliastro.ephem.Ephem, list or tuple
+        Ephemerides of the satellites in a frame whose z axis is the rotation axis
+        of the attractor, or tuple of positions and velocities with shape (n, m, 3)
+        for n satellites sampled at m epochs.
+    stations : ~poliastro.spheroid_location.SpheroidLocationArray, ~poliastro.spheroid_location.SpheroidLocation or list
+        Ground stations on the attractor.
+    epochs : ~astropy.time.Time, optional
+        Sampling epochs, required if the states are given as arrays.
+        If not given, the ones of the first ephemerides are used.
+    min_elevation : ~astropy.units.Quantity, optional
+        Elevation mask of the stations, defaults to 0 degrees.
+    sidereal_time : ~astropy.units.Quantity, optional
+        Angle of the prime meridian of the attractor at the sampling epochs.
+        Computed as the Greenwich mean sidereal time for the Earth,
+        required for any other attractor.
+    screening_margin : ~astropy.units.Quantity, optional
+        Local maxima of the sampled elevation whose parabolic estimate is below
+        the mask by more than this margin are not refined.
+    xtol : ~astropy.units.Quantity, optional
+        Absolute tolerance of the AOS and LOS times.
+    maxiter : int, optional
+        Maximum number of iterations of the root solver,
+        the AOS and LOS times that do not converge within them are masked.
+
+    Returns
+    -------
+    passes : ~astropy.table.QTable
+        Table with the ``satellite`` and ``station`` indices, ``aos``, ``los``
+        and maximum elevation ``tca`` epochs, ``max_elevation`` and ``duration``
+        of every pass, sorted by station, satellite and epoch.
+        Passes are clipped to the sampling interval.
+
+    Notes
+    -----
+    The sampling must be dense enough to resolve the motion of the satellites,
+    passes whose elevation above the mask peaks for less than a couple of sampling
+    steps might still be missed if they fall outside of the screening margin.
+
+    """
+    if isinstance(stations, SpheroidLocation):
+        stations = [stations]
+    if not isinstance(stations, SpheroidLocationArray):
+        stations = SpheroidLocationArray.from_locations(stations)
+
+    rr, vv, epochs = states_on_grid(states, epochs)
+
+    if sidereal_time is None:
+        if attractor is not Earth:
+            raise ValueError(
+                "sidereal_time must be given for attractors other than the Earth"
+            )
+        sidereal_time = epochs.utc.sidereal_time("mean", "greenwich")
+    theta_g = np.unwrap(sidereal_time.to_value(u.rad))
+
+    tt = (epochs - epochs[0]).to_value(u.s)
+    geometry = _PassGeometry(
+        attractor,
+        rr,
+        vv,
+        tt,
+        theta_g,
+        stations,
+        min_elevation.to_value(u.rad),
+    )
+    margin = screening_margin.to_value(u.rad)
+
+    tables = [
+        _passes_over_station(geometry, station, margin, xtol, maxiter)
+        for station in range(len(stations))
+    ]
+    tt_aos, tt_los, tt_max, el_max, sat, sta = (
+        np.concatenate(column) for column in zip(*tables)
+    )
+
+    return QTable(
+        {
+            "satellite": sat,
+            "station": sta,
+            "aos": epochs_from_offsets(epochs[0], tt_aos * u.s),
+            "los": epochs_from_offsets(epochs[0], tt_los * u.s),
+            "tca": epochs_from_offsets(epochs[0], tt_max * u.s),
+            "max_elevation": (el_max + geometry.min_el) * u.rad << u.deg,
+            "duration": (tt_los - tt_aos) * u.s,
+        }
+    )
+
+
+def _passes_over_station(geometry, station, margin, xtol, maxiter):
+    tt = geometry.tt
+    g = geometry.on_grid(station)
+
+    # Local maxima of the sampled elevation, screened with a parabolic estimate
+    g0, g1, g2 = g[:, :-2], g[:, 1:-1], g[:, 2:]
+    curvature = 2 * g1 - g0 - g2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        peak = np.where(
+            curvature > 0, g1 + (g0 - g2) ** 2 / (8 * curvature), g1
+        )
+    max_sat, max_i = np.nonzero((g1 >= g0) & (g1 > g2) & (peak > -margin))
+    max_i += 1
+
+    t_max, g_max = golden_section_many(
+        lambda t, idx: -geometry.at(t, max_sat[idx], station),
+        tt[max_i - 1],
+        tt[max_i + 1],
+    )
+    g_max = -g_max
+
+    # Brackets of the crossings: sign changes between samples,
+    # plus both sides of the maxima that rise above the mask between samples
+    inside = g > 0
+    changes = np.diff(inside.astype(int), axis=1)
+    cross_sat, cross_i = np.nonzero(changes)
+    missed = (g_max > 0) & ~inside[max_sat, max_i]
+
+    bracket_sat = np.concatenate((cross_sat, max_sat[missed], max_sat[missed]))
+    bracket_a = np.concatenate(
+        (tt[cross_i], tt[max_i[missed] - 1], t_max[missed])
+    )
+    bracket_b = np.concatenate(
+        (tt[cross_i + 1], t_max[missed], tt[max_i[missed] + 1])
+    )
+    is_aos = np.concatenate(
+        (
+            changes[cross_sat, cross_i] > 0,
+            np.ones(missed.sum(), dtype=bool),
+            np.zeros(missed.sum(), dtype=bool),
+        )
+    )
+
+    if bracket_sat.size:
+        t_cross, converged = brentq_many(
+            lambda t, idx: geometry.at(t, bracket_sat[idx], station),
+            bracket_a,
+            bracket_b,
+            xtol=xtol.to_value(u.s),
+            maxiter=maxiter,
+        )
+        t_cross[~converged] = np.nan
+    else:
+        t_cross = np.empty(0)
+
+    # Unconverged crossings are sorted by the start of their bracket
+    t_key = np.where(np.isnan(t_cross), bracket_a, t_cross)
+
+    # Passes that are open at the ends of the sampling interval are clipped
+    start_inside = np.flatnonzero(inside[:, 0])
+    end_inside = np.flatnonzero(inside[:, -1])
+
+    aos_sat = np.concatenate((bracket_sat[is_aos], start_inside))
+    aos_t = np.concatenate(
+        (t_cross[is_aos], np.full(start_inside.size, tt[0]))
+    )
+    los_sat = np.concatenate((bracket_sat[~is_aos], end_inside))
+    los_t = np.concatenate(
+        (t_cross[~is_aos], np.full(end_inside.size, tt[-1]))
+    )
+
+    aos_key = np.concatenate(
+        (t_key[is_aos], np.full(start_inside.size, tt[0]))
+    )
+    los_key = np.concatenate(
+        (t_key[~is_aos], np.full(end_inside.size, tt[-1]))
+    )
+
+    aos_order = np.lexsort((aos_key, aos_sat))
+    los_order = np.lexsort((los_key, los_sat))
+    pass_sat = aos_sat[aos_order]
+    aos_t, los_t = aos_t[aos_order], los_t[los_order]
+    aos_key = aos_key[aos_order]
+
+    # Maximum elevation of every pass, either at a refined local maximum
+    # or at one of the ends of a clipped pass
+    start_clipped = aos_t == tt[0]
+    end_clipped = los_t == tt[-1]
+    g_start = np.where(start_clipped, g[pass_sat, 0], -np.inf)
+    g_end = np.where(end_clipped, g[pass_sat, -1], -np.inf)
+    use_start = start_clipped & (g_start >= g_end)
+    use_end = end_clipped & ~use_start
+
+    el_max = np.where(use_start, g_start, np.where(use_end, g_end, 0.0))
+    tca_t = np.where(
+        use_start, tt[0], np.where(use_end, tt[-1], (aos_t + los_t) / 2)
+    )
+
+    span = tt[-1] - tt[0] + 1
+    above = g_max > 0
+    owner = (
+        np.searchsorted(
+            pass_sat * span + aos_key,
+            max_sat[above] * span + t_max[above],
+            side="right",
+        )
+        - 1
+    )
+    for p, sat, t, el in zip(
+        owner, max_sat[above], t_max[above], g_max[above]
+    ):
+        if p >= 0 and pass_sat[p] == sat and el > el_max[p]:
+            el_max[p], tca_t[p] = el, t
+
+    return (
+        aos_t,
+        los_t,
+        tca_t,
+        el_max,
+        pass_sat,
+        np.full(pass_sat.size, station),
+    )
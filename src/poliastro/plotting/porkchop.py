@@ -1,104 +1,14 @@
 """This is the implementation of porkchop plot."""
-from astropy import coordinates as coord, units as u
+from astropy import units as u
 from matplotlib import pyplot as plt
 import numpy as np
 
-from poliastro.bodies import (
-    Earth,
-    Jupiter,
-    Mars,
-    Mercury,
-    Moon,
-    Neptune,
-    Pluto,
-    Saturn,
-    Sun,
-    Uranus,
-    Venus,
-)
-from poliastro.maneuver import Maneuver
-from poliastro.twobody.orbit import Orbit
-from poliastro.util import norm
+from poliastro.porkchop import PorkchopGrid
 
 
-def _get_state(body, time):
-    """Computes the position of a body for a given time."""
-    solar_system_bodies = [
-        Sun,
-        Mercury,
-        Venus,
-        Earth,
-        Moon,
-        Mars,
-        Jupiter,
-        Saturn,
-        Uranus,
-        Neptune,
-        Pluto,
-    ]
-
-    # We check if body belongs to poliastro.bodies
-    if body in solar_system_bodies:
-        rr, vv = coord.get_body_barycentric_posvel(body.name, time)
-    else:
-        rr, vv = body.propagate(time).rv()
-        rr = coord.CartesianRepresentation(rr)
-        vv = coord.CartesianRepresentation(vv)
-
-    return rr.xyz, vv.xyz
-
-
-def _targetting(departure_body, target_body, t_launch, t_arrival):
-    """This function returns the increment in departure and arrival velocities."""
-    # Get position and velocities for departure and arrival
-    rr_dpt_body, vv_dpt_body = _get_state(departure_body, t_launch)
-    rr_arr_body, vv_arr_body = _get_state(target_body, t_arrival)
-
-    # Transform into Orbit objects
-    attractor = departure_body.parent
-    orb_dpt = Orbit.from_vectors(
-        attractor, rr_dpt_body, vv_dpt_body, epoch=t_launch
-    )
-    orb_arr = Orbit.from_vectors(
-        attractor, rr_arr_body, vv_arr_body, epoch=t_arrival
-    )
-
-    # Define time of flight
-    tof = orb_arr.epoch - orb_dpt.epoch
-
-    if tof.to_value(u.s) <= 0:
-        return None, None, None, None, None
-
-    try:
-        # Lambert is now a Maneuver object
-        man_lambert = Maneuver.lambert(orb_dpt, orb_arr)
-
-        # Get norm delta velocities
-        dv_dpt = norm(man_lambert.impulses[0][1])
-        dv_arr = norm(man_lambert.impulses[1][1])
-
-        # Compute all the output variables
-        c3_launch = dv_dpt**2
-        c3_arrival = dv_arr**2
-
-        return (
-            dv_dpt.to_value(u.km / u.s),
-            dv_arr.to_value(u.km / u.s),
-            c3_launch.to_value(u.km**2 / u.s**2),
-            c3_arrival.to_value(u.km**2 / u.s**2),
-            tof.jd,
-        )
-
-    except AssertionError:
-        return None, None, None, None, None
-
-
-# numpy.vectorize is amazing
-targetting_vec = np.vectorize(
-    _targetting,
-    otypes=[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray],
-    excluded=[0, 1],
-)
+def _same_dates(epochs, other):
+    epochs, other = epochs.reshape(-1), other.reshape(-1)
+    return len(epochs) == len(other) and bool(np.all(epochs == other))
 
 
 class PorkchopPlotter:
@@ -149,9 +59,20 @@ class PorkchopPlotter:
         self.max_c3 = max_c3
         self.max_vhp = max_vhp
 
-    def porkchop(self):
+    def porkchop(self, grid=None):
         """Plots porkchop between two bodies.
 
+        Parameters
+        ----------
+        grid : ~poliastro.porkchop.PorkchopGrid, optional
+            Precomputed transfers between the departure and target bodies over the
+            launch and arrival spans, which are computed if not given.
+
+        Raises
+        ------
+        ValueError
+            If the dates of the grid are not the launch and arrival spans.
+
         Returns
         -------
         dv_launch: numpy.ndarray
@@ -176,12 +97,26 @@ class PorkchopPlotter:
         >>> dv_launch, dev_dpt, c3dpt, c3arr, tof = porkchop_plot.porkchop()
 
         """
-        dv_launch, dv_arrival, c3_launch, c3_arrival, tof = targetting_vec(
-            self.departure_body,
-            self.target_body,
-            self.launch_span[np.newaxis, :],
-            self.arrival_span[:, np.newaxis],
-        )
+        if grid is None:
+            grid = PorkchopGrid(
+                self.departure_body,
+                self.target_body,
+                self.launch_span,
+                self.arrival_span,
+            )
+        elif not (
+            _same_dates(grid.launch_span, self.launch_span)
+            and _same_dates(grid.arrival_span, self.arrival_span)
+        ):
+            raise ValueError(
+                "The dates of the grid must be the launch and arrival spans"
+            )
+
+        dv_launch = grid.dv_launch.to_value(u.km / u.s)
+        dv_arrival = grid.dv_arrival.to_value(u.km / u.s)
+        c3_launch = grid.c3_launch.to_value(u.km**2 / u.s**2)
+        c3_arrival = grid.c3_arrival.to_value(u.km**2 / u.s**2)
+        tof = grid.tof.to_value(u.d)
 
         # Start drawing porkchop
 
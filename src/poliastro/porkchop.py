@@ -0,0 +1,483 @@
+"""Lambert transfers between two bodies on grids of launch and arrival dates.
+
+The computation does not depend on any plotting library, so that grids can be
+computed on headless servers, and plotted afterwards with
+:py:class:`~poliastro.plotting.porkchop.PorkchopPlotter`.
+
+"""
+from collections import namedtuple
+from functools import cached_property
+
+from astropy import units as u
+import numpy as np
+
+from poliastro.bodies import (
+    Earth,
+    Jupiter,
+    Mars,
+    Mercury,
+    Moon,
+    Neptune,
+    Pluto,
+    Saturn,
+    Sun,
+    Uranus,
+    Venus,
+)
+from poliastro.core.iod import izzo_grid as izzo_grid_fast
+from poliastro.ephem import ChebyshevEphem, Ephem, body_barycentric_posvel
+from poliastro.twobody.sampling import EpochsArray
+
+
+def get_body_states(body, time):
+    """Computes the positions and velocities of a body at the given times.
+
+    Parameters
+    ----------
+    body : ~poliastro.bodies.Body, ~poliastro.twobody.orbit.Orbit or ~poliastro.ephem.Ephem
+        Solar System body, whose states are barycentric, orbit or ephemerides.
+    time : ~astropy.time.Time
+        Epochs of the states.
+
+    Returns
+    -------
+    rr, vv : numpy.ndarray
+        Positions and velocities, with shape (n, 3), in km and km / s.
+
+    """
+    solar_system_bodies = [
+        Sun,
+        Mercury,
+        Venus,
+        Earth,
+        Moon,
+        Mars,
+        Jupiter,
+        Saturn,
+        Uranus,
+        Neptune,
+        Pluto,
+    ]
+
+    time = time.reshape(-1)
+
+    # We check if body belongs to poliastro.bodies
+    if isinstance(body, (Ephem, ChebyshevEphem)):
+        rr, vv = body.rv(time)
+    elif body in solar_system_bodies:
+        rr, vv = body_barycentric_posvel(body, time)
+        rr, vv = rr.xyz.T, vv.xyz.T
+    else:
+        rr, vv = body.to_ephem(EpochsArray(time)).rv()
+
+    return rr.to_value(u.km), vv.to_value(u.km / u.s)
+
+
+def _targetting_grid(
+    k,
+    rr_dpt,
+    vv_dpt,
+    rr_arr,
+    vv_arr,
+    tof,
+    *,
+    M=0,
+    prograde=True,
+    lowpath=True,
+    numiter=35,
+    rtol=1e-8,
+    warm_start=True,
+):
+    """Computes the velocity increments of the Lambert transfers on a grid of dates.
+
+    All the Lambert problems of the grid are solved in a single parallel call,
+    and direct transfers are warm started from the transfer with the previous
+    launch date if ``warm_start`` is True.
+
+    Parameters
+    ----------
+    k : float
+        Gravitational parameter of the attractor, in km3 / s2.
+    rr_dpt, vv_dpt : numpy.ndarray
+        Positions and velocities of the departure body at the launch dates,
+        with shape (n, 3), in km and km / s.
+    rr_arr, vv_arr : numpy.ndarray
+        Positions and velocities of the target body at the arrival dates,
+        with shape (m, 3), in km and km / s.
+    tof : numpy.ndarray
+        Times of flight, with shape (m, n), in seconds.
+
+    Returns
+    -------
+    dv_dpt, dv_arr : numpy.ndarray
+        Norm of the departure and arrival velocity increments, with shape (m, n),
+        in km / s. They are NaN for transfers with non positive time of flight
+        or for which the Lambert problem has no solution.
+
+    """
+    v1, v2, _, _ = izzo_grid_fast(
+        k,
+        np.ascontiguousarray(rr_dpt, dtype=float),
+        np.ascontiguousarray(rr_arr, dtype=float),
+        np.ascontiguousarray(tof, dtype=float),
+        M,
+        prograde,
+        lowpath,
+        numiter,
+        rtol,
+        warm_start,
+    )
+
+    dv_dpt = np.linalg.norm(v1 - vv_dpt[np.newaxis], axis=-1)
+    dv_arr = np.linalg.norm(vv_arr[:, np.newaxis] - v2, axis=-1)
+    return dv_dpt, dv_arr
+
+
+def _max_revs(k, rr_dpt, rr_arr, tof):
+    """Upper bound of the number of full revolutions of the transfers of a grid."""
+    r1 = np.linalg.norm(rr_dpt, axis=-1)[np.newaxis]
+    r2 = np.linalg.norm(rr_arr, axis=-1)[:, np.newaxis]
+    c = np.linalg.norm(rr_arr[:, np.newaxis] - rr_dpt[np.newaxis], axis=-1)
+    s = (r1 + r2 + c) * 0.5
+    # Non dimensional times of flight, as in the Izzo algorithm
+    T = np.sqrt(2 * k / s**3) * np.where(tof > 0, tof, 0)
+    return int(np.floor(T.max() / np.pi))
+
+
+def _local_minima(cost):
+    """Indices of the cells whose cost is not greater than that of any neighbour."""
+    cost = np.where(np.isnan(cost), np.inf, cost)
+    padded = np.pad(cost, 1, constant_values=np.inf)
+    neighbours = np.lib.stride_tricks.sliding_window_view(padded, (3, 3))
+    minima = np.isfinite(cost) & (cost <= neighbours.min(axis=(-2, -1)))
+    ii, jj = np.nonzero(minima)
+    order = np.argsort(cost[ii, jj], kind="stable")
+    return list(zip(ii[order], jj[order]))
+
+
+LaunchWindow = namedtuple(
+    "LaunchWindow", ["launch", "arrival", "cost", "revs", "lowpath"]
+)
+LaunchWindow.__doc__ = """Optimal transfer found around a local minimum of a porkchop grid.
+
+Parameters
+----------
+launch : ~astropy.time.Time
+    Launch date.
+arrival : ~astropy.time.Time
+    Arrival date.
+cost : ~astropy.units.Quantity
+    Cost of the transfer, see :py:class:`PorkchopGrid`.
+revs : int
+    Number of full revolutions of the transfer.
+lowpath : bool
+    Whether the vacant focus of the transfer is below the chord line.
+
+"""
+
+
+class PorkchopGrid:
+    """Lambert transfers between two bodies on a grid of launch and arrival dates.
+
+    The states of the departure and target bodies are sampled once per date when
+    the grid is created, and all the transfers are solved in a single parallel
+    call the first time that any result is accessed. Results are arrays with shape
+    (len(arrival_span), len(launch_span)), and they are NaN for the transfers with
+    non positive time of flight or without solution.
+
+    Parameters
+    ----------
+    departure_body : ~poliastro.bodies.Body, ~poliastro.twobody.orbit.Orbit or ~poliastro.ephem.Ephem
+        Body from which departure is done. Ephemerides, including
+        :py:class:`~poliastro.ephem.ChebyshevEphem`, are sampled as they are,
+        so they must be given around the attractor of the transfers.
+    target_body : ~poliastro.bodies.Body, ~poliastro.twobody.orbit.Orbit or ~poliastro.ephem.Ephem
+        Body for targetting.
+    launch_span : ~astropy.time.Time
+        Launch dates.
+    arrival_span : ~astropy.time.Time
+        Arrival dates.
+    attractor : ~poliastro.bodies.Body, optional
+        Main attractor of the transfers. If not given, the parent of the departure
+        body or the attractor of the departure orbit is used.
+    M : int, optional
+        Number of full revolutions, default to 0.
+    prograde : bool, optional
+        Whether the transfers are prograde, default to True.
+    lowpath : bool, optional
+        Whether the vacant focus of the transfers is below the chord line,
+        default to True.
+    numiter : int, optional
+        Maximum number of iterations, default to 35.
+    rtol : float, optional
+        Relative tolerance of the algorithm, default to 1e-8.
+    max_revs : int, optional
+        If given, all the feasible numbers of full revolutions up to this one and,
+        for multiple revolutions, both branches are evaluated in every cell,
+        keeping the transfer with minimum cost. ``M`` and ``lowpath`` are then
+        ignored. Pass ``numpy.inf`` to evaluate every feasible number of revolutions.
+    cost : str, optional
+        Cost that the transfers minimize, either ``"launch"``, ``"arrival"`` or
+        ``"total"`` velocity increment, default to ``"total"``.
+    warm_start : bool, optional
+        Whether to start the iterations of every direct transfer from the solution
+        with the previous launch date, default to True.
+
+    Examples
+    --------
+    >>> from poliastro.bodies import Earth, Mars
+    >>> from poliastro.porkchop import PorkchopGrid
+    >>> from poliastro.util import time_range
+    >>> launch_span = time_range("2005-04-30", end="2005-10-07")
+    >>> arrival_span = time_range("2005-11-16", end="2006-12-21")
+    >>> grid = PorkchopGrid(Earth, Mars, launch_span, arrival_span)
+    >>> c3_launch = grid.c3_launch
+
+    """
+
+    def __init__(
+        self,
+        departure_body,
+        target_body,
+        launch_span,
+        arrival_span,
+        *,
+        attractor=None,
+        M=0,
+        prograde=True,
+        lowpath=True,
+        numiter=35,
+        rtol=1e-8,
+        max_revs=None,
+        cost="total",
+        warm_start=True,
+    ):
+        if cost not in ("launch", "arrival", "total"):
+            raise ValueError(
+                f"Cost must be 'launch', 'arrival' or 'total', got {cost!r}"
+            )
+
+        if attractor is None:
+            if hasattr(departure_body, "attractor"):
+                attractor = departure_body.attractor
+            elif getattr(departure_body, "parent", None) is not None:
+                attractor = departure_body.parent
+            else:
+                raise ValueError(
+                    "The attractor must be given for departure ephemerides"
+                )
+
+        self.departure_body = departure_body
+        self.target_body = target_body
+        self.launch_span = launch_span.reshape(-1)
+        self.arrival_span = arrival_span.reshape(-1)
+        self.attractor = attractor
+        self._lambert_kwargs = {
+            "M": M,
+            "prograde": prograde,
+            "lowpath": lowpath,
+            "numiter": numiter,
+            "rtol": rtol,
+            "warm_start": warm_start,
+        }
+        self.max_revs = max_revs
+        self.cost_type = cost
+
+        self._rr_dpt, self._vv_dpt = get_body_states(
+            departure_body, self.launch_span
+        )
+        self._rr_arr, self._vv_arr = get_body_states(
+            target_body, self.arrival_span
+        )
+
+    def _cost(self, dv_launch, dv_arrival):
+        if self.cost_type == "launch":
+            return dv_launch
+        elif self.cost_type == "arrival":
+            return dv_arrival
+        return dv_launch + dv_arrival
+
+    @cached_property
+    def _solution(self):
+        k = self.attractor.k.to_value(u.km**3 / u.s**2)
+        tof = (
+            self.arrival_span[:, np.newaxis] - self.launch_span[np.newaxis, :]
+        ).to_value(u.s)
+        states = (self._rr_dpt, self._vv_dpt, self._rr_arr, self._vv_arr)
+        lambert_kwargs = self._lambert_kwargs.copy()
+
+        if self.max_revs is None:
+            branches = [
+                (lambert_kwargs.pop("M"), lambert_kwargs.pop("lowpath"))
+            ]
+        else:
+            del lambert_kwargs["M"], lambert_kwargs["lowpath"]
+            max_revs = min(self.max_revs, _max_revs(k, *states[::2], tof))
+            # Both branches coincide for direct transfers
+            branches = [(0, True)] + [
+                (M, lowpath)
+                for M in range(1, max_revs + 1)
+                for lowpath in (True, False)
+            ]
+
+        dv_launch = np.full(tof.shape, np.nan)
+        dv_arrival = np.full(tof.shape, np.nan)
+        best = np.full(tof.shape, np.inf)
+        revs = np.full(tof.shape, -1)
+        lowpath = np.zeros(tof.shape, dtype=bool)
+        for M, branch_lowpath in branches:
+            dv_dpt, dv_arr = _targetting_grid(
+                k,
+                *states,
+                tof,
+                M=M,
+                lowpath=branch_lowpath,
+                **lambert_kwargs,
+            )
+            cost = self._cost(dv_dpt, dv_arr)
+            better = cost < best
+            best[better] = cost[better]
+            dv_launch[better] = dv_dpt[better]
+            dv_arrival[better] = dv_arr[better]
+            revs[better] = M
+            lowpath[better] = branch_lowpath
+
+        tof = np.where(np.isnan(dv_launch), np.nan, tof)
+        return dv_launch, dv_arrival, tof, revs, lowpath
+
+    @property
+    def dv_launch(self):
+        """Launch velocity increment, this is, hyperbolic excess velocity."""
+        return self._solution[0] * (u.km / u.s)
+
+    @property
+    def dv_arrival(self):
+        """Arrival velocity increment, this is, hyperbolic excess velocity."""
+        return self._solution[1] * (u.km / u.s)
+
+    @property
+    def c3_launch(self):
+        """Characteristic launch energy."""
+        return self._solution[0] ** 2 * (u.km**2 / u.s**2)
+
+    @property
+    def c3_arrival(self):
+        """Characteristic arrival energy."""
+        return self._solution[1] ** 2 * (u.km**2 / u.s**2)
+
+    @property
+    def tof(self):
+        """Time of flight of every transfer."""
+        return (self._solution[2] * u.s).to(u.d)
+
+    @property
+    def cost(self):
+        """Cost of every transfer."""
+        return self._cost(self.dv_launch, self.dv_arrival)
+
+    @property
+    def revs(self):
+        """Number of full revolutions of every transfer, -1 if there is none."""
+        return self._solution[3]
+
+    @property
+    def lowpath(self):
+        """Whether the vacant focus of every transfer is below the chord line."""
+        return self._solution[4]
+
+    def local_minima(self):
+        """Indices of the cells with locally minimum cost, sorted by cost.
+
+        Returns
+        -------
+        minima : list
+            Pairs of indices of the arrival and launch dates of every local minimum.
+
+        """
+        return _local_minima(self._cost(*self._solution[:2]))
+
+    def refine(self, i, j, *, num_values=9):
+        """Computes a finer grid around a cell.
+
+        The new grid spans the dates of the neighbouring cells,
+        and it evaluates the transfers with the same options.
+
+        Parameters
+        ----------
+        i : int
+            Index of the arrival date of the cell.
+        j : int
+            Index of the launch date of the cell.
+        num_values : int, optional
+            Number of launch and arrival dates of the new grid, default to 9.
+
+        """
+
+        def _span(span, idx):
+            start = span[max(idx - 1, 0)]
+            end = span[min(idx + 1, len(span) - 1)]
+            return start + (end - start) * np.linspace(0, 1, num_values)
+
+        return PorkchopGrid(
+            self.departure_body,
+            self.target_body,
+            _span(self.launch_span, j),
+            _span(self.arrival_span, i),
+            attractor=self.attractor,
+            max_revs=self.max_revs,
+            cost=self.cost_type,
+            **self._lambert_kwargs,
+        )
+
+
+def find_launch_windows(grid, *, levels=3, num_values=9, max_windows=5):
+    """Finds the optimal transfers around the local minima of a porkchop grid.
+
+    Instead of evaluating a dense grid, the best local minima of a coarse grid
+    are refined with successive finer patches around them.
+
+    Parameters
+    ----------
+    grid : PorkchopGrid
+        Coarse grid.
+    levels : int, optional
+        Number of refinements, default to 3.
+    num_values : int, optional
+        Number of launch and arrival dates of every patch, default to 9.
+    max_windows : int, optional
+        Maximum number of local minima to refine, default to 5.
+
+    Returns
+    -------
+    windows : list
+        :py:class:`LaunchWindow` of every local minimum, sorted by cost.
+
+    Notes
+    -----
+    Every refinement shrinks the spacing of the dates by a factor of
+    ``(num_values - 1) / 2``, at the cost of evaluating ``num_values ** 2``
+    transfers per window.
+
+    """
+    patches = [(grid, idx) for idx in grid.local_minima()[:max_windows]]
+    for _ in range(levels):
+        refined = []
+        for patch, (i, j) in patches:
+            new_patch = patch.refine(i, j, num_values=num_values)
+            minima = new_patch.local_minima()
+            refined.append(
+                (new_patch, minima[0]) if minima else (patch, (i, j))
+            )
+        patches = refined
+
+    windows = [
+        LaunchWindow(
+            patch.launch_span[j],
+            patch.arrival_span[i],
+            patch.cost[i, j],
+            int(patch.revs[i, j]),
+            bool(patch.lowpath[i, j]),
+        )
+        for patch, (i, j) in patches
+    ]
+    return sorted(windows, key=lambda window: window.cost)
@@ -0,0 +1,233 @@
+"""Local store of the responses of remote queries.
+
+Functions querying remote services, such as
+:py:meth:`~poliastro.ephem.Ephem.from_horizons` or
+:py:func:`~poliastro.io.orbit_from_sbdb`, look up their responses in the active
+query cache before issuing any request, so that repeated runs do not depend on
+the network. The cache is disabled by default, and it can be enabled with
+:py:func:`set_query_cache`::
+
+    from poliastro.query_cache import QueryCache, set_query_cache
+
+    set_query_cache(QueryCache("~/.poliastro/queries"))
+
+A cache in replay only mode never issues requests, and raises an error for any
+query that was not stored before, which makes it suitable for machines without
+network access once the responses have been prefetched elsewhere.
+
+"""
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+import threading
+
+import numpy as np
+
+__all__ = [
+    "QueryCache",
+    "get_query_cache",
+    "set_query_cache",
+    "cached_query",
+]
+
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot use {type(value).__name__} as a query parameter")
+
+
+class QueryCache:
+    """Store of query responses, keyed by the service and the query parameters.
+
+    Responses are kept in memory, and stored on disk as pickle files if a
+    directory is given. Subclasses can use other stores by overriding
+    :py:meth:`load` and :py:meth:`store`.
+
+    Parameters
+    ----------
+    directory : str or ~pathlib.Path, optional
+        Directory of the on disk store, if not given responses are only kept in memory.
+    replay_only : bool, optional
+        If True, queries missing from the cache raise an error instead of being issued.
+
+    Notes
+    -----
+    Pickle files can execute arbitrary code when loaded,
+    so the directory must only be writable by trusted users.
+
+    """
+
+    def __init__(self, directory=None, *, replay_only=False):
+        self.directory = (
+            None if directory is None else Path(directory).expanduser()
+        )
+        self.replay_only = replay_only
+        self._responses = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(service, params):
+        """Key of a query.
+
+        Parameters
+        ----------
+        service : str
+            Name of the remote service.
+        params : dict
+            Parameters of the query, which must be serializable as JSON.
+            NumPy arrays are converted to lists.
+
+        """
+        payload = json.dumps(
+            [service, params], sort_keys=True, default=_to_json
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key):
+        return self.directory / f"{key}.pkl"
+
+    def load(self, key):
+        """Returns the stored response of a query, or None if it is missing."""
+        with self._lock:
+            if key in self._responses:
+                return self._responses[key]
+
+        if self.directory is not None and self._path(key).exists():
+            with open(self._path(key), "rb") as fh:
+                response = pickle.load(fh)
+            with self._lock:
+                self._responses[key] = response
+            return response
+
+        return None
+
+    def store(self, key, response):
+        """Stores the response of a query."""
+        with self._lock:
+            self._responses[key] = response
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, so that concurrent
+            # readers never see a partially written response
+            tmp_path = self._path(key).with_suffix(
+                f".{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            with open(tmp_path, "wb") as fh:
+                pickle.dump(response, fh)
+            os.replace(tmp_path, self._path(key))
+
+    def __contains__(self, key):
+        return self.load(key) is not None
+
+    def query(self, service, params, fetch):
+        """Returns the response of a query, issuing it only if it is not stored.
+
+        Parameters
+        ----------
+        service : str
+            Name of the remote service.
+        params : dict
+            Parameters of the query, see :py:meth:`key`.
+        fetch : callable
+            Function without arguments issuing the query and returning its response.
+
+        """
+        key = self.key(service, params)
+        response = self.load(key)
+        if response is None:
+            if self.replay_only:
+                raise ValueError(
+                    f"Query to {service} with parameters {params} "
+                    "is not stored and the cache is in replay only mode"
+                )
+            response = fetch()
+            self.store(key, response)
+
+        return response
+
+    def prefetch(self, service, params_list, fetch, *, max_workers=8):
+        """Issues the missing queries of a batch concurrently and stores the responses.
+
+        Queries of the batch with the same key are issued only once.
+
+        Parameters
+        ----------
+        service : str
+            Name of the remote service.
+        params_list : list
+            Parameters of every query, see :py:meth:`key`.
+        fetch : callable
+            Function issuing a query, which receives its parameters as keyword arguments.
+        max_workers : int, optional
+            Maximum number of concurrent queries, defaults to 8.
+
+        Returns
+        -------
+        responses : list
+            Responses of the queries, in the same order as the parameters.
+
+        """
+        # Repeated queries of the batch are issued only once
+        keys = [self.key(service, params) for params in params_list]
+        unique = dict(zip(keys, params_list))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                key: executor.submit(
+                    self.query, service, params, lambda p=params: fetch(**p)
+                )
+                for key, params in unique.items()
+            }
+            return [futures[key].result() for key in keys]
+
+
+_query_cache = None
+
+
+def get_query_cache():
+    """Returns the active query cache, or None if queries are not cached."""
+    return _query_cache
+
+
+def set_query_cache(cache):
+    """Sets the active query cache.
+
+    Parameters
+    ----------
+    cache : QueryCache or None
+        Query cache to use, or None to disable caching.
+
+    Returns
+    -------
+    previous : QueryCache or None
+        Query cache that was active before.
+
+    """
+    global _query_cache
+    previous, _query_cache = _query_cache, cache
+    return previous
+
+
+def cached_query(service, params, fetch):
+    """Returns the response of a query through the active query cache, if any.
+
+    Parameters
+    ----------
+    service : str
+        Name of the remote service.
+    params : dict
+        Parameters of the query, see :py:meth:`QueryCache.key`.
+    fetch : callable
+        Function issuing the query, which receives its parameters as keyword arguments.
+
+    """
+    if _query_cache is None:
+        return fetch(**params)
+    return _query_cache.query(service, params, lambda: fetch(**params))
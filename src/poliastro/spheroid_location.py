@@ -3,11 +3,16 @@ import numpy as np
 
 from poliastro.core.spheroid_location import (
     N as N_fast,
+    N_many as N_many_fast,
     cartesian_cords as cartesian_cords_fast,
+    cartesian_cords_many as cartesian_cords_many_fast,
     cartesian_to_ellipsoidal as cartesian_to_ellipsoidal_fast,
+    cartesian_to_ellipsoidal_many as cartesian_to_ellipsoidal_many_fast,
     distance as distance_fast,
+    distance_many as distance_many_fast,
     f as f_fast,
     is_visible as is_visible_fast,
+    is_visible_many as is_visible_many_fast,
     radius_of_curvature as radius_of_curvature_fast,
     tangential_vecs as tangential_vecs_fast,
 )
@@ -32,10 +37,26 @@ class SpheroidLocation:
         self._lon = lon
         self._lat = lat
         self._h = h
+        self._body = body
         self._a = body.R
         self._b = body.R
         self._c = body.R_polar
 
+    @property
+    def lon(self):
+        """Geodetic longitude."""
+        return self._lon
+
+    @property
+    def lat(self):
+        """Geodetic latitude."""
+        return self._lat
+
+    @property
+    def h(self):
+        """Geodetic height."""
+        return self._h
+
     @property
     def cartesian_cords(self):
         """Convert to the Cartesian Coordinate system."""
@@ -153,3 +174,228 @@ class SpheroidLocation:
         x, y, z = x.to_value(u.m), y.to_value(u.m), z.to_value(u.m)
         lon, lat, h = cartesian_to_ellipsoidal_fast(_a, _c, x, y, z)
         return lon * u.rad, lat * u.rad, h * u.m
+
+
+def _points_to_array(px, py, pz):
+    return np.ascontiguousarray(
+        np.column_stack(
+            [
+                np.atleast_1d(coord.to_value(u.m)).astype(float)
+                for coord in (px, py, pz)
+            ]
+        )
+    )
+
+
+class SpheroidLocationArray:
+    """Class representing a set of ground stations on an oblate ellipsoid.
+
+    Cartesian coordinates and normal vectors of all the locations
+    are computed once, so that visibility and distances to many points
+    can be evaluated in bulk.
+
+    """
+
+    def __init__(self, lon, lat, h, body):
+        """Parameters
+        ----------
+        lon : ~astropy.units.quantity.Quantity
+            Geodetic longitudes
+        lat : ~astropy.units.quantity.Quantity
+            Geodetic latitudes
+        h : ~astropy.units.quantity.Quantity
+            Geodetic heights
+        body : ~poliastro.bodies.Body
+            Planetary body the spheroid locations lie on
+
+        """
+        lon, lat, h = np.broadcast_arrays(lon, lat, h, subok=True)
+        if lon.ndim != 1:
+            raise ValueError(
+                f"Coordinates must have dimension 1, got {lon.ndim}"
+            )
+
+        self._lon = lon
+        self._lat = lat
+        self._h = h
+        self._body = body
+        self._a = body.R
+        self._b = body.R
+        self._c = body.R_polar
+
+        self._cartesian_cords = cartesian_cords_many_fast(
+            self._a.to_value(u.m),
+            self._c.to_value(u.m),
+            np.ascontiguousarray(self._lon.to_value(u.rad), dtype=float),
+            np.ascontiguousarray(self._lat.to_value(u.rad), dtype=float),
+            np.ascontiguousarray(self._h.to_value(u.m), dtype=float),
+        )
+        self._N = N_many_fast(
+            self._a.to_value(u.m),
+            self._b.to_value(u.m),
+            self._c.to_value(u.m),
+            self._cartesian_cords,
+        )
+
+    @classmethod
+    def from_locations(cls, locations):
+        """Creates a set of locations from a list of `SpheroidLocation` on the same body.
+
+        Parameters
+        ----------
+        locations : list
+            List of `SpheroidLocation`.
+
+        """
+        body = locations[0]._body
+        if any(location._body is not body for location in locations):
+            raise ValueError("All locations must lie on the same body")
+
+        lon, lat, h = (
+            u.Quantity([getattr(location, attr) for location in locations])
+            for attr in ("lon", "lat", "h")
+        )
+        return cls(lon, lat, h, body)
+
+    @classmethod
+    def from_grid(cls, lon, lat, h, body):
+        """Creates a set of locations from the cartesian product of longitudes and latitudes.
+
+        Parameters
+        ----------
+        lon : ~astropy.units.quantity.Quantity
+            Geodetic longitudes of the grid
+        lat : ~astropy.units.quantity.Quantity
+            Geodetic latitudes of the grid
+        h : ~astropy.units.quantity.Quantity
+            Geodetic height of all the locations
+        body : ~poliastro.bodies.Body
+            Planetary body the spheroid locations lie on
+
+        Notes
+        -----
+        Locations are ordered with the longitude varying fastest.
+
+        """
+        lon_grid, lat_grid = np.meshgrid(lon, lat)
+        return cls(lon_grid.ravel(), lat_grid.ravel(), h, body)
+
+    def __len__(self):
+        return len(self._lon)
+
+    def __getitem__(self, index):
+        if np.ndim(index) == 0:
+            return SpheroidLocation(
+                self._lon[index], self._lat[index], self._h[index], self._body
+            )
+
+        return SpheroidLocationArray(
+            self._lon[index], self._lat[index], self._h[index], self._body
+        )
+
+    @property
+    def lon(self):
+        """Geodetic longitudes."""
+        return self._lon
+
+    @property
+    def lat(self):
+        """Geodetic latitudes."""
+        return self._lat
+
+    @property
+    def h(self):
+        """Geodetic heights."""
+        return self._h
+
+    @property
+    def cartesian_cords(self):
+        """Cartesian coordinates of the locations, with shape (n, 3)."""
+        return self._cartesian_cords * u.m
+
+    @property
+    def f(self):
+        """Get first flattening."""
+        _a, _c = self._a.to_value(u.m), self._c.to_value(u.m)
+        return f_fast(_a, _c)
+
+    @property
+    def N(self):
+        """Normal vectors of the ellipsoid at the locations, with shape (n, 3)."""
+        return self._N
+
+    @property
+    def radius_of_curvature(self):
+        """Radius of curvature of the meridian at the latitudes of the locations."""
+        _a, _c, _lat = (
+            self._a.to_value(u.m),
+            self._c.to_value(u.m),
+            self._lat.to_value(u.rad),
+        )
+        return radius_of_curvature_fast(_a, _c, _lat) * u.m
+
+    def distance(self, px, py, pz):
+        """Calculates the distances from arbitrary points to every location.
+
+        Parameters
+        ----------
+        px : ~astropy.units.quantity.Quantity
+            x-coordinates of the points
+        py : ~astropy.units.quantity.Quantity
+            y-coordinates of the points
+        pz : ~astropy.units.quantity.Quantity
+            z-coordinates of the points
+
+        Returns
+        -------
+        distance : ~astropy.units.quantity.Quantity
+            Distances, with shape (number of locations, number of points).
+
+        """
+        points = _points_to_array(px, py, pz)
+        return distance_many_fast(self._cartesian_cords, points) * u.m
+
+    def is_visible(self, px, py, pz):
+        """Determines whether objects located at given points are visible from every location.
+
+        Parameters
+        ----------
+        px : ~astropy.units.quantity.Quantity
+            x-coordinates of the points
+        py : ~astropy.units.quantity.Quantity
+            y-coordinates of the points
+        pz : ~astropy.units.quantity.Quantity
+            z-coordinates of the points
+
+        Returns
+        -------
+        visible : numpy.ndarray
+            Boolean array with shape (number of locations, number of points).
+
+        """
+        points = _points_to_array(px, py, pz)
+        return is_visible_many_fast(self._cartesian_cords, points, self._N)
+
+    def cartesian_to_ellipsoidal(self, x, y, z):
+        """Converts cartesian coordinates to ellipsoidal coordinates for this ellipsoid.
+
+        Parameters
+        ----------
+        x : ~astropy.units.quantity.Quantity
+            x-coordinates
+        y : ~astropy.units.quantity.Quantity
+            y-coordinates
+        z : ~astropy.units.quantity.Quantity
+            z-coordinates
+
+        """
+        _a, _c = self._a.to_value(u.m), self._c.to_value(u.m)
+        x, y, z = _points_to_array(x, y, z).T
+        lon, lat, h = cartesian_to_ellipsoidal_many_fast(
+            _a,
+            _c,
+            np.ascontiguousarray(x),
+            np.ascontiguousarray(y),
+            np.ascontiguousarray(z),
+        )
+        return lon * u.rad, lat * u.rad, h * u.m
@@ -1,17 +1,42 @@
 from warnings import warn
 
 from astropy import units as u
-from astropy.coordinates import get_body_barycentric_posvel
+from astropy.table import QTable
 import numpy as np
 
+from poliastro._math.interpolate import hermite_interp_at, hermite_segments
 from poliastro._math.linalg import norm
+from poliastro._math.optimize import brentq_many
 from poliastro.core.events import (
-    eclipse_function as eclipse_function_fast,
-    line_of_sight as line_of_sight_fast,
+    eclipse_function_tabulated as eclipse_function_tabulated_fast,
+    eclipse_function_tabulated_many as eclipse_function_tabulated_many_fast,
+    line_of_sight_tabulated as line_of_sight_tabulated_fast,
+    line_of_sight_tabulated_many as line_of_sight_tabulated_many_fast,
+    shadow_function_many as shadow_function_many_fast,
 )
 from poliastro.core.spheroid_location import (
     cartesian_to_ellipsoidal as cartesian_to_ellipsoidal_fast,
+    cartesian_to_ellipsoidal_many as cartesian_to_ellipsoidal_many_fast,
 )
+from poliastro.ephem import Ephem, body_barycentric_posvel, states_on_grid
+from poliastro.util import epochs_from_offsets
+
+
+def _secondary_body_vectors(primary_body, secondary_body, epochs):
+    # Solve for primary and secondary bodies position w.r.t. solar system
+    # barycenter at the given epochs, and return the ones of the secondary
+    # w.r.t. the primary with shape (len(epochs), 3) in km and km / s.
+    (r_primary_wrt_ssb, v_primary_wrt_ssb), (
+        r_secondary_wrt_ssb,
+        v_secondary_wrt_ssb,
+    ) = (
+        body_barycentric_posvel(body, epochs)
+        for body in (primary_body, secondary_body)
+    )
+    rr_sec = (r_secondary_wrt_ssb - r_primary_wrt_ssb).xyz.to_value(u.km)
+    vv_sec = (v_secondary_wrt_ssb - v_primary_wrt_ssb).xyz.to_value(u.km / u.s)
+
+    return rr_sec.T, vv_sec.T
 
 
 class Event:
@@ -45,6 +70,24 @@ class Event:
     def __call__(self, t, u, k):
         raise NotImplementedError
 
+    def many(self, tt, uu, k):
+        """Evaluates the event function at many instants at once.
+
+        This implementation calls the event function once per instant,
+        events override it with vectorized versions when they can.
+
+        Parameters
+        ----------
+        tt : numpy.ndarray
+            Times since the reference epoch (s), with shape (n,).
+        uu : numpy.ndarray
+            Position and velocity vectors (km, km / s), with shape (n, 6).
+        k : float
+            Standard gravitational parameter (km^3 / s^2).
+
+        """
+        return np.array([self(t, u_, k) for t, u_ in zip(tt, uu)])
+
 
 class AltitudeCrossEvent(Event):
     """Detect if a satellite crosses a specific threshold altitude.
@@ -77,6 +120,9 @@ class AltitudeCrossEvent(Event):
             r_norm - self._R - self._alt
         )  # If this goes from +ve to -ve, altitude is decreasing.
 
+    def many(self, tt, uu, k):
+        return np.linalg.norm(uu[:, :3], axis=1) - self._R - self._alt
+
 
 class LithobrakeEvent(AltitudeCrossEvent):
     """Terminal event that detects impact with the attractor surface.
@@ -128,10 +174,22 @@ class LatitudeCrossEvent(Event):
 
         return np.rad2deg(lat_) - self._lat
 
+    def many(self, tt, uu, k):
+        rr = uu[:, :3] / np.linalg.norm(uu[:, :3], axis=1)[:, None] * self._R
+        _, lat, _ = cartesian_to_ellipsoidal_many_fast(
+            self._R, self._R_polar, rr[:, 0], rr[:, 1], rr[:, 2]
+        )
+
+        return np.rad2deg(lat) - self._lat
+
 
 class EclipseEvent(Event):
     """Base class for the eclipse event.
 
+    The position of the secondary body with respect to the primary one
+    is sampled with Astropy on a regular grid of epochs, which is extended
+    in blocks as the integration advances, and interpolated in between.
+
     Parameters
     ----------
     orbit: poliastro.twobody.orbit.Orbit
@@ -140,10 +198,26 @@ class EclipseEvent(Event):
         Whether to terminate integration when the event occurs, defaults to False.
     direction: float, optional
         Specify which direction must the event trigger, defaults to 0.
+    step: ~astropy.units.Quantity, optional
+        Sampling step of the position of the secondary body, defaults to 1 hour.
+    span: ~astropy.units.Quantity, optional
+        Expected time span of the integration. If given, the position of the secondary
+        body is sampled over the whole span at once.
 
     """
 
-    def __init__(self, orbit, terminal=False, direction=0):
+    # Number of samples added every time the grid needs to be extended.
+    _BLOCK_SIZE = 64
+
+    def __init__(
+        self,
+        orbit,
+        terminal=False,
+        direction=0,
+        *,
+        step=1 * u.h,
+        span=None,
+    ):
         super().__init__(terminal, direction)
         self._primary_body = orbit.attractor
         self._secondary_body = orbit.attractor.parent
@@ -152,14 +226,83 @@ class EclipseEvent(Event):
         self.R_sec = self._secondary_body.R.to_value(u.km)
         self.R_primary = self._primary_body.R.to_value(u.km)
 
-    def __call__(self, t, u_, k):
-        # Solve for primary and secondary bodies position w.r.t. solar system
-        # barycenter at a particular epoch.
-        (r_primary_wrt_ssb, _), (r_secondary_wrt_ssb, _) = (
-            get_body_barycentric_posvel(body.name, self._epoch + t * u.s)
-            for body in (self._primary_body, self._secondary_body)
+        self._step = step.to_value(u.s)
+        self._tt = np.empty(0)
+        self._rr_sec = np.empty((0, 3))
+        self._vv_sec = np.empty((0, 3))
+
+        if span is not None:
+            self._ensure_sampled(0.0)
+            self._ensure_sampled(span.to_value(u.s))
+
+    def _sample_secondary(self, tt):
+        return _secondary_body_vectors(
+            self._primary_body, self._secondary_body, self._epoch + tt * u.s
         )
-        r_sec = ((r_secondary_wrt_ssb - r_primary_wrt_ssb).xyz << u.km).value
+
+    def _ensure_sampled(self, t):
+        if self._tt.size and self._tt[0] <= t <= self._tt[-1]:
+            return
+
+        # Samples are located at integer multiples of the step,
+        # so that the grid can grow in both directions
+        i_t = int(np.floor(t / self._step))
+        if not self._tt.size:
+            ii = np.arange(i_t, i_t + self._BLOCK_SIZE + 1)
+        elif t < self._tt[0]:
+            i_first = int(round(self._tt[0] / self._step))
+            ii = np.arange(min(i_t, i_first - self._BLOCK_SIZE), i_first)
+        else:
+            i_last = int(round(self._tt[-1] / self._step))
+            ii = np.arange(
+                i_last + 1, max(i_t + 1, i_last + self._BLOCK_SIZE) + 1
+            )
+
+        tt = ii * self._step
+        rr_sec, vv_sec = self._sample_secondary(tt)
+
+        if not self._tt.size or tt[0] > self._tt[-1]:
+            self._tt = np.concatenate((self._tt, tt))
+            self._rr_sec = np.concatenate((self._rr_sec, rr_sec))
+            self._vv_sec = np.concatenate((self._vv_sec, vv_sec))
+        else:
+            self._tt = np.concatenate((tt, self._tt))
+            self._rr_sec = np.concatenate((rr_sec, self._rr_sec))
+            self._vv_sec = np.concatenate((vv_sec, self._vv_sec))
+
+    def _shadow_function(self, t, u_, umbra):
+        self._ensure_sampled(t)
+        return eclipse_function_tabulated_fast(
+            self.k,
+            u_,
+            t,
+            self._tt,
+            self._rr_sec,
+            self._vv_sec,
+            self.R_sec,
+            self.R_primary,
+            umbra=umbra,
+        )
+
+    def _shadow_function_many(self, tt, uu, umbra):
+        # The grid is contiguous, so it covers every instant between both ends
+        self._ensure_sampled(tt.min())
+        self._ensure_sampled(tt.max())
+        return eclipse_function_tabulated_many_fast(
+            self.k,
+            np.ascontiguousarray(uu, dtype=float),
+            np.ascontiguousarray(tt, dtype=float),
+            self._tt,
+            self._rr_sec,
+            self._vv_sec,
+            self.R_sec,
+            self.R_primary,
+            umbra=umbra,
+        )
+
+    def __call__(self, t, u_, k):
+        self._ensure_sampled(t)
+        r_sec = hermite_interp_at(self._rr_sec, self._vv_sec, self._tt, t)
 
         return r_sec
 
@@ -176,26 +319,22 @@ class PenumbraEvent(EclipseEvent):
     direction: float, optional
         Handle triggering of event based on whether entry is into or out of
         penumbra, defaults to 0, i.e., event is triggered at both, entry and exit points.
+    **kwargs
+        Extra kwargs for the sampling of the secondary body,
+        see :py:class:`~poliastro.twobody.events.EclipseEvent`.
 
     """
 
-    def __init__(self, orbit, terminal=False, direction=0):
-        super().__init__(orbit, terminal, direction)
+    def __init__(self, orbit, terminal=False, direction=0, **kwargs):
+        super().__init__(orbit, terminal, direction, **kwargs)
 
     def __call__(self, t, u_, k):
         self._last_t = t
 
-        r_sec = super().__call__(t, u_, k)
-        shadow_function = eclipse_function_fast(
-            self.k,
-            u_,
-            r_sec,
-            self.R_sec,
-            self.R_primary,
-            umbra=False,
-        )
+        return self._shadow_function(t, u_, umbra=False)
 
-        return shadow_function
+    def many(self, tt, uu, k):
+        return self._shadow_function_many(tt, uu, umbra=False)
 
 
 class UmbraEvent(EclipseEvent):
@@ -210,21 +349,22 @@ class UmbraEvent(EclipseEvent):
     direction: float, optional
         Handle triggering of event based on whether entry is into or out of
         umbra, defaults to 0, i.e., event is triggered at both, entry and exit points.
+    **kwargs
+        Extra kwargs for the sampling of the secondary body,
+        see :py:class:`~poliastro.twobody.events.EclipseEvent`.
 
     """
 
-    def __init__(self, orbit, terminal=False, direction=0):
-        super().__init__(orbit, terminal, direction)
+    def __init__(self, orbit, terminal=False, direction=0, **kwargs):
+        super().__init__(orbit, terminal, direction, **kwargs)
 
     def __call__(self, t, u_, k):
         self._last_t = t
 
-        r_sec = super().__call__(t, u_, k)
-        shadow_function = eclipse_function_fast(
-            self.k, u_, r_sec, self.R_sec, self.R_primary
-        )
+        return self._shadow_function(t, u_, umbra=True)
 
-        return shadow_function
+    def many(self, tt, uu, k):
+        return self._shadow_function_many(tt, uu, umbra=True)
 
 
 class NodeCrossEvent(Event):
@@ -249,29 +389,79 @@ class NodeCrossEvent(Event):
         # Check if the z coordinate of the satellite is zero.
         return u_[2]
 
+    def many(self, tt, uu, k):
+        return uu[:, 2].copy()
+
 
 class LosEvent(Event):
     """Detect whether there exists a LOS between two satellites.
 
+    The trajectory of the secondary body is interpolated at the times
+    requested by the integrator using cubic Hermite polynomials.
+
     Parameters
     ----------
     attractor: ~poliastro.bodies.body
         The central attractor with respect to which the position vectors of the satellites are defined.
-    pos_coords: ~astropy.quantity.Quantity
-        A list of position coordinates for the secondary body. These coordinates
+    pos_coords: ~poliastro.ephem.Ephem or ~astropy.units.Quantity
+        Ephemerides of the secondary body, or array of position coordinates
+        with shape (n, 3) sampled at ``tofs``. These coordinates
         can be found by propagating the body for a desired amount of time.
+    terminal: bool, optional
+        Whether to terminate integration when the event occurs, defaults to False.
+    direction: float, optional
+        Specify which direction must the event trigger, defaults to 0.
+    tofs: ~astropy.units.Quantity, optional
+        Times of flight corresponding to ``pos_coords`` since the epoch of the
+        primary body, required if the position coordinates are given as an array.
+    vel_coords: ~astropy.units.Quantity, optional
+        Array of velocity coordinates with shape (n, 3) sampled at ``tofs``.
+        If not given, they are estimated from the position coordinates.
+    epoch: ~astropy.time.Time, optional
+        Epoch of the primary body, used when ``pos_coords`` is an `Ephem`.
+        Defaults to the first epoch of the ephemerides.
 
     """
 
-    def __init__(self, attractor, pos_coords, terminal=False, direction=0):
+    def __init__(
+        self,
+        attractor,
+        pos_coords,
+        terminal=False,
+        direction=0,
+        *,
+        tofs=None,
+        vel_coords=None,
+        epoch=None,
+    ):
         super().__init__(terminal, direction)
         self._attractor = attractor
-        self._pos_coords = (pos_coords << u.km).value.tolist()
-        self._last_coord = (
-            self._pos_coords[-1] << u.km
-        ).value  # Used to prevent any errors if `self._pos_coords` gets exhausted early.
         self._R = self._attractor.R.to_value(u.km)
 
+        if isinstance(pos_coords, Ephem):
+            if epoch is None:
+                epoch = pos_coords.epochs[0]
+
+            tofs = pos_coords.epochs - epoch
+            pos_coords, vel_coords = pos_coords.rv()
+        elif tofs is None:
+            raise ValueError(
+                "tofs must be given when the position coordinates are an array"
+            )
+
+        self._tt = tofs.to_value(u.s)
+        self._rr = (pos_coords << u.km).value
+        if len(self._tt) < 2 or self._rr.shape != (len(self._tt), 3):
+            raise ValueError(
+                "At least two position coordinates with shape (n, 3) "
+                "matching the times of flight are required"
+            )
+
+        if vel_coords is not None:
+            self._vv = (vel_coords << (u.km / u.s)).value
+        else:
+            self._vv = np.gradient(self._rr, self._tt, axis=0)
+
     def __call__(self, t, u_, k):
         self._last_t = t
 
@@ -280,10 +470,290 @@ class LosEvent(Event):
                 "The norm of the position vector of the primary body is less than the radius of the attractor."
             )
 
-        pos_coord = (
-            self._pos_coords.pop(0) if self._pos_coords else self._last_coord
+        delta_angle = line_of_sight_tabulated_fast(
+            u_[:3], t, self._tt, self._rr, self._vv, self._R
         )
-
-        # Need to cast `pos_coord` to array since `norm` inside numba only works for arrays, not lists.
-        delta_angle = line_of_sight_fast(u_[:3], np.array(pos_coord), self._R)
         return delta_angle
+
+    def many(self, tt, uu, k):
+        rr = np.ascontiguousarray(uu[:, :3], dtype=float)
+        if np.any(np.linalg.norm(rr, axis=1) < self._R):
+            warn(
+                "The norm of the position vector of the primary body is less than the radius of the attractor."
+            )
+
+        return line_of_sight_tabulated_many_fast(
+            rr,
+            np.ascontiguousarray(tt, dtype=float),
+            self._tt,
+            self._rr,
+            self._vv,
+            self._R,
+        )
+
+
+def detect_events(
+    event,
+    objects,
+    epochs=None,
+    *,
+    method=None,
+    k=None,
+    epoch=None,
+    xtol=1e-6 * u.s,
+    maxiter=100,
+):
+    """Find the crossings of an event function over sampled trajectories.
+
+    The event function is evaluated on the sampled states of every object
+    with :py:meth:`~poliastro.twobody.events.Event.many`, sign changes are
+    bracketed between consecutive samples and then refined with Brent's method,
+    solving all the brackets at the same time.
+    Between samples, positions and velocities are interpolated with
+    cubic Hermite polynomials, so the sampling must be dense enough to
+    resolve both the motion and the sign changes of the event function.
+
+    Parameters
+    ----------
+    event : ~poliastro.twobody.events.Event
+        Event function, with the same signature as the ones used for propagation.
+    objects : ~poliastro.ephem.Ephem, ~poliastro.twobody.orbit.Orbit or list
+        Ephemerides or orbits of the objects.
+    epochs : ~astropy.time.Time, optional
+        Epochs at which orbits are sampled, required if any of the objects is an orbit.
+    method : optional
+        Propagator used to sample the orbits, defaults to Farnocchia's method.
+    k : float, optional
+        Standard gravitational parameter passed to the event function (km^3 / s^2).
+    epoch : ~astropy.time.Time, optional
+        Reference epoch of the times passed to the event function,
+        defaults to the first epoch of the first object.
+    xtol : ~astropy.units.Quantity, optional
+        Absolute tolerance of the crossing times.
+    maxiter : int, optional
+        Maximum number of iterations of the root solver,
+        the crossings that do not converge within them are masked.
+
+    Returns
+    -------
+    index : numpy.ndarray
+        Index of the object corresponding to each crossing.
+    event_epochs : ~astropy.time.Time
+        Epochs of the crossings.
+    directions : numpy.ndarray
+        Direction of each crossing, 1 if the event function increases and -1 otherwise.
+
+    Notes
+    -----
+    Only the crossings compatible with the direction of the event are returned,
+    sorted by object and then by epoch.
+
+    """
+    from poliastro.twobody.orbit import Orbit
+    from poliastro.twobody.sampling import EpochsArray
+
+    if isinstance(objects, (Ephem, Orbit)):
+        objects = [objects]
+
+    ephems = []
+    for obj in objects:
+        if isinstance(obj, Orbit):
+            if epochs is None:
+                raise ValueError("epochs must be given to sample orbits")
+            strategy = (
+                EpochsArray(epochs)
+                if method is None
+                else EpochsArray(epochs, method=method)
+            )
+            obj = obj.to_ephem(strategy=strategy)
+        ephems.append(obj)
+
+    if epoch is None:
+        epoch = ephems[0].epochs[0]
+
+    # Coarse evaluation of the event function at the samples of all the objects
+    rvs = [ephem.rv() for ephem in ephems]
+    tt = np.concatenate(
+        [(ephem.epochs - epoch).to_value(u.s) for ephem in ephems]
+    )
+    uu = np.concatenate(
+        [np.hstack((r.to_value(u.km), v.to_value(u.km / u.s))) for r, v in rvs]
+    )
+    gg = event.many(tt, uu, k)
+
+    # Brackets between consecutive samples of the same object
+    sizes = np.array([len(ephem.epochs) for ephem in ephems])
+    obj = np.repeat(np.arange(len(ephems)), sizes)
+    same_obj = obj[:-1] == obj[1:]
+    increasing = same_obj & (gg[:-1] < 0) & (gg[1:] >= 0)
+    decreasing = same_obj & (gg[:-1] > 0) & (gg[1:] <= 0)
+    if event.direction > 0:
+        decreasing[:] = False
+    elif event.direction < 0:
+        increasing[:] = False
+
+    bracket_i = np.flatnonzero(increasing | decreasing)
+    bracket_obj = obj[bracket_i]
+    directions = np.where(increasing[bracket_i], 1, -1)
+
+    if not bracket_obj.size:
+        return bracket_obj, epoch + np.empty(0) * u.s, directions
+
+    # Gather the ends of every bracket to refine them all at once
+    t0, t1 = tt[bracket_i], tt[bracket_i + 1]
+    u0, u1 = uu[bracket_i], uu[bracket_i + 1]
+
+    def f(t, idx):
+        uu = hermite_segments(
+            t,
+            t0[idx],
+            t1[idx],
+            u0[idx, :3],
+            u0[idx, 3:],
+            u1[idx, :3],
+            u1[idx, 3:],
+        )
+        return event.many(t, uu, k)
+
+    t_events, converged = brentq_many(
+        f, t0, t1, xtol=xtol.to_value(u.s), maxiter=maxiter
+    )
+    t_events[~converged] = np.nan
+
+    return bracket_obj, epochs_from_offsets(epoch, t_events * u.s), directions
+
+
+def eclipse_windows(
+    attractor,
+    states,
+    epochs=None,
+    *,
+    r_sec=None,
+    umbra=True,
+    xtol=1e-3 * u.s,
+    maxiter=100,
+):
+    """Find the eclipse windows of many satellites over a time grid.
+
+    The shadow function is evaluated for all the satellites at once
+    on the sampling epochs, and the entry and exit times are refined with
+    Brent's method interpolating the satellite positions with cubic
+    Hermite polynomials and the position of the secondary body linearly.
+    The shadow function is the one of
+    :py:func:`~poliastro.core.events.shadow_function`, which only depends
+    on the positions, so no numerical propagation is needed.
+
+    Parameters
+    ----------
+    attractor : ~poliastro.bodies.Body
+        Primary body casting the shadow, with respect to which the states are given.
+        Its parent is the body that illuminates the satellites.
+    states : ~poliastro.ephem.Ephem, list or tuple
+        Ephemerides of the satellites, or tuple of positions and velocities
+        with shape (n, m, 3) for n satellites sampled at m epochs.
+    epochs : ~astropy.time.Time, optional
+        Sampling epochs, required if the states are given as arrays.
+        If not given, the ones of the first ephemerides are used.
+    r_sec : ~astropy.units.Quantity, optional
+        Tabulated position of the secondary body with respect to the attractor
+        at the sampling epochs, with shape (m, 3). If not given,
+        it is computed from the ephemerides of both bodies.
+    umbra : bool, optional
+        Whether to find the windows of umbra or penumbra, defaults to True
+        i.e. finds the umbra windows.
+    xtol : ~astropy.units.Quantity, optional
+        Absolute tolerance of the entry and exit times.
+    maxiter : int, optional
+        Maximum number of iterations of the root solver,
+        the entry and exit times that do not converge within them are masked.
+
+    Returns
+    -------
+    windows : ~astropy.table.QTable
+        Table with the ``index`` of the satellite, ``entry`` and ``exit`` epochs and
+        ``duration`` of every eclipse window, sorted by satellite and then by epoch.
+        Windows are clipped to the sampling interval.
+
+    """
+    rr, vv, epochs = states_on_grid(states, epochs)
+
+    if r_sec is None:
+        rr_sec, _ = _secondary_body_vectors(
+            attractor, attractor.parent, epochs
+        )
+    else:
+        rr_sec = r_sec.to_value(u.km)
+    rr_sec = np.ascontiguousarray(rr_sec, dtype=float)
+
+    R_sec = attractor.parent.R.to_value(u.km)
+    R_primary = attractor.R.to_value(u.km)
+
+    tt = (epochs - epochs[0]).to_value(u.s)
+    inside = shadow_function_many_fast(rr, rr_sec, R_sec, R_primary, umbra) > 0
+    changes = np.diff(inside.astype(int), axis=1)
+    bracket_obj, bracket_i = np.nonzero(changes)
+
+    def f(t, idx):
+        jj, ii = bracket_obj[idx], bracket_i[idx]
+        t0, t1 = tt[ii], tt[ii + 1]
+        uu = hermite_segments(
+            t, t0, t1, rr[jj, ii], vv[jj, ii], rr[jj, ii + 1], vv[jj, ii + 1]
+        )
+        s = ((t - t0) / (t1 - t0))[:, None]
+        r_sec_t = (1 - s) * rr_sec[ii] + s * rr_sec[ii + 1]
+        return shadow_function_many_fast(
+            np.ascontiguousarray(uu[None, :, :3]),
+            np.ascontiguousarray(r_sec_t),
+            R_sec,
+            R_primary,
+            umbra,
+        )[0]
+
+    if bracket_obj.size:
+        t_cross, converged = brentq_many(
+            f,
+            tt[bracket_i],
+            tt[bracket_i + 1],
+            xtol=xtol.to_value(u.s),
+            maxiter=maxiter,
+        )
+        t_cross[~converged] = np.nan
+    else:
+        t_cross = np.empty(0)
+
+    # Unconverged crossings are sorted by the start of their bracket
+    t_key = np.where(np.isnan(t_cross), tt[bracket_i], t_cross)
+
+    # Windows that are open at the ends of the sampling interval are clipped
+    is_entry = changes[bracket_obj, bracket_i] > 0
+    start_inside = np.flatnonzero(inside[:, 0])
+    end_inside = np.flatnonzero(inside[:, -1])
+
+    entry_obj = np.concatenate((bracket_obj[is_entry], start_inside))
+    entry_t = np.concatenate(
+        (t_cross[is_entry], np.full(start_inside.size, tt[0]))
+    )
+    exit_obj = np.concatenate((bracket_obj[~is_entry], end_inside))
+    exit_t = np.concatenate(
+        (t_cross[~is_entry], np.full(end_inside.size, tt[-1]))
+    )
+
+    entry_key = np.concatenate(
+        (t_key[is_entry], np.full(start_inside.size, tt[0]))
+    )
+    exit_key = np.concatenate(
+        (t_key[~is_entry], np.full(end_inside.size, tt[-1]))
+    )
+
+    entry_order = np.lexsort((entry_key, entry_obj))
+    exit_order = np.lexsort((exit_key, exit_obj))
+    entry_t, exit_t = entry_t[entry_order], exit_t[exit_order]
+
+    return QTable(
+        {
+            "index": entry_obj[entry_order],
+            "entry": epochs_from_offsets(epochs[0], entry_t * u.s),
+            "exit": epochs_from_offsets(epochs[0], exit_t * u.s),
+            "duration": (exit_t - entry_t) * u.s,
+        }
+    )
@@ -6,12 +6,12 @@ from astropy.coordinates import (
     ICRS,
     CartesianDifferential,
     CartesianRepresentation,
-    get_body_barycentric,
 )
 import numpy as np
 
 from poliastro.bodies import Earth
 from poliastro.core.events import elevation_function as elevation_function_fast
+from poliastro.frames.affine import plane_rotation_matrix
 from poliastro.frames.util import get_frame
 from poliastro.threebody.soi import laplace_radius
 from poliastro.twobody.elements import eccentricity_vector, energy, t_p
@@ -223,9 +223,11 @@ class Orbit(OrbitCreationMixin):
         if self.attractor == new_attractor:
             return self
         elif self.attractor == new_attractor.parent:  # "Sun -> Earth"
+            from poliastro.ephem import body_barycentric_posvel
+
             r_soi = laplace_radius(new_attractor)
-            barycentric_position = get_body_barycentric(
-                new_attractor.name, self.epoch
+            barycentric_position, _ = body_barycentric_posvel(
+                new_attractor, self.epoch
             )
             # Transforming new_attractor's frame into frame of attractor
             new_attractor_r = (
@@ -276,6 +278,19 @@ class Orbit(OrbitCreationMixin):
         if plane is self.plane:
             return self
 
+        try:
+            R = plane_rotation_matrix(self.attractor, self.plane, plane)
+        except NotImplementedError:
+            pass
+        else:
+            return Orbit.from_vectors(
+                self.attractor,
+                self.r @ R.T,
+                self.v @ R.T,
+                self.epoch,
+                plane,
+            )
+
         coords_orig = self.get_frame().realize_frame(
             self.represent_as(CartesianRepresentation, CartesianDifferential)
         )
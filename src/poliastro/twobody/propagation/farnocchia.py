@@ -5,7 +5,7 @@ import numpy as np
 
 from poliastro.core.propagation.farnocchia import (
     farnocchia_coe as farnocchia_coe_fast,
-    farnocchia_rv as farnocchia_rv_fast,
+    farnocchia_rv_many as farnocchia_rv_many_fast,
 )
 from poliastro.twobody.propagation.enums import PropagatorKind
 from poliastro.twobody.states import ClassicalState
@@ -56,10 +56,12 @@ class FarnocchiaPropagator:
 
         # TODO: This should probably return a ClassicalStateArray instead,
         # see discussion at https://github.com/poliastro/poliastro/pull/1492
-        results = np.array(
-            [farnocchia_rv_fast(k, *rv0, tof) for tof in tofs.to_value(u.s)]
+        rr, vv = farnocchia_rv_many_fast(
+            k,
+            *rv0,
+            np.atleast_1d(tofs.to_value(u.s)).astype(float),
         )
         return (
-            results[:, 0] << u.km,
-            results[:, 1] << (u.km / u.s),
+            rr << u.km,
+            vv << (u.km / u.s),
         )
@@ -70,6 +70,25 @@ def time_range(
     return result
 
 
+@u.quantity_input(offsets=u.s)
+def epochs_from_offsets(epoch, offsets):
+    """Returns the epochs at some offsets from a reference one.
+
+    Parameters
+    ----------
+    epoch : ~astropy.time.Time
+        Reference epoch.
+    offsets : ~astropy.units.Quantity
+        Offsets from the reference epoch, the epochs are masked where they are NaN.
+
+    """
+    missing = np.isnan(offsets)
+    epochs = epoch + np.where(missing, 0, offsets.to_value(u.s)) * u.s
+    if missing.any():
+        epochs[missing] = np.ma.masked
+    return epochs
+
+
 @u.quantity_input(value=u.rad, values=u.rad)
 def find_closest_value(value, values):
     """Calculates the closest value in the given values.
@@ -0,0 +1,182 @@
+from astropy import units as u
+from astropy.tests.helper import assert_quantity_allclose
+from astropy.time import Time
+import numpy as np
+import pytest
+
+from poliastro.bodies import Earth, Mars
+from poliastro.core.sensors import nadir_footprint_ground_range
+from poliastro.coverage import compute_coverage
+from poliastro.spheroid_location import SpheroidLocationArray
+from poliastro.twobody import Orbit
+from poliastro.twobody.sampling import EpochsArray
+from poliastro.util import time_range
+
+
+@pytest.fixture(scope="module")
+def constellation_ephems():
+    epoch = Time("2022-01-01", scale="utc")
+    epochs = time_range(epoch, end=epoch + 12 * u.h, num_values=721)
+    orbits = [
+        Orbit.from_classical(
+            attractor=Earth,
+            a=7078 * u.km,
+            ecc=0 * u.one,
+            inc=inc,
+            raan=raan,
+            argp=0 * u.deg,
+            nu=nu,
+            epoch=epoch,
+        )
+        for inc, raan, nu in [
+            (97.5 * u.deg, 0 * u.deg, 0 * u.deg),
+            (53 * u.deg, 120 * u.deg, 90 * u.deg),
+        ]
+    ]
+    return [orbit.to_ephem(EpochsArray(epochs)) for orbit in orbits]
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return SpheroidLocationArray.from_grid(
+        np.arange(-180, 180, 30) * u.deg,
+        np.arange(-80, 90, 20) * u.deg,
+        0 * u.km,
+        Earth,
+    )
+
+
+def _brute_force_coverage(ephems, grid, half_angle):
+    epochs = ephems[0].epochs
+    theta = epochs.sidereal_time("mean", "greenwich").to_value(u.rad)
+    cells = grid.cartesian_cords.to_value(u.km)
+    cells /= np.linalg.norm(cells, axis=1)[:, None]
+
+    covered = np.zeros((len(epochs), len(grid)), dtype=bool)
+    for ephem in ephems:
+        rr = ephem.rv()[0].to_value(u.km)
+        r = np.linalg.norm(rr, axis=1)
+        sub_lon = np.arctan2(rr[:, 1], rr[:, 0]) - theta
+        sub_lat = np.arcsin(rr[:, 2] / r)
+        uu = np.stack(
+            (
+                np.cos(sub_lat) * np.cos(sub_lon),
+                np.cos(sub_lat) * np.sin(sub_lon),
+                np.sin(sub_lat),
+            ),
+            axis=-1,
+        )
+        lam = np.array(
+            [
+                nadir_footprint_ground_range(
+                    r_ - Earth.R.to_value(u.km),
+                    half_angle.to_value(u.rad),
+                    Earth.R.to_value(u.km),
+                )
+                for r_ in r
+            ]
+        )
+        covered |= uu @ cells.T >= np.cos(lam)[:, None]
+
+    return covered
+
+
+def test_compute_coverage_matches_brute_force(constellation_ephems, grid):
+    half_angle = 45 * u.deg
+    covered = _brute_force_coverage(constellation_ephems, grid, half_angle)
+
+    statistics, intervals = compute_coverage(
+        Earth, constellation_ephems, grid, half_angle, chunk_size=100
+    )
+
+    assert_quantity_allclose(
+        statistics["coverage"], covered.mean(axis=0) * 100 * u.percent
+    )
+    starts = np.diff(np.vstack((np.zeros(len(grid)), covered)), axis=0) > 0
+    assert np.all(statistics["accesses"] == starts.sum(axis=0))
+    assert len(intervals) == starts.sum()
+    assert np.all(intervals["end"] >= intervals["start"])
+
+
+def test_compute_coverage_does_not_depend_on_chunk_size(
+    constellation_ephems, grid
+):
+    expected_statistics, expected_intervals = compute_coverage(
+        Earth, constellation_ephems, grid, 30 * u.deg
+    )
+    statistics, intervals = compute_coverage(
+        Earth, constellation_ephems, grid, 30 * u.deg, chunk_size=7
+    )
+
+    assert np.all(intervals["cell"] == expected_intervals["cell"])
+    assert np.all(intervals["start"] == expected_intervals["start"])
+    assert np.all(intervals["end"] == expected_intervals["end"])
+    assert_quantity_allclose(
+        statistics["max_revisit_gap"],
+        expected_statistics["max_revisit_gap"],
+        equal_nan=True,
+    )
+
+
+def test_compute_coverage_revisit_gaps(constellation_ephems, grid):
+    statistics, intervals = compute_coverage(
+        Earth, constellation_ephems, grid, 30 * u.deg
+    )
+
+    cell = np.argmax(statistics["accesses"])
+    cell_intervals = intervals[intervals["cell"] == cell]
+    gaps = (cell_intervals["start"][1:] - cell_intervals["end"][:-1]).to(u.s)
+
+    assert statistics["accesses"][cell] >= 2
+    assert_quantity_allclose(statistics["max_revisit_gap"][cell], gaps.max())
+    assert_quantity_allclose(statistics["mean_revisit_gap"][cell], gaps.mean())
+    assert np.all(
+        np.isnan(statistics["mean_revisit_gap"][statistics["accesses"] < 2])
+    )
+
+
+def test_compute_coverage_requires_sidereal_time_for_other_attractors():
+    epochs = time_range("2022-01-01", end="2022-01-02", num_values=10)
+    rr = vv = np.ones((1, 10, 3))
+    grid = SpheroidLocationArray.from_grid(
+        [0, 90] * u.deg, [0, 45] * u.deg, 0 * u.km, Mars
+    )
+
+    with pytest.raises(ValueError, match="sidereal_time must be given"):
+        compute_coverage(
+            Mars, (rr * u.km, vv * u.km / u.s), grid, 30 * u.deg, epochs
+        )
+
+
+def test_compute_coverage_from_state_arrays_match_ephems(
+    constellation_ephems, grid
+):
+    epochs = constellation_ephems[0].epochs
+    rr = np.stack([ephem.rv()[0] for ephem in constellation_ephems])
+    vv = np.stack([ephem.rv()[1] for ephem in constellation_ephems])
+
+    expected_statistics, _ = compute_coverage(
+        Earth, constellation_ephems, grid, 45 * u.deg
+    )
+    statistics, _ = compute_coverage(Earth, (rr, vv), grid, 45 * u.deg, epochs)
+
+    assert_quantity_allclose(
+        statistics["coverage"], expected_statistics["coverage"]
+    )
+
+
+@pytest.mark.parametrize("num_values", [None, 9])
+def test_compute_coverage_raises_error_for_arrays_off_the_epochs(
+    grid, num_values
+):
+    rr = vv = np.ones((1, 10, 3))
+    epochs = (
+        time_range("2022-01-01", end="2022-01-02", num_values=num_values)
+        if num_values
+        else None
+    )
+
+    with pytest.raises(ValueError, match="epochs"):
+        compute_coverage(
+            Earth, (rr * u.km, vv * u.km / u.s), grid, 30 * u.deg, epochs
+        )
@@ -1,4 +1,7 @@
+import io
+import json
 import sys
+from unittest import mock
 
 from astropy import units as u
 from astropy.coordinates.representation import CartesianRepresentation
@@ -9,6 +12,7 @@ import pytest
 
 from poliastro.bodies import Mars
 from poliastro.examples import iss, molniya
+from poliastro.twobody.propagation import FarnocchiaPropagator
 
 try:
     from czml3.core import Document
@@ -928,3 +932,86 @@ def test_czml_add_trajectory_raises_error_for_groundtrack_show():
         "Ground tracking for trajectory not implemented yet"
         in excinfo.exconly()
     )
+
+
+def _add_czml_packets(extractor):
+    extractor.add_ground_station([0.70930 * u.rad, 0.40046 * u.rad])
+    extractor.add_orbit(molniya, rtol=1e-4, groundtrack_show=True)
+    extractor.add_trajectory(
+        CartesianRepresentation([1.0, 2.0], [3.0, 4.0], [5.0, 6.0], unit=u.m),
+        Time(["2000-01-01T12:00:00", "2000-01-01T12:00:30"], format="isot"),
+    )
+
+
+def test_czml_stream_writes_same_document():
+    start_epoch = molniya.epoch
+    end_epoch = molniya.epoch + molniya.period
+
+    extractor = CZMLExtractor(start_epoch, end_epoch, 10)
+    _add_czml_packets(extractor)
+    expected_doc = json.loads(repr(extractor.get_document()))
+
+    stream = io.StringIO()
+    with CZMLExtractor(start_epoch, end_epoch, 10, stream=stream) as streamer:
+        _add_czml_packets(streamer)
+        assert streamer.packets == []
+        assert streamer.trajectories == []
+
+        with pytest.raises(ValueError, match="not kept in memory"):
+            streamer.get_document()
+
+    assert json.loads(stream.getvalue()) == expected_doc
+
+
+def test_czml_stream_raises_error_when_adding_packets_after_closing():
+    start_epoch = molniya.epoch
+    end_epoch = molniya.epoch + molniya.period
+
+    stream = io.StringIO()
+    with CZMLExtractor(start_epoch, end_epoch, 10, stream=stream) as streamer:
+        _add_czml_packets(streamer)
+
+    with pytest.raises(ValueError, match="already closed"):
+        streamer.add_ground_station([0.70930 * u.rad, 0.40046 * u.rad])
+    with pytest.raises(ValueError, match="already closed"):
+        streamer.add_trajectory(
+            CartesianRepresentation([1.0], [3.0], [5.0], unit=u.m),
+            Time(["2000-01-01T12:00:00"], format="isot"),
+        )
+
+    json.loads(stream.getvalue())
+
+    streamer = CZMLExtractor(start_epoch, end_epoch, 10, stream=io.StringIO())
+    streamer.close()
+    with pytest.raises(ValueError, match="already closed"):
+        streamer.add_orbit(molniya)
+
+
+def test_czml_add_orbit_with_groundtrack_propagates_once():
+    extractor = CZMLExtractor(
+        molniya.epoch, molniya.epoch + molniya.period, 10
+    )
+
+    with mock.patch(
+        "poliastro.czml.extract_czml.FarnocchiaPropagator.propagate_many",
+        autospec=True,
+        side_effect=FarnocchiaPropagator.propagate_many,
+    ) as propagate_mock:
+        extractor.add_orbit(molniya, groundtrack_show=True)
+
+    assert propagate_mock.call_count == 1
+    assert len(extractor.packets) == 4
+
+
+def test_czml_add_trajectory_rounds_positions_given_rtol():
+    start_epoch = iss.epoch
+    end_epoch = iss.epoch + molniya.period
+    positions = CartesianRepresentation(
+        [1.2345, 2.0], [3.0, 4.0], [5.0, 6.0], unit=u.m
+    )
+    epochs = Time(["2010-01-01T05:00:00", "2010-01-01T05:00:30"])
+
+    extractor = CZMLExtractor(start_epoch, end_epoch, 10)
+    extractor.add_trajectory(positions, epochs, rtol=1e-3)
+
+    assert extractor.packets[-1].position.cartesian[1] == 1.234
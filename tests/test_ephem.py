@@ -6,6 +6,7 @@ from astropy.coordinates import (
     BarycentricMeanEcliptic,
     CartesianDifferential,
     CartesianRepresentation,
+    get_body_barycentric_posvel,
 )
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.time import Time
@@ -13,12 +14,28 @@ import numpy as np
 import pytest
 
 from poliastro.bodies import Earth, Venus
-from poliastro.ephem import Ephem, SincInterpolator, SplineInterpolator
+from poliastro.ephem import (
+    BodyEphemerisCache,
+    ChebyshevEphem,
+    Ephem,
+    HermiteInterpolator,
+    LagrangeInterpolator,
+    SincInterpolator,
+    SplineInterpolator,
+)
+from poliastro.examples import iss
 from poliastro.frames import Planes
 from poliastro.twobody.orbit import Orbit
+from poliastro.twobody.sampling import EpochsArray
+from poliastro.util import time_range
 from poliastro.warnings import TimeScaleWarning
 
-AVAILABLE_INTERPOLATORS = [SincInterpolator(), SplineInterpolator()]
+AVAILABLE_INTERPOLATORS = [
+    SincInterpolator(),
+    SplineInterpolator(),
+    HermiteInterpolator(),
+    LagrangeInterpolator(3),
+]
 AVAILABLE_PLANES = Planes.__members__.values()
 
 
@@ -411,3 +428,268 @@ def test_from_orbit_has_desired_properties(interpolator, rtol):
 
     assert ephem.epochs is epochs
     assert_coordinates_allclose(coordinates, expected_coordinates, rtol=rtol)
+
+
+def test_chebyshev_ephem_matches_propagated_orbit():
+    epochs = time_range(iss.epoch, end=iss.epoch + 1 * u.d, num_values=1441)
+    ephem = iss.to_ephem(EpochsArray(epochs))
+    sample_epochs = time_range(
+        iss.epoch + 17 * u.s, end=iss.epoch + 23 * u.h, num_values=500
+    )
+    expected_r, expected_v = iss.to_ephem(EpochsArray(sample_epochs)).rv()
+
+    cheb = ChebyshevEphem.from_ephem(ephem, 20 * u.min, degree=11)
+    r, v = cheb.rv(sample_epochs)
+
+    assert cheb.plane is ephem.plane
+    assert cheb.epochs[0] == epochs[0] and cheb.epochs[-1] == epochs[-1]
+    assert cheb._coeffs.nbytes < ephem._coordinates.xyz.nbytes
+    assert_quantity_allclose(r, expected_r, atol=1 * u.mm, rtol=0)
+    assert_quantity_allclose(v, expected_v, atol=1 * u.um / u.s, rtol=0)
+    assert_quantity_allclose(cheb.rv(sample_epochs[3])[0], expected_r[3])
+
+
+@pytest.mark.parametrize(
+    "segment_duration,degree,num_segments",
+    [(143.6 * u.min, 40, 10), (0.9999999 * u.d / 3, 80, 3)],
+)
+def test_chebyshev_ephem_merges_short_last_segment(
+    segment_duration, degree, num_segments
+):
+    epochs = time_range(iss.epoch, end=iss.epoch + 1 * u.d, num_values=1441)
+    ephem = iss.to_ephem(EpochsArray(epochs))
+    sample_epochs = time_range(
+        iss.epoch + 23 * u.h, end=epochs[-1], num_values=50
+    )
+    expected_r, _ = iss.to_ephem(EpochsArray(sample_epochs)).rv()
+
+    cheb = ChebyshevEphem.from_ephem(ephem, segment_duration, degree=degree)
+    r, _ = cheb.rv(sample_epochs)
+
+    assert len(cheb.epochs) == num_segments + 1
+    assert cheb.epochs[-1] == epochs[-1]
+    assert_quantity_allclose(r, expected_r, atol=1 * u.m, rtol=0)
+
+
+def test_chebyshev_ephem_raises_for_epochs_outside_of_span():
+    epochs = time_range(iss.epoch, end=iss.epoch + 1 * u.h, num_values=61)
+    cheb = ChebyshevEphem.from_ephem(
+        iss.to_ephem(EpochsArray(epochs)), 20 * u.min
+    )
+
+    with pytest.raises(ValueError, match="inside the span"):
+        cheb.sample(iss.epoch + 2 * u.h)
+
+
+def test_chebyshev_ephem_raises_if_segments_have_too_few_samples():
+    epochs = time_range(iss.epoch, end=iss.epoch + 1 * u.h, num_values=7)
+
+    with pytest.raises(ValueError, match="Not enough samples"):
+        ChebyshevEphem.from_ephem(
+            iss.to_ephem(EpochsArray(epochs)), 20 * u.min, degree=11
+        )
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_ephem_save_and_load_roundtrip(tmp_path, mmap):
+    epochs = time_range(iss.epoch, end=iss.epoch + 1 * u.d, num_values=1441)
+    ephem = iss.to_ephem(EpochsArray(epochs))
+    sample_epochs = time_range(
+        iss.epoch + 2 * u.h + 13 * u.s, end=iss.epoch + 3 * u.h, num_values=50
+    )
+    path = tmp_path / "iss.ephem"
+
+    ephem.save(path)
+    loaded = Ephem.load(path, mmap=mmap)
+
+    assert isinstance(loaded._tt, np.memmap) is mmap
+    assert loaded.plane is ephem.plane
+    assert str(loaded) == str(ephem)
+    assert_quantity_allclose(
+        (loaded.epochs - epochs).to(u.s), 0 * u.s, atol=1 * u.us
+    )
+    assert_coordinates_allclose(loaded.sample(), ephem.sample())
+    assert_coordinates_allclose(
+        loaded.sample(sample_epochs),
+        ephem.sample(sample_epochs),
+        rtol=1e-9,
+    )
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_ephem_load_sinc_interpolation_uses_all_samples(tmp_path, mmap):
+    epochs = time_range(iss.epoch, end=iss.epoch + 2 * u.h, num_values=121)
+    ephem = iss.to_ephem(EpochsArray(epochs))
+    sample_epochs = iss.epoch + [30.5, 31.5] * u.min
+    path = tmp_path / "iss.ephem"
+
+    ephem.save(path)
+    loaded = Ephem.load(path, mmap=mmap)
+
+    assert_coordinates_allclose(
+        loaded.sample(sample_epochs, interpolator=SincInterpolator()),
+        ephem.sample(sample_epochs, interpolator=SincInterpolator()),
+        rtol=1e-12,
+    )
+
+
+def test_ephem_load_sample_at_single_epoch_returns_it(tmp_path):
+    ephem = iss.to_ephem(EpochsArray(iss.epoch.reshape(1)))
+    path = tmp_path / "iss.ephem"
+
+    ephem.save(path)
+    loaded = Ephem.load(path)
+
+    assert loaded.sample(iss.epoch) is loaded._coordinates
+    assert loaded._epochs is None
+
+
+def test_ephem_load_raises_for_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not an ephemerides")
+
+    with pytest.raises(ValueError, match="not a poliastro ephemerides file"):
+        Ephem.load(path)
+
+
+def test_ephem_sample_builds_interpolant_once_per_configuration(
+    epochs, coordinates
+):
+    ephem = Ephem(coordinates, epochs, Planes.EARTH_EQUATOR)
+    sample_epochs = epochs[0] + [0.5, 1.5] * u.d
+
+    with mock.patch.object(
+        SplineInterpolator,
+        "build",
+        autospec=True,
+        side_effect=SplineInterpolator.build,
+    ) as build:
+        expected = ephem.sample(sample_epochs)
+        result = ephem.sample(
+            sample_epochs[::-1], interpolator=SplineInterpolator()
+        )
+        ephem.sample(sample_epochs, interpolator=SplineInterpolator("linear"))
+
+        assert build.call_count == 2
+
+        ephem.clear_interpolants()
+        ephem.sample(sample_epochs)
+
+        assert build.call_count == 3
+
+    assert_coordinates_allclose(result[::-1], expected)
+    assert_coordinates_allclose(
+        expected,
+        SplineInterpolator().interpolate(sample_epochs, epochs, coordinates),
+    )
+
+
+@pytest.mark.parametrize(
+    "interpolator, atol_r, atol_v",
+    [
+        (HermiteInterpolator(), 5 * u.m, 0.1 * u.m / u.s),
+        (LagrangeInterpolator(), 1 * u.mm, 1 * u.mm / u.s),
+    ],
+)
+def test_local_interpolators_match_propagated_orbit(
+    interpolator, atol_r, atol_v
+):
+    epochs = time_range(iss.epoch, end=iss.epoch + 1 * u.d, num_values=1441)
+    ephem = iss.to_ephem(EpochsArray(epochs))
+    sample_epochs = time_range(
+        iss.epoch + 17 * u.s, end=iss.epoch + 1 * u.d, num_values=500
+    )
+    expected_r, expected_v = iss.to_ephem(EpochsArray(sample_epochs)).rv()
+
+    r, v = ephem.rv(sample_epochs, interpolator=interpolator)
+
+    assert_quantity_allclose(r, expected_r, atol=atol_r, rtol=0)
+    assert_quantity_allclose(v, expected_v, atol=atol_v, rtol=0)
+
+
+@pytest.mark.parametrize(
+    "interpolator", [HermiteInterpolator(), LagrangeInterpolator(3)]
+)
+def test_local_interpolators_raise_outside_of_span(
+    epochs, coordinates, interpolator
+):
+    ephem = Ephem(coordinates, epochs, Planes.EARTH_EQUATOR)
+
+    with pytest.raises(ValueError, match="inside the span"):
+        ephem.sample(epochs[-1] + 1 * u.d, interpolator=interpolator)
+
+
+def test_lagrange_interpolator_raises_if_not_enough_samples(
+    epochs, coordinates
+):
+    ephem = Ephem(coordinates, epochs, Planes.EARTH_EQUATOR)
+
+    with pytest.raises(ValueError, match="At least 9 samples are needed"):
+        ephem.sample(epochs[0] + 1 * u.h, interpolator=LagrangeInterpolator())
+
+
+def test_body_ephemeris_cache_evicts_least_recently_used():
+    cache = BodyEphemerisCache(maxsize=2)
+    compute = mock.Mock(return_value=(np.zeros((1, 3)), np.ones((1, 3))))
+
+    for key in ("a", "b", "a", "c", "a", "b"):
+        rr, vv = cache.get(key, compute)
+
+    assert compute.call_count == 4
+    assert len(cache) == 2
+    assert "a" in cache and "b" in cache and "c" not in cache
+    assert not rr.flags.writeable
+
+
+def test_body_ephemeris_cache_reads_entries_from_disk(tmp_path):
+    compute = mock.Mock(return_value=(np.zeros((2, 3)), np.ones((2, 3))))
+    BodyEphemerisCache(directory=tmp_path).get("a", compute)
+
+    cache = BodyEphemerisCache(directory=tmp_path)
+    rr, vv = cache.get("a", compute)
+
+    assert compute.call_count == 1
+    assert np.all(rr == 0) and np.all(vv == 1)
+
+
+def test_body_ephemeris_cache_key_depends_on_body_frame_and_epochs():
+    epochs = time_range("2020-01-01", end="2020-02-01", scale="tdb")
+
+    key = BodyEphemerisCache.key("earth", "icrs", epochs)
+
+    assert key == BodyEphemerisCache.key("Earth", "icrs", epochs.tt)
+    assert key != BodyEphemerisCache.key("mars", "icrs", epochs)
+    assert key != BodyEphemerisCache.key(
+        "earth", "venus/earth_equator", epochs
+    )
+    assert key != BodyEphemerisCache.key("earth", "icrs", epochs + 1 * u.s)
+
+
+@pytest.mark.parametrize(
+    "attractor, plane",
+    [
+        (None, Planes.EARTH_EQUATOR),
+        (None, Planes.EARTH_ECLIPTIC),
+        (Venus, Planes.EARTH_EQUATOR),
+    ],
+)
+def test_from_body_uses_cached_states(attractor, plane):
+    epochs = time_range("2020-01-01", end="2020-02-01", scale="tdb")
+    with mock.patch(
+        "poliastro.ephem.body_ephemeris_cache", BodyEphemerisCache()
+    ), mock.patch(
+        "poliastro.ephem.get_body_barycentric_posvel",
+        autospec=True,
+        side_effect=get_body_barycentric_posvel,
+    ) as posvel_mock:
+        expected = Ephem.from_body(
+            Earth, epochs, attractor=attractor, plane=plane
+        )
+        call_count = posvel_mock.call_count
+        ephem = Ephem.from_body(
+            Earth, epochs, attractor=attractor, plane=plane
+        )
+
+    assert call_count == (1 if attractor is None else 2)
+    assert posvel_mock.call_count == call_count
+    assert_coordinates_allclose(ephem.sample(), expected.sample(), rtol=1e-15)
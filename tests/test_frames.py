@@ -1,5 +1,10 @@
 from astropy import units as u
-from astropy.coordinates import CartesianRepresentation, get_body_barycentric
+from astropy.coordinates import (
+    BarycentricMeanEcliptic,
+    CartesianDifferential,
+    CartesianRepresentation,
+    get_body_barycentric,
+)
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.time import Time
 import numpy as np
@@ -18,6 +23,11 @@ from poliastro.bodies import (
     Venus,
 )
 from poliastro.constants import J2000
+from poliastro.frames import Planes
+from poliastro.frames.affine import (
+    icrs_to_attractor_states,
+    plane_rotation_matrix,
+)
 from poliastro.frames.ecliptic import GeocentricSolarEcliptic
 from poliastro.frames.equatorial import (
     GCRS,
@@ -26,6 +36,7 @@ from poliastro.frames.equatorial import (
     JupiterICRS,
     MarsICRS,
     MercuryICRS,
+    MoonICRS,
     NeptuneICRS,
     SaturnICRS,
     UranusICRS,
@@ -43,6 +54,12 @@ from poliastro.frames.fixed import (
     UranusFixed,
     VenusFixed,
 )
+from poliastro.frames.rotation import (
+    ITRSRotationCache,
+    PlanetaryFixedRotation,
+)
+from poliastro.frames.util import get_frame
+from poliastro.util import time_range
 
 
 @pytest.mark.parametrize(
@@ -315,3 +332,210 @@ def test_fixed_frame_calculation_gives_expected_result(
     assert_quantity_allclose(
         fixed_position.rot_elements_at_epoch(), radecW, atol=1e-7 * u.deg
     )
+
+
+def test_itrs_rotation_cache_matches_astropy_transformation():
+    epochs = time_range("2022-03-01 00:17", end="2022-03-02", num_values=500)
+    rng = np.random.default_rng(0)
+    rr = rng.normal(size=(500, 3)) * 7000 * u.km
+    vv = rng.normal(size=(500, 3)) * u.km / u.s
+    expected = GCRS(
+        CartesianRepresentation(
+            rr,
+            xyz_axis=-1,
+            differentials=CartesianDifferential(vv, xyz_axis=-1),
+        ),
+        obstime=epochs,
+    ).transform_to(ITRS(obstime=epochs))
+
+    cache = ITRSRotationCache.from_epochs(epochs)
+    rr_itrs, vv_itrs = cache.rotate(rr, epochs, vv)
+
+    assert_quantity_allclose(
+        rr_itrs, expected.cartesian.xyz.T, atol=0.5 * u.m, rtol=0
+    )
+    assert_quantity_allclose(
+        vv_itrs, expected.velocity.d_xyz.T, atol=1 * u.mm / u.s, rtol=0
+    )
+    assert_quantity_allclose(
+        cache.rotate(rr[3], epochs[3]),
+        expected[3].cartesian.xyz,
+        atol=0.5 * u.m,
+        rtol=0,
+    )
+
+
+@pytest.mark.parametrize("step", [13 * u.h, 1 * u.d, 2.5 * u.d])
+def test_itrs_rotation_cache_does_not_alias_long_steps(step):
+    epochs = time_range("2022-03-01 00:17", end="2022-03-06", num_values=200)
+    rr = np.broadcast_to([7000, 0, 0], (200, 3)) * u.km
+    expected = GCRS(
+        CartesianRepresentation(rr, xyz_axis=-1), obstime=epochs
+    ).transform_to(ITRS(obstime=epochs))
+
+    cache = ITRSRotationCache.from_epochs(epochs, step=step)
+
+    assert_quantity_allclose(
+        cache.rotate(rr, epochs), expected.cartesian.xyz.T, atol=0.2 * u.km
+    )
+
+
+def test_itrs_rotation_cache_raises_outside_of_span():
+    cache = ITRSRotationCache(Time("2022-03-01"), Time("2022-03-02"))
+
+    with pytest.raises(ValueError, match="inside the span of the cache"):
+        cache.rotate([7000, 0, 0] * u.km, Time("2022-03-03"))
+
+
+@pytest.mark.parametrize(
+    "attractor, plane",
+    [
+        (None, Planes.EARTH_ECLIPTIC),
+        (Sun, Planes.EARTH_EQUATOR),
+        (Sun, Planes.EARTH_ECLIPTIC),
+        (Mars, Planes.EARTH_EQUATOR),
+        (Jupiter, Planes.EARTH_EQUATOR),
+    ],
+)
+def test_icrs_to_attractor_states_matches_astropy_transformation(
+    attractor, plane
+):
+    epochs = time_range("2022-03-01", end="2023-03-01", scale="tdb")
+    rng = np.random.default_rng(0)
+    rr = rng.normal(size=(len(epochs), 3)) * 1e8
+    vv = rng.normal(size=(len(epochs), 3)) * 30
+    destination_frame = (
+        BarycentricMeanEcliptic()
+        if attractor is None
+        else get_frame(attractor, plane, epochs)
+    )
+    expected = ICRS(
+        CartesianRepresentation(
+            rr * u.km,
+            xyz_axis=-1,
+            differentials=CartesianDifferential(vv * u.km / u.s, xyz_axis=-1),
+        )
+    ).transform_to(destination_frame)
+
+    rr_dest, vv_dest = icrs_to_attractor_states(
+        rr, vv, epochs, attractor, plane
+    )
+
+    assert_quantity_allclose(
+        rr_dest * u.km, expected.cartesian.xyz.T, atol=1 * u.mm, rtol=0
+    )
+    assert_quantity_allclose(
+        vv_dest * u.km / u.s,
+        expected.velocity.d_xyz.T,
+        atol=1e-9 * u.km / u.s,
+        rtol=0,
+    )
+
+
+@pytest.mark.parametrize(
+    "attractor, plane",
+    [(Earth, Planes.EARTH_EQUATOR), (Mars, Planes.BODY_FIXED)],
+)
+def test_icrs_to_attractor_states_raises_for_other_transformations(
+    attractor, plane
+):
+    epochs = Time(["2022-03-01"], scale="tdb")
+
+    with pytest.raises(NotImplementedError):
+        icrs_to_attractor_states(
+            np.ones((1, 3)), np.ones((1, 3)), epochs, attractor, plane
+        )
+
+
+def test_plane_rotation_matrix_is_cached_and_orthogonal():
+    R = plane_rotation_matrix(
+        Earth, Planes.EARTH_EQUATOR, Planes.EARTH_ECLIPTIC
+    )
+
+    assert (
+        plane_rotation_matrix(
+            Earth, Planes.EARTH_EQUATOR, Planes.EARTH_ECLIPTIC
+        )
+        is R
+    )
+    assert np.allclose(R @ R.T, np.eye(3), rtol=0, atol=1e-15)
+    with pytest.raises(NotImplementedError):
+        plane_rotation_matrix(Mars, Planes.EARTH_EQUATOR, Planes.BODY_FIXED)
+
+
+@pytest.mark.parametrize(
+    "equatorial, fixed",
+    [
+        (MarsICRS, MarsFixed),
+        (JupiterICRS, JupiterFixed),
+        (MoonICRS, MoonFixed),
+        (VenusICRS, VenusFixed),
+    ],
+)
+def test_planetary_fixed_rotation_matches_astropy_transformation(
+    equatorial, fixed
+):
+    epochs = time_range("2022-03-01", end="2022-03-08", num_values=1000)
+    rng = np.random.default_rng(0)
+    rr = rng.normal(size=(1000, 3)) * 4000 * u.km
+    expected = equatorial(
+        CartesianRepresentation(rr, xyz_axis=-1), obstime=epochs
+    ).transform_to(fixed(obstime=epochs))
+
+    rotation = PlanetaryFixedRotation(fixed)
+
+    assert_quantity_allclose(
+        rotation.rotate(rr, epochs),
+        expected.cartesian.xyz.T,
+        atol=1 * u.mm,
+        rtol=0,
+    )
+    assert_quantity_allclose(
+        np.einsum("nij,nj->ni", rotation.matrices(epochs), rr.to_value(u.km)),
+        expected.cartesian.xyz.T.to_value(u.km),
+        atol=1e-6,
+        rtol=0,
+    )
+
+
+def test_planetary_fixed_rotation_velocities_include_body_rotation():
+    epoch = Time("2022-03-01", scale="tdb")
+    r = [3000, 2000, 1000] * u.km
+    v = [1, -2, 0.5] * u.km / u.s
+    dt = 1 * u.s
+    rotation = PlanetaryFixedRotation(MoonFixed)
+
+    _, v_fixed = rotation.rotate(r, epoch, v)
+    r_before = rotation.rotate(r - v * dt, epoch - dt)
+    r_after = rotation.rotate(r + v * dt, epoch + dt)
+
+    assert_quantity_allclose(
+        v_fixed, (r_after - r_before) / (2 * dt), atol=1e-6 * u.km / u.s
+    )
+
+
+@pytest.mark.parametrize(
+    "fixed_frame",
+    [
+        SunFixed,
+        MercuryFixed,
+        VenusFixed,
+        MarsFixed,
+        JupiterFixed,
+        SaturnFixed,
+        UranusFixed,
+        NeptuneFixed,
+        MoonFixed,
+    ],
+)
+def test_rot_elements_at_epoch_accepts_arrays_of_epochs(fixed_frame):
+    epochs = time_range("2022-03-01", end="2032-03-01", num_values=7)
+
+    elements = fixed_frame.rot_elements_at_epoch(epochs)
+
+    for i, epoch in enumerate(epochs):
+        for element, expected in zip(
+            elements, fixed_frame.rot_elements_at_epoch(epoch)
+        ):
+            assert element.shape == epochs.shape
+            assert_quantity_allclose(element[i], expected, rtol=1e-14)
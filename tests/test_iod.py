@@ -1,5 +1,7 @@
 from astropy import constants as c, units as u
 from astropy.tests.helper import assert_quantity_allclose
+import numpy as np
+from numpy.testing import assert_allclose
 import pytest
 
 from poliastro.bodies import Earth
@@ -176,3 +178,115 @@ def test_vallado_not_implemented_multirev():
         "Multi-revolution scenario not supported for Vallado. See issue https://github.com/poliastro/poliastro/issues/858"
         in excinfo.exconly()
     )
+
+
+def test_izzo_many_matches_izzo_and_flags_problems_without_solution():
+    k = Earth.k.to_value(u.km**3 / u.s**2)
+    rng = np.random.default_rng(0)
+    r1 = rng.normal(size=(200, 3)) * 10000
+    r2 = rng.normal(size=(200, 3)) * 10000
+    tof = rng.uniform(0.5, 10, 200) * 3600
+    # Collinear positions and non positive time of flight
+    r2[0] = 2 * r1[0]
+    tof[1] = 0.0
+
+    v1, v2, status, iterations = iod.izzo_many(
+        k, r1, r2, tof, 0, True, True, 35, 1e-8
+    )
+
+    assert np.all(np.isnan(v1[:2])) and np.all(np.isnan(v2[:2]))
+    assert list(status[:2]) == [
+        iod._LAMBERT_COLLINEAR,
+        iod._LAMBERT_DEGENERATE,
+    ]
+    assert np.all(status[2:] == 0) and np.all(iterations[2:] > 0)
+    for i in range(2, len(tof)):
+        expected_v1, expected_v2 = iod.izzo(
+            k, r1[i], r2[i], tof[i], 0, True, True, 35, 1e-8
+        )
+        assert_allclose(v1[i], expected_v1, rtol=1e-14)
+        assert_allclose(v2[i], expected_v2, rtol=1e-14)
+
+
+@pytest.mark.parametrize("module", [izzo, vallado])
+def test_lambert_many_matches_lambert(module):
+    k = Earth.k
+    rng = np.random.default_rng(1)
+    r0s = rng.normal(size=(4, 25, 3)) * 10000 * u.km
+    rs = rng.normal(size=(25, 3)) * 10000 * u.km
+    tofs = rng.uniform(0.5, 10, (4, 1)) * u.h
+
+    solutions = module.lambert_many(k, r0s, rs, tofs)
+
+    assert solutions.v0.shape == solutions.v.shape == (4, 25, 3)
+    assert np.all(solutions.converged)
+    assert np.all(solutions.iterations > 0)
+    for i, j in np.ndindex(4, 25):
+        expected_v0, expected_v = module.lambert(
+            k, r0s[i, j], rs[j], tofs[i, 0]
+        )
+        assert_quantity_allclose(solutions.v0[i, j], expected_v0, rtol=1e-12)
+        assert_quantity_allclose(solutions.v[i, j], expected_v, rtol=1e-12)
+
+
+@pytest.mark.parametrize("module", [izzo, vallado])
+@pytest.mark.parametrize(
+    "tofs, M", [([1, 1] * u.h, 1), ([0, 0] * u.h, 0), ([-1, -1] * u.h, 0)]
+)
+def test_lambert_many_flags_problems_without_solution(module, tofs, M):
+    r0s = [[10000.0, 0.0, 0.0], [10000.0, 0.0, 0.0]] * u.km
+    rs = [[-10000.0, 0.0, 0.0], [0.0, 10000.0, 0.0]] * u.km
+
+    solutions = module.lambert_many(Earth.k, r0s, rs, tofs, M=M)
+
+    assert not np.any(solutions.converged)
+    assert np.all(np.isnan(solutions.v0)) and np.all(np.isnan(solutions.v))
+
+
+def test_izzo_raises_error_for_degenerate_problems():
+    k = Earth.k.to_value(u.km**3 / u.s**2)
+    r0 = np.array([10000.0, 0.0, 0.0])
+    r = np.array([np.nan, 10000.0, 0.0])
+
+    with pytest.raises(ValueError, match="degenerate geometry"):
+        iod.izzo(k, r0, r, 3600.0, 0, True, True, 35, 1e-8)
+
+
+@pytest.mark.parametrize("M", [0, 1])
+def test_izzo_grid_warm_start_matches_izzo_many(M):
+    k = Earth.k.to_value(u.km**3 / u.s**2)
+    angles = np.linspace(0.5, 2.5, 40)
+    r1 = np.stack([np.cos(angles), np.sin(angles), np.zeros(40)], -1) * 7000
+    r2 = np.stack(
+        [-np.cos(angles[:30]), np.zeros(30), np.sin(angles[:30])], -1
+    )
+    r2 *= 12000
+    tof = np.linspace(2, 20, 30)[:, None] * 3600 + np.linspace(0, 3600, 40)
+
+    cold = iod.izzo_grid(k, r1, r2, tof, M, True, True, 35, 1e-8, False)
+    warm = iod.izzo_grid(k, r1, r2, tof, M, True, True, 35, 1e-8, True)
+    v1, v2, status, iterations = iod.izzo_many(
+        k,
+        np.ascontiguousarray(np.broadcast_to(r1, (30, 40, 3))).reshape(-1, 3),
+        np.ascontiguousarray(
+            np.broadcast_to(r2[:, None], (30, 40, 3))
+        ).reshape(-1, 3),
+        tof.ravel(),
+        M,
+        True,
+        True,
+        35,
+        1e-8,
+    )
+
+    assert_allclose(cold[0].reshape(-1, 3), v1, rtol=1e-14)
+    assert np.all(cold[3].ravel() == iterations)
+    assert np.all(warm[2].ravel() == status)
+    assert_allclose(warm[0].reshape(-1, 3), v1, rtol=1e-10)
+    assert_allclose(warm[1].reshape(-1, 3), v2, rtol=1e-10)
+    if M == 0:
+        assert np.all(status == 0)
+        assert warm[3].sum() < cold[3].sum()
+    else:
+        assert np.any(status != 0) and np.any(status == 0)
+        assert np.all(warm[3] == cold[3])
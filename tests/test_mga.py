@@ -0,0 +1,114 @@
+from unittest import mock
+
+from astropy import units as u
+from astropy.tests.helper import assert_quantity_allclose
+import numpy as np
+import pytest
+
+from poliastro.bodies import Earth, Jupiter, Mars, Venus
+from poliastro.iod import izzo
+from poliastro.mga import search_mga
+from poliastro.porkchop import get_body_states
+from poliastro.util import norm, time_range
+
+
+@pytest.fixture(scope="module")
+def windows():
+    return [
+        time_range("2021-08-01", end="2021-12-01", num_values=12),
+        time_range("2022-02-01", end="2022-06-01", num_values=12),
+        time_range("2022-07-01", end="2023-03-01", num_values=12),
+    ]
+
+
+def test_search_mga_costs_match_lambert_transfers(windows):
+    sequence = [Earth, Venus, Mars]
+
+    trajectories = search_mga(sequence, windows, num_solutions=5)
+
+    assert len(trajectories) == 5
+    costs = u.Quantity([trajectory.cost for trajectory in trajectories])
+    assert np.all(np.diff(costs) >= 0)
+    for trajectory in trajectories:
+        states = [
+            get_body_states(body, epoch)
+            for body, epoch in zip(sequence, trajectory.epochs)
+        ]
+        vinf_out, vinf_in = [], []
+        for (r0, v0), (r, v), t0, t in zip(
+            states[:-1],
+            states[1:],
+            trajectory.epochs[:-1],
+            trajectory.epochs[1:],
+        ):
+            va, vb = izzo.lambert(
+                Venus.parent.k, r0[0] * u.km, r[0] * u.km, (t - t0).to(u.s)
+            )
+            vinf_out.append(norm(va - v0[0] * u.km / u.s))
+            vinf_in.append(norm(vb - v[0] * u.km / u.s))
+
+        assert_quantity_allclose(trajectory.launch_vinf, vinf_out[0])
+        assert_quantity_allclose(trajectory.arrival_vinf, vinf_in[-1])
+        # Impulse at the periapsis of the flyby at the default minimum altitude
+        r_p = Venus.R + 200 * u.km
+        v_escape2 = 2 * Venus.k / r_p
+        assert_quantity_allclose(
+            trajectory.flyby_dv[0],
+            abs(
+                np.sqrt(vinf_out[1] ** 2 + v_escape2)
+                - np.sqrt(vinf_in[0] ** 2 + v_escape2)
+            ),
+        )
+        assert trajectory.flyby_dv[0] < abs(vinf_out[1] - vinf_in[0])
+        assert_quantity_allclose(
+            trajectory.cost,
+            trajectory.launch_vinf
+            + trajectory.flyby_dv.sum()
+            + trajectory.arrival_vinf,
+        )
+
+
+def test_search_mga_wide_beam_is_not_worse_than_greedy(windows):
+    sequence = [Earth, Venus, Mars]
+
+    greedy = search_mga(sequence, windows, beam_width=1, num_solutions=1)
+    wide = search_mga(sequence, windows, beam_width=10000, num_solutions=1)
+
+    assert wide[0].cost <= greedy[0].cost
+
+
+def test_search_mga_limits_flyby_impulses(windows):
+    max_flyby_dv = 0.5 * u.km / u.s
+
+    trajectories = search_mga(
+        [Earth, Venus, Mars],
+        windows,
+        max_flyby_dv=max_flyby_dv,
+        max_launch_vinf=5 * u.km / u.s,
+        include_arrival=False,
+    )
+
+    assert trajectories
+    for trajectory in trajectories:
+        assert trajectory.flyby_dv[0] <= max_flyby_dv
+        assert trajectory.launch_vinf <= 5 * u.km / u.s
+        assert_quantity_allclose(
+            trajectory.cost, trajectory.launch_vinf + trajectory.flyby_dv[0]
+        )
+
+
+def test_search_mga_prunes_unreachable_legs_before_solving(windows):
+    with mock.patch("poliastro.mga.izzo_grid_fast") as izzo_grid_mock:
+        trajectories = search_mga(
+            [Earth, Jupiter], windows[:2], max_launch_vinf=1 * u.km / u.s
+        )
+
+    assert trajectories == []
+    izzo_grid_mock.assert_not_called()
+
+
+def test_search_mga_checks_windows(windows):
+    with pytest.raises(ValueError, match="at least two bodies"):
+        search_mga([Earth], windows[:1])
+    with pytest.raises(ValueError, match="for every body"):
+        search_mga([Earth, Venus, Mars], windows[:2])
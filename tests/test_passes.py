@@ -0,0 +1,142 @@
+from astropy import units as u
+from astropy.tests.helper import assert_quantity_allclose
+from astropy.time import Time
+import numpy as np
+import pytest
+
+from poliastro.bodies import Earth, Mars
+from poliastro.core.events import elevation_function
+from poliastro.passes import predict_passes
+from poliastro.spheroid_location import SpheroidLocation
+from poliastro.twobody import Orbit
+from poliastro.twobody.sampling import EpochsArray
+from poliastro.util import time_range
+
+
+@pytest.fixture(scope="module")
+def constellation():
+    epoch = Time("2022-01-01", scale="utc")
+    return [
+        Orbit.from_classical(
+            attractor=Earth,
+            a=6878 * u.km,
+            ecc=0.001 * u.one,
+            inc=inc,
+            raan=raan,
+            argp=0 * u.deg,
+            nu=nu,
+            epoch=epoch,
+        )
+        for inc, raan, nu in [
+            (97.5 * u.deg, 0 * u.deg, 0 * u.deg),
+            (53 * u.deg, 40 * u.deg, 100 * u.deg),
+            (60 * u.deg, 200 * u.deg, -110 * u.deg),
+        ]
+    ]
+
+
+@pytest.fixture(scope="module")
+def stations():
+    return [
+        SpheroidLocation(-3.7 * u.deg, 40.4 * u.deg, 0.6 * u.km, Earth),
+        SpheroidLocation(147 * u.deg, -35 * u.deg, 0 * u.km, Earth),
+    ]
+
+
+def _brute_force_passes(orbit, station, epochs, min_elevation):
+    rr = orbit.to_ephem(EpochsArray(epochs)).rv()[0].to_value(u.km)
+    lst = epochs.sidereal_time("mean", "greenwich") + station.lon
+    el = np.array(
+        [
+            elevation_function(
+                0.0,
+                r,
+                station.lat.to_value(u.rad),
+                theta,
+                Earth.R.to_value(u.km),
+                Earth.R_polar.to_value(u.km),
+                station.h.to_value(u.km),
+            )
+            for r, theta in zip(rr, lst.to_value(u.rad))
+        ]
+    )
+    changes = np.diff((el > min_elevation.to_value(u.rad)).astype(int))
+
+    return epochs[1:][changes > 0], epochs[1:][changes < 0]
+
+
+def test_predict_passes_matches_brute_force(constellation, stations):
+    epoch = constellation[0].epoch
+    epochs = time_range(epoch, end=epoch + 1 * u.d, num_values=289)
+    ephems = [orbit.to_ephem(EpochsArray(epochs)) for orbit in constellation]
+    min_elevation = 10 * u.deg
+
+    passes = predict_passes(
+        Earth, ephems, stations, min_elevation=min_elevation
+    )
+
+    fine_epochs = time_range(epoch, end=epoch + 1 * u.d, num_values=8641)
+    for sat, station in [(0, 0), (2, 1)]:
+        expected_aos, expected_los = _brute_force_passes(
+            constellation[sat], stations[station], fine_epochs, min_elevation
+        )
+        mask = (passes["satellite"] == sat) & (passes["station"] == station)
+
+        assert mask.sum() == len(expected_aos) == len(expected_los)
+        assert_quantity_allclose(
+            (passes["aos"][mask] - expected_aos).to(u.s),
+            0 * u.s,
+            atol=11 * u.s,
+        )
+        assert_quantity_allclose(
+            (passes["los"][mask] - expected_los).to(u.s),
+            0 * u.s,
+            atol=11 * u.s,
+        )
+
+    assert np.all(passes["max_elevation"] >= min_elevation)
+    assert np.all(passes["aos"] <= passes["tca"])
+    assert np.all(passes["tca"] <= passes["los"])
+
+
+def test_predict_passes_from_state_arrays_match_ephems(
+    constellation, stations
+):
+    epoch = constellation[0].epoch
+    epochs = time_range(epoch, end=epoch + 6 * u.h, num_values=361)
+    ephems = [orbit.to_ephem(EpochsArray(epochs)) for orbit in constellation]
+    rr = np.stack([ephem.rv()[0] for ephem in ephems])
+    vv = np.stack([ephem.rv()[1] for ephem in ephems])
+
+    expected_passes = predict_passes(Earth, ephems, stations)
+    passes = predict_passes(Earth, (rr, vv), stations, epochs)
+
+    assert len(passes) == len(expected_passes) > 0
+    assert_quantity_allclose(
+        passes["max_elevation"], expected_passes["max_elevation"]
+    )
+
+
+def test_predict_passes_requires_sidereal_time_for_other_attractors():
+    epochs = time_range("2022-01-01", end="2022-01-02", num_values=10)
+    rr = vv = np.ones((1, 10, 3))
+    station = SpheroidLocation(0 * u.deg, 0 * u.deg, 0 * u.km, Mars)
+
+    with pytest.raises(ValueError, match="sidereal_time must be given"):
+        predict_passes(Mars, (rr * u.km, vv * u.km / u.s), station, epochs)
+
+
+def test_predict_passes_times_are_masked_if_not_converged(
+    constellation, stations
+):
+    epoch = constellation[0].epoch
+    epochs = time_range(epoch, end=epoch + 6 * u.h, num_values=361)
+    ephems = [orbit.to_ephem(EpochsArray(epochs)) for orbit in constellation]
+
+    expected_passes = predict_passes(Earth, ephems, stations)
+    passes = predict_passes(Earth, ephems, stations, maxiter=1)
+
+    assert len(passes) == len(expected_passes) > 0
+    assert np.all(passes["satellite"] == expected_passes["satellite"])
+    assert np.all(passes["aos"].mask)
+    assert np.all(passes["los"].mask)
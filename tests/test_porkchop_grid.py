@@ -0,0 +1,146 @@
+from astropy import units as u
+from astropy.tests.helper import assert_quantity_allclose
+import numpy as np
+import pytest
+
+from poliastro.bodies import Earth, Mars, Sun
+from poliastro.ephem import Ephem
+from poliastro.frames import Planes
+from poliastro.maneuver import Maneuver
+from poliastro.porkchop import (
+    PorkchopGrid,
+    _targetting_grid,
+    find_launch_windows,
+    get_body_states,
+)
+from poliastro.twobody import Orbit
+from poliastro.util import norm, time_range
+
+
+def test_targetting_grid_matches_lambert_maneuvers():
+    launch_span = time_range("2005-04-30", end="2005-10-07", num_values=7)
+    arrival_span = time_range("2005-08-16", end="2006-12-21", num_values=5)
+    rr_dpt, vv_dpt = get_body_states(Earth, launch_span)
+    rr_arr, vv_arr = get_body_states(Mars, arrival_span)
+    tof = (arrival_span[:, None] - launch_span[None, :]).to_value(u.s)
+
+    dv_dpt, dv_arr = _targetting_grid(
+        Sun.k.to_value(u.km**3 / u.s**2),
+        rr_dpt,
+        vv_dpt,
+        rr_arr,
+        vv_arr,
+        tof,
+    )
+
+    assert np.all(np.isnan(dv_dpt[tof <= 0]))
+    for i, j in zip(*np.nonzero(tof > 0)):
+        orbits = [
+            Orbit.from_vectors(Sun, rr * u.km, vv * u.km / u.s, epoch)
+            for rr, vv, epoch in [
+                (rr_dpt[j], vv_dpt[j], launch_span[j]),
+                (rr_arr[i], vv_arr[i], arrival_span[i]),
+            ]
+        ]
+        dv_a, dv_b = (norm(dv) for _, dv in Maneuver.lambert(*orbits).impulses)
+        assert_quantity_allclose(dv_dpt[i, j] * u.km / u.s, dv_a, rtol=1e-10)
+        assert_quantity_allclose(dv_arr[i, j] * u.km / u.s, dv_b, rtol=1e-10)
+
+
+def test_porkchop_grid_accepts_ephemerides():
+    launch_span = time_range(
+        "2005-04-30", end="2005-10-07", num_values=6, scale="tdb"
+    )
+    arrival_span = time_range(
+        "2005-11-16", end="2006-12-21", num_values=5, scale="tdb"
+    )
+    ephems = [
+        Ephem.from_body(body, span, attractor=None, plane=Planes.EARTH_EQUATOR)
+        for body, span in [(Earth, launch_span), (Mars, arrival_span)]
+    ]
+
+    expected = PorkchopGrid(Earth, Mars, launch_span, arrival_span)
+    grid = PorkchopGrid(*ephems, launch_span, arrival_span, attractor=Sun)
+
+    assert grid.attractor is expected.attractor
+    assert grid.c3_launch.shape == (len(arrival_span), len(launch_span))
+    assert_quantity_allclose(grid.c3_launch, expected.c3_launch, rtol=1e-7)
+    assert_quantity_allclose(grid.dv_arrival, expected.dv_arrival, rtol=1e-7)
+    assert_quantity_allclose(grid.tof, expected.tof)
+
+
+def test_porkchop_grid_infers_attractor_from_orbit():
+    launch_span = time_range("2005-04-30", end="2005-10-07", num_values=3)
+    arrival_span = time_range("2005-11-16", end="2006-12-21", num_values=3)
+    rr, vv = get_body_states(Earth, launch_span[:1])
+    orbit = Orbit.from_vectors(
+        Sun, rr[0] * u.km, vv[0] * u.km / u.s, launch_span[0]
+    )
+
+    grid = PorkchopGrid(orbit, Mars, launch_span, arrival_span)
+
+    assert grid.attractor is Sun
+    assert np.all(np.isfinite(grid.c3_launch))
+
+
+def test_porkchop_grid_requires_attractor_for_ephemerides():
+    launch_span = time_range(
+        "2005-04-30", end="2005-10-07", num_values=3, scale="tdb"
+    )
+    ephem = Ephem.from_body(Earth, launch_span, attractor=None)
+
+    with pytest.raises(ValueError, match="The attractor must be given"):
+        PorkchopGrid(ephem, Mars, launch_span, launch_span + 200 * u.d)
+
+
+def test_porkchop_grid_keeps_minimum_cost_revolutions():
+    launch_span = time_range("2005-01-01", end="2006-01-01", num_values=15)
+    arrival_span = time_range("2006-01-01", end="2009-01-01", num_values=15)
+
+    direct = PorkchopGrid(Earth, Mars, launch_span, arrival_span)
+    multirev = PorkchopGrid(
+        Earth, Mars, launch_span, arrival_span, max_revs=np.inf
+    )
+
+    assert set(np.unique(multirev.revs)) > {0, 1}
+    assert set(np.unique(multirev.lowpath[multirev.revs > 0])) == {True, False}
+    assert np.all(direct.revs[np.isfinite(direct.cost)] == 0)
+    assert np.all(np.isfinite(multirev.cost[np.isfinite(direct.cost)]))
+    assert not np.any(multirev.cost > direct.cost)
+    for M, lowpath in [(0, True), (1, True), (1, False)]:
+        branch = PorkchopGrid(
+            Earth, Mars, launch_span, arrival_span, M=M, lowpath=lowpath
+        )
+        chosen = (multirev.revs == M) & (multirev.lowpath == lowpath)
+        assert not np.any(multirev.cost > branch.cost)
+        assert_quantity_allclose(
+            multirev.c3_launch[chosen], branch.c3_launch[chosen]
+        )
+
+
+def test_porkchop_grid_rejects_unknown_cost():
+    launch_span = time_range("2005-04-30", end="2005-10-07", num_values=3)
+
+    with pytest.raises(ValueError, match="Cost must be"):
+        PorkchopGrid(Earth, Mars, launch_span, launch_span, cost="c3")
+
+
+def test_find_launch_windows_refines_local_minima():
+    launch_span = time_range("2005-04-30", end="2005-10-07", num_values=10)
+    arrival_span = time_range("2005-11-16", end="2006-12-21", num_values=10)
+    grid = PorkchopGrid(Earth, Mars, launch_span, arrival_span, cost="launch")
+
+    windows = find_launch_windows(grid, levels=2, max_windows=1)
+    (i, j), *_ = grid.local_minima()
+    window = windows[0]
+
+    assert len(windows) == 1
+    assert window.cost < grid.cost[i, j]
+    assert (
+        abs(window.launch - launch_span[j]) < launch_span[1] - launch_span[0]
+    )
+    assert (
+        abs(window.arrival - arrival_span[i])
+        < arrival_span[1] - arrival_span[0]
+    )
+    assert window.revs == 0
@@ -0,0 +1,106 @@
+from unittest import mock
+
+from astropy import units as u
+from astropy.time import Time
+import numpy as np
+import pytest
+
+from poliastro.bodies import Earth
+from poliastro.ephem import Ephem, prefetch_horizons
+from poliastro.frames import Planes
+from poliastro.io import prefetch_sbdb
+from poliastro.query_cache import (
+    QueryCache,
+    cached_query,
+    get_query_cache,
+    set_query_cache,
+)
+
+
+@pytest.fixture
+def query_cache(tmp_path):
+    cache = QueryCache(tmp_path)
+    previous = set_query_cache(cache)
+    yield cache
+    set_query_cache(previous)
+
+
+def test_cached_query_without_cache_always_fetches():
+    fetch = mock.Mock(return_value=1)
+
+    assert get_query_cache() is None
+    cached_query("service", {"a": 1}, fetch)
+    cached_query("service", {"a": 1}, fetch)
+
+    assert fetch.call_count == 2
+    fetch.assert_called_with(a=1)
+
+
+def test_query_cache_stores_responses_by_parameters(query_cache, tmp_path):
+    fetch = mock.Mock(side_effect=lambda a: {"value": a})
+
+    for a in (1, 2, 1):
+        cached_query("service", {"a": a}, fetch)
+
+    assert fetch.call_count == 2
+    assert len(list(tmp_path.glob("*.pkl"))) == 2
+
+    replay = QueryCache(tmp_path, replay_only=True)
+    assert replay.query("service", {"a": 2}, fetch) == {"value": 2}
+    with pytest.raises(ValueError, match="replay only mode"):
+        replay.query("service", {"a": 3}, fetch)
+    assert fetch.call_count == 2
+
+
+def test_query_cache_key_accepts_arrays():
+    params = {"epochs": np.array([2459000.5, 2459001.5]), "id": "Ceres"}
+
+    key = QueryCache.key("horizons", params)
+
+    assert key == QueryCache.key("horizons", dict(reversed(params.items())))
+    assert key != QueryCache.key("sbdb", params)
+
+
+def test_prefetch_fetches_missing_queries_only_once(query_cache):
+    fetch = mock.Mock(side_effect=lambda name: name.upper())
+
+    responses = query_cache.prefetch(
+        "service", [{"name": name} for name in "abcab"], fetch, max_workers=4
+    )
+
+    assert responses == list("ABCAB")
+    assert fetch.call_count == 3
+    query_cache.prefetch("service", [{"name": "a"}], fetch)
+    assert fetch.call_count == 3
+
+
+@mock.patch("poliastro.ephem.Horizons")
+def test_from_horizons_replays_prefetched_queries(
+    horizons_mock, query_cache, tmp_path
+):
+    epochs = Time(["2020-03-01 12:00:00", "2020-03-02 12:00:00"], scale="tdb")
+    horizons_mock().vectors.return_value = {
+        "x": [1, 2] * u.au,
+        "y": [0, 0] * u.au,
+        "z": [0, 0] * u.au,
+        "vx": [0, 0] * (u.au / u.day),
+        "vy": [1, 1] * (u.au / u.day),
+        "vz": [0, 0] * (u.au / u.day),
+    }
+    horizons_mock.reset_mock()
+
+    prefetch_horizons(["Ceres", "Vesta"], epochs, attractor=Earth)
+    assert horizons_mock.call_count == 2
+
+    set_query_cache(QueryCache(tmp_path, replay_only=True))
+    ephem = Ephem.from_horizons(
+        "Ceres", epochs, attractor=Earth, plane=Planes.EARTH_EQUATOR
+    )
+
+    assert horizons_mock.call_count == 2
+    assert np.all(ephem.rv()[0][:, 0] == [1, 2] * u.au)
+
+
+def test_prefetch_requires_query_cache():
+    with pytest.raises(ValueError, match="A query cache must be set"):
+        prefetch_sbdb(["Ceres"])
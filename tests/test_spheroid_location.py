@@ -3,7 +3,7 @@ from astropy.tests.helper import assert_quantity_allclose
 from hypothesis import given, settings, strategies as st
 
 from poliastro.bodies import Earth
-from poliastro.spheroid_location import SpheroidLocation
+from poliastro.spheroid_location import SpheroidLocation, SpheroidLocationArray
 
 
 @st.composite
@@ -123,3 +123,60 @@ def test_h_calculation_near_lat_singularity(lat):
     lon_, lat_, h_ = p.cartesian_to_ellipsoidal(*cartesian_coords)
 
     assert_quantity_allclose(h_, h)
+
+
+def test_spheroid_location_array_matches_scalar_locations():
+    lon = [38.43, -120.0, 0.0, 179.5] * u.deg
+    lat = [41.2, -33.0, 0.0, 89.0] * u.deg
+    h = [0, 500, 10, 1000] * u.m
+    points = [
+        [7000e3, 0, 0],
+        [0, -6500e3, 100e3],
+        [3764859.3, 2987201.7, 4179170.7],
+    ] * u.m
+
+    locations = SpheroidLocationArray(lon, lat, h, Earth)
+    distances = locations.distance(*points.T)
+    visible = locations.is_visible(*points.T)
+
+    assert len(locations) == 4
+    assert distances.shape == visible.shape == (4, 3)
+    for i in range(len(locations)):
+        p = SpheroidLocation(lon[i], lat[i], h[i], Earth)
+
+        assert_quantity_allclose(
+            locations.cartesian_cords[i], p.cartesian_cords
+        )
+        assert_quantity_allclose(locations.N[i], p.N)
+        assert_quantity_allclose(
+            locations.radius_of_curvature[i], p.radius_of_curvature
+        )
+        for j, point in enumerate(points):
+            assert_quantity_allclose(distances[i, j], p.distance(*point))
+            assert visible[i, j] == p.is_visible(*point)
+
+
+def test_spheroid_location_array_cartesian_to_ellipsoidal_round_trip():
+    locations = SpheroidLocationArray.from_grid(
+        [-150, 0, 60] * u.deg, [-60, 10, 45] * u.deg, 100 * u.m, Earth
+    )
+
+    lon, lat, h = locations.cartesian_to_ellipsoidal(
+        *locations.cartesian_cords.T
+    )
+
+    assert len(locations) == 9
+    assert_quantity_allclose(lon, locations.lon, rtol=1e-4)
+    assert_quantity_allclose(lat, locations.lat, rtol=1e-4)
+    assert_quantity_allclose(h, locations.h, atol=1 * u.m)
+
+
+def test_spheroid_location_array_from_locations_and_indexing():
+    p1 = SpheroidLocation(10 * u.deg, 20 * u.deg, 0 * u.m, Earth)
+    p2 = SpheroidLocation(30 * u.deg, -40 * u.deg, 5 * u.m, Earth)
+
+    locations = SpheroidLocationArray.from_locations([p1, p2])
+
+    assert isinstance(locations[1], SpheroidLocation)
+    assert_quantity_allclose(locations[1].cartesian_cords, p2.cartesian_cords)
+    assert len(locations[[0, 1]]) == 2
@@ -1,5 +1,6 @@
 from astropy import units as u
 from astropy.tests.helper import assert_quantity_allclose
+import numpy as np
 import pytest
 
 from poliastro.core.propagation import (
@@ -9,7 +10,11 @@ from poliastro.core.propagation import (
     mikkola_coe,
     pimienta_coe,
 )
-from poliastro.core.propagation.farnocchia import farnocchia_coe
+from poliastro.core.propagation.farnocchia import (
+    farnocchia_coe,
+    farnocchia_rv,
+    farnocchia_rv_many,
+)
 from poliastro.examples import iss
 
 
@@ -42,3 +47,16 @@ def test_propagate_with_coe(propagator_coe):
     nu_final = propagator_coe(k, p, ecc, inc, raan, argp, nu, period)
 
     assert_quantity_allclose(nu_final, nu)
+
+
+def test_farnocchia_rv_many_matches_scalar_version():
+    k = iss.attractor.k.to_value(u.km**3 / u.s**2)
+    r0, v0 = iss.r.to_value(u.km), iss.v.to_value(u.km / u.s)
+    tofs = np.linspace(-2, 10, 50) * iss.period.to_value(u.s)
+
+    rr, vv = farnocchia_rv_many(k, r0, v0, tofs)
+
+    for r, v, tof in zip(rr, vv, tofs):
+        expected_r, expected_v = farnocchia_rv(k, r0, v0, tof)
+        np.testing.assert_allclose(r, expected_r)
+        np.testing.assert_allclose(v, expected_v)
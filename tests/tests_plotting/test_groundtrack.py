@@ -0,0 +1,111 @@
+from astropy import units as u
+from astropy.coordinates import (
+    GCRS,
+    ITRS,
+    CartesianRepresentation,
+    SphericalRepresentation,
+)
+from astropy.tests.helper import assert_quantity_allclose
+from astropy.time import Time
+import numpy as np
+import pytest
+
+from poliastro._math.geometry import douglas_peucker
+from poliastro.bodies import Earth
+from poliastro.earth.plotting import GroundtrackPlotter, compute_groundtracks
+from poliastro.twobody import Orbit
+from poliastro.twobody.sampling import EpochsArray
+from poliastro.util import time_range
+
+
+@pytest.fixture(scope="module")
+def orbits():
+    epoch = Time("2022-01-01", scale="utc")
+    return [
+        Orbit.from_classical(
+            attractor=Earth,
+            a=a,
+            ecc=0.001 * u.one,
+            inc=inc,
+            raan=30 * u.deg,
+            argp=0 * u.deg,
+            nu=0 * u.deg,
+            epoch=epoch,
+        )
+        for a, inc in [(6878 * u.km, 97.5 * u.deg), (7378 * u.km, 53 * u.deg)]
+    ]
+
+
+def test_compute_groundtracks_matches_astropy_transformation(orbits):
+    epochs = time_range(orbits[0].epoch, end=orbits[0].epoch + 6 * u.h)
+
+    groundtracks = compute_groundtracks(orbits, epochs)
+
+    for sat, orbit in enumerate(orbits):
+        rr = orbit.to_ephem(EpochsArray(epochs)).rv()[0]
+        expected = (
+            GCRS(CartesianRepresentation(rr, xyz_axis=-1), obstime=epochs)
+            .transform_to(ITRS(obstime=epochs))
+            .represent_as(SphericalRepresentation)
+        )
+        track = groundtracks[groundtracks["satellite"] == sat]
+
+        assert_quantity_allclose(track["lat"], expected.lat, atol=1e-6 * u.deg)
+        assert_quantity_allclose(
+            track["lon"],
+            expected.lon.wrap_at(180 * u.deg),
+            atol=1e-6 * u.deg,
+        )
+        assert np.all(
+            np.abs(np.diff(track["lon"][track["segment"] == 0])) < 180 * u.deg
+        )
+        assert track["segment"].max() > 0
+
+
+def test_compute_groundtracks_decimation_is_error_bounded(orbits):
+    epochs = time_range(
+        orbits[0].epoch, end=orbits[0].epoch + 1 * u.d, num_values=2000
+    )
+    ephems = [orbit.to_ephem(EpochsArray(epochs)) for orbit in orbits]
+    tolerance = 0.1 * u.deg
+
+    full = compute_groundtracks(ephems)
+    decimated = compute_groundtracks(ephems, tolerance=tolerance)
+
+    assert len(decimated) < len(full) / 2
+    for sat in range(len(ephems)):
+        track = full[full["satellite"] == sat]
+        kept = decimated[decimated["satellite"] == sat]
+        for segment in np.unique(track["segment"]):
+            seg, kept_seg = (t[t["segment"] == segment] for t in (track, kept))
+            t = (seg["epoch"] - epochs[0]).to_value(u.s)
+            t_kept = (kept_seg["epoch"] - epochs[0]).to_value(u.s)
+            x, y = seg["lon"].to_value(u.deg), seg["lat"].to_value(u.deg)
+            x_kept = kept_seg["lon"].to_value(u.deg)
+            y_kept = kept_seg["lat"].to_value(u.deg)
+
+            # Distance of every sample to the chord between the kept samples around it
+            ii = np.clip(
+                np.searchsorted(t_kept, t, side="right") - 1,
+                0,
+                len(t_kept) - 2,
+            )
+            dx, dy = x_kept[ii + 1] - x_kept[ii], y_kept[ii + 1] - y_kept[ii]
+            distance = np.abs(
+                dy * (x - x_kept[ii]) - dx * (y - y_kept[ii])
+            ) / np.hypot(dx, dy)
+
+            assert t_kept[0] == t[0] and t_kept[-1] == t[-1]
+            assert np.all(distance <= tolerance.to_value(u.deg) + 1e-12)
+
+    fig = GroundtrackPlotter().plot_groundtracks(decimated, labels=["a", "b"])
+    assert len(fig.data) == 3
+
+
+def test_douglas_peucker_keeps_vertices_out_of_tolerance():
+    x = np.linspace(0, 4, 5)
+    y = np.array([0.0, 0.52, 1.0, 0.48, 0.0])
+
+    keep = douglas_peucker(x, y, 0.1)
+
+    assert np.all(keep == [True, False, True, False, True])
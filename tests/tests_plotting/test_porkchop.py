@@ -1,8 +1,12 @@
+from unittest import mock
+
+from astropy.tests.helper import assert_quantity_allclose
 from matplotlib import pyplot as plt
 import pytest
 
 from poliastro.bodies import Earth, Mars
 from poliastro.plotting.porkchop import PorkchopPlotter
+from poliastro.porkchop import PorkchopGrid
 from poliastro.util import time_range
 
 
@@ -18,3 +22,39 @@ def test_porkchop_plotting():
     dv_dpt, dv_arr, c3dpt, c3arr, tof = porkchop_plot.porkchop()
 
     return fig
+
+
+def test_porkchop_plotting_uses_precomputed_grid():
+    launch_span = time_range("2005-04-30", end="2005-10-07", num_values=10)
+    arrival_span = time_range("2005-11-16", end="2006-12-21", num_values=10)
+    grid = PorkchopGrid(Earth, Mars, launch_span, arrival_span)
+    porkchop_plot = PorkchopPlotter(
+        Earth, Mars, launch_span, arrival_span, ax=plt.subplots()[1]
+    )
+
+    with mock.patch(
+        "poliastro.plotting.porkchop.PorkchopGrid"
+    ) as porkchop_grid_mock:
+        dv_dpt, dv_arr, c3dpt, c3arr, tof = porkchop_plot.porkchop(grid=grid)
+
+    porkchop_grid_mock.assert_not_called()
+    assert_quantity_allclose(c3dpt, grid.c3_launch)
+    assert_quantity_allclose(tof, grid.tof)
+
+
+@pytest.mark.parametrize("num_values", [10, 11])
+def test_porkchop_plotting_rejects_grid_with_other_dates(num_values):
+    launch_span = time_range("2005-04-30", end="2005-10-07", num_values=10)
+    arrival_span = time_range("2005-11-16", end="2006-12-21", num_values=10)
+    grid = PorkchopGrid(
+        Earth,
+        Mars,
+        time_range("2005-05-30", end="2005-10-07", num_values=num_values),
+        arrival_span,
+    )
+    porkchop_plot = PorkchopPlotter(
+        Earth, Mars, launch_span, arrival_span, ax=plt.subplots()[1]
+    )
+
+    with pytest.raises(ValueError, match="dates of the grid"):
+        porkchop_plot.porkchop(grid=grid)
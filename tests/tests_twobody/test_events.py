@@ -1,11 +1,14 @@
+from unittest import mock
+
 from astropy import units as u
+from astropy.coordinates import get_body_barycentric_posvel
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.time import Time
 import numpy as np
 from numpy.linalg import norm
 import pytest
 
-from poliastro.bodies import Earth
+from poliastro.bodies import Earth, Sun
 from poliastro.constants import H0_earth, rho0_earth
 from poliastro.core.events import line_of_sight
 from poliastro.core.perturbations import atmospheric_drag_exponential
@@ -13,14 +16,19 @@ from poliastro.core.propagation import func_twobody
 from poliastro.twobody import Orbit
 from poliastro.twobody.events import (
     AltitudeCrossEvent,
+    EclipseEvent,
     LatitudeCrossEvent,
     LithobrakeEvent,
     LosEvent,
     NodeCrossEvent,
     PenumbraEvent,
     UmbraEvent,
+    detect_events,
+    eclipse_windows,
 )
 from poliastro.twobody.propagation import CowellPropagator
+from poliastro.twobody.sampling import EpochsArray
+from poliastro.util import time_range
 
 
 @pytest.mark.slow
@@ -199,6 +207,24 @@ def test_penumbra_event_crossing():
     )
 
 
+@pytest.mark.parametrize("span", [None, 3 * u.d])
+def test_eclipse_event_interpolated_secondary_matches_astropy(span):
+    epoch = Time("2020-01-01", scale="utc")
+    orbit = Orbit.circular(Earth, 500 * u.km, epoch=epoch)
+    eclipse_event = EclipseEvent(orbit, span=span)
+
+    for t in [-4000.0, 0.0, 1234.5, 86400.0 * 2.7, 86400.0 * 5.1]:
+        r_sec = eclipse_event(t, orbit.r.to_value(u.km), None)
+
+        (r_earth, _), (r_sun, _) = (
+            get_body_barycentric_posvel(body.name, epoch + t * u.s)
+            for body in (Earth, Sun)
+        )
+        expected_r_sec = (r_sun - r_earth).xyz.to_value(u.km)
+
+        assert_quantity_allclose(r_sec, expected_r_sec, atol=1e-3)
+
+
 def test_node_cross_event():
     t_node = 3.46524036 * u.s
     r = [-6142438.668, 3492467.56, -25767.257] << u.km
@@ -367,7 +393,9 @@ def test_LOS_event_raises_warning_if_norm_of_r1_less_than_attractor_radius_durin
     v1 = np.array([736.138, 29899.7, 164.354]) << u.km / u.s
     orb = Orbit.from_vectors(Earth, r1, v1)
 
-    los_event = LosEvent(Earth, pos_coords, terminal=True)
+    los_event = LosEvent(
+        Earth, pos_coords, terminal=True, tofs=tofs, vel_coords=vv
+    )
     events = [los_event]
     tofs = [0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.5] << u.s
 
@@ -398,7 +426,9 @@ def test_LOS_event_with_lithobrake_event_raises_warning_when_satellite_cuts_attr
     v1 = np.array([736.138, 2989.7, 164.354]) << u.km / u.s
     orb = Orbit.from_vectors(Earth, r1, v1)
 
-    los_event = LosEvent(Earth, pos_coords, terminal=True)
+    los_event = LosEvent(
+        Earth, pos_coords, terminal=True, tofs=tofs, vel_coords=vv
+    )
     tofs = [
         0.003,
         0.004,
@@ -425,22 +455,9 @@ def test_LOS_event_with_lithobrake_event_raises_warning_when_satellite_cuts_attr
     assert lithobrake_event.last_t < los_event.last_t
 
 
-def test_LOS_event():
-    t_los = 2327.165 * u.s
-    r2 = np.array([-500, 1500, 4012.09]) << u.km
-    v2 = np.array([5021.38, -2900.7, 1000.354]) << u.km / u.s
-    orbit = Orbit.from_vectors(Earth, r2, v2)
-
-    tofs = [100, 500, 1000, 2000] << u.s
-    # Propagate the secondary body to generate its position coordinates
-    method = CowellPropagator()
-    rr, vv = method.propagate_many(
-        orbit._state,
-        tofs,
-    )
-    pos_coords = rr  # Trajectory of the secondary body.
-
-    orb = Orbit.from_classical(
+@pytest.fixture
+def los_orbits():
+    primary = Orbit.from_classical(
         attractor=Earth,
         a=16000 * u.km,
         ecc=0.53 * u.one,
@@ -449,15 +466,299 @@ def test_LOS_event():
         argp=10 * u.deg,
         nu=30 * u.deg,
     )
+    secondary = Orbit.from_classical(
+        attractor=Earth,
+        a=8000 * u.km,
+        ecc=0.01 * u.one,
+        inc=60 * u.deg,
+        raan=90 * u.deg,
+        argp=0 * u.deg,
+        nu=120 * u.deg,
+        epoch=primary.epoch,
+    )
+    return primary, secondary
 
-    los_event = LosEvent(Earth, pos_coords, terminal=True)
-    events = [los_event]
-    tofs = [1, 5, 10, 100, 1000, 2000, 3000, 5000] << u.s
 
-    method = CowellPropagator(events=events)
-    r, v = method.propagate_many(
-        orb._state,
-        tofs,
+def test_LOS_event(los_orbits):
+    # Found with a root solver on the analytically propagated positions.
+    t_los = 3341.9664 * u.s
+    orb, secondary = los_orbits
+
+    ephem = secondary.to_ephem(
+        EpochsArray(
+            time_range(orb.epoch, end=orb.epoch + 2 * u.h, num_values=60)
+        )
+    )
+    los_event = LosEvent(Earth, ephem, terminal=True)
+    method = CowellPropagator(events=[los_event])
+    method.propagate_many(orb._state, [5000] * u.s)
+
+    assert_quantity_allclose(los_event.last_t, t_los, atol=1e-2 * u.s)
+
+
+@pytest.mark.parametrize("with_velocities", [True, False])
+def test_LOS_event_with_trajectory_array(los_orbits, with_velocities):
+    t_los = 3341.9664 * u.s
+    orb, secondary = los_orbits
+
+    tofs = np.linspace(0, 7200, 60) << u.s
+    rr, vv = CowellPropagator().propagate_many(secondary._state, tofs)
+
+    los_event = LosEvent(
+        Earth,
+        rr,
+        terminal=True,
+        tofs=tofs,
+        vel_coords=vv if with_velocities else None,
+    )
+    method = CowellPropagator(events=[los_event])
+    method.propagate_many(orb._state, [5000] * u.s)
+
+    assert_quantity_allclose(los_event.last_t, t_los, atol=5e-2 * u.s)
+
+
+def test_LOS_event_raises_error_if_trajectory_array_has_no_tofs():
+    rr = np.zeros((4, 3)) << u.km
+
+    with pytest.raises(ValueError, match="tofs must be given"):
+        LosEvent(Earth, rr)
+
+
+@pytest.mark.parametrize(
+    "direction,expected_directions",
+    [(0, [-1, 1, -1]), (1, [1]), (-1, [-1, -1])],
+)
+def test_detect_events_node_crossings_match_cowell(
+    direction, expected_directions
+):
+    epoch = Time("2020-01-01", scale="utc")
+    orbits = [
+        Orbit.from_classical(
+            attractor=Earth,
+            a=6828137.0 * u.m,
+            ecc=0.0073 * u.one,
+            inc=87.0 * u.deg,
+            raan=20.0 * u.deg,
+            argp=10.0 * u.deg,
+            nu=nu,
+            epoch=epoch,
+        )
+        for nu in [0, 90] * u.deg
+    ]
+    epochs = time_range(epoch, end=epoch + 2.5 * u.h, num_values=151)
+
+    index, event_epochs, directions = detect_events(
+        NodeCrossEvent(direction=direction), orbits, epochs
+    )
+
+    for ii, orbit in enumerate(orbits):
+        node_event = NodeCrossEvent(terminal=True, direction=direction)
+        CowellPropagator(events=[node_event]).propagate_many(
+            orbit._state, [6000] * u.s
+        )
+
+        assert_quantity_allclose(
+            (event_epochs[index == ii][0] - epoch).to(u.s),
+            node_event.last_t,
+            atol=1e-4 * u.s,
+        )
+    assert directions[index == 0].tolist() == expected_directions
+
+
+@pytest.mark.parametrize(
+    "make_event",
+    [
+        lambda orbit: AltitudeCrossEvent(500, Earth.R.to_value(u.km)),
+        lambda orbit: LatitudeCrossEvent(orbit, 30 * u.deg),
+        lambda orbit: PenumbraEvent(orbit),
+        lambda orbit: UmbraEvent(orbit),
+        lambda orbit: NodeCrossEvent(),
+        lambda orbit: LosEvent(
+            Earth,
+            orbit.to_ephem(
+                EpochsArray(
+                    time_range(
+                        orbit.epoch,
+                        end=orbit.epoch + 2 * u.h,
+                        num_values=121,
+                    )
+                )
+            ),
+        ),
+    ],
+)
+def test_event_many_matches_scalar_calls(make_event):
+    orbit = Orbit.from_classical(
+        attractor=Earth,
+        a=6828137.0 * u.m,
+        ecc=0.0073 * u.one,
+        inc=87.0 * u.deg,
+        raan=20.0 * u.deg,
+        argp=10.0 * u.deg,
+        nu=0 * u.deg,
+        epoch=Time("2020-01-01", scale="utc"),
+    )
+    ephem = orbit.to_ephem(
+        EpochsArray(
+            time_range(orbit.epoch, end=orbit.epoch + 2 * u.h, num_values=50)
+        )
     )
+    rr, vv = ephem.rv()
+    tt = (ephem.epochs - orbit.epoch).to_value(u.s)
+    uu = np.hstack((rr.to_value(u.km), vv.to_value(u.km / u.s)))
+    k = Earth.k.to_value(u.km**3 / u.s**2)
+    event = make_event(orbit.propagate(1 * u.h))
+
+    expected = np.array([event(t, u_, k) for t, u_ in zip(tt, uu)])
+
+    assert np.allclose(event.many(tt, uu, k), expected, rtol=1e-12, atol=0)
+
+
+def test_detect_events_evaluates_vectorized_events_in_batches():
+    orbit = Orbit.circular(Earth, 500 * u.km, inc=45 * u.deg)
+    epochs = time_range(orbit.epoch, end=orbit.epoch + 3 * u.h, num_values=181)
+    event = NodeCrossEvent()
+
+    with mock.patch.object(
+        NodeCrossEvent, "__call__", side_effect=AssertionError
+    ), mock.patch.object(
+        NodeCrossEvent, "many", wraps=event.many
+    ) as many_mock:
+        index, _, _ = detect_events(event, orbit, epochs)
 
-    assert_quantity_allclose(los_event.last_t, t_los)
+    assert len(index) == 3
+    assert many_mock.call_count > 1
+
+
+def test_detect_events_on_ephem_without_crossings_returns_empty():
+    orbit = Orbit.from_vectors(
+        Earth,
+        [9946.2, 1035.4, 100.0] * u.km,
+        [7.0, -0.1, 0.0] * u.km / u.s,
+    )
+    ephem = orbit.to_ephem(
+        EpochsArray(
+            time_range(orbit.epoch, end=orbit.epoch + 5 * u.min, num_values=10)
+        )
+    )
+
+    index, event_epochs, directions = detect_events(NodeCrossEvent(), ephem)
+
+    assert len(index) == len(event_epochs) == len(directions) == 0
+
+
+def test_detect_events_epochs_are_masked_if_not_converged():
+    orbit = Orbit.from_classical(
+        attractor=Earth,
+        a=6828137.0 * u.m,
+        ecc=0.0073 * u.one,
+        inc=87.0 * u.deg,
+        raan=20.0 * u.deg,
+        argp=10.0 * u.deg,
+        nu=0 * u.deg,
+        epoch=Time("2020-01-01", scale="utc"),
+    )
+    epochs = time_range(
+        orbit.epoch, end=orbit.epoch + 2.5 * u.h, num_values=151
+    )
+
+    index, event_epochs, directions = detect_events(
+        NodeCrossEvent(), orbit, epochs, maxiter=1
+    )
+
+    assert len(index) == len(event_epochs) == len(directions) == 3
+    assert np.all(event_epochs.mask)
+
+
+def test_detect_events_raises_error_if_orbits_have_no_epochs():
+    orbit = Orbit.circular(Earth, 500 * u.km)
+
+    with pytest.raises(ValueError, match="epochs must be given"):
+        detect_events(NodeCrossEvent(), orbit)
+
+
+@pytest.fixture
+def eclipse_orbits():
+    epoch = Time("2020-01-01", scale="utc")
+    return [
+        Orbit.from_classical(
+            attractor=Earth,
+            a=6828137.0 * u.m,
+            ecc=0.0073 * u.one,
+            inc=87.0 * u.deg,
+            raan=20.0 * u.deg,
+            argp=10.0 * u.deg,
+            nu=nu,
+            epoch=epoch,
+        )
+        for nu in [0, 90, 200] * u.deg
+    ]
+
+
+@pytest.mark.parametrize(
+    "umbra,expected_entry",
+    [
+        (True, Time("2020-01-01 00:04:51.328", scale="utc")),  # From Orekit.
+        (False, Time("2020-01-01 00:04:26.060", scale="utc")),  # From Orekit.
+    ],
+)
+def test_eclipse_windows_first_entry(eclipse_orbits, umbra, expected_entry):
+    epoch = eclipse_orbits[0].epoch
+    epochs = time_range(epoch, end=epoch + 6 * u.h, num_values=361)
+    ephems = [orbit.to_ephem(EpochsArray(epochs)) for orbit in eclipse_orbits]
+
+    windows = eclipse_windows(Earth, ephems, umbra=umbra)
+
+    assert set(windows["index"]) == {0, 1, 2}
+    assert expected_entry.isclose(windows["entry"][0], atol=1 * u.s)
+    # A single eclipse per revolution of roughly 20 minutes,
+    # except for the ones clipped at the ends of the interval
+    durations = windows["duration"][
+        (windows["entry"] > epochs[0]) & (windows["exit"] < epochs[-1])
+    ]
+    assert np.all(durations > 15 * u.min)
+    assert np.all(durations < 25 * u.min)
+
+
+def test_eclipse_windows_from_state_arrays_match_ephems(eclipse_orbits):
+    epoch = eclipse_orbits[0].epoch
+    epochs = time_range(epoch, end=epoch + 3 * u.h, num_values=181)
+    ephems = [orbit.to_ephem(EpochsArray(epochs)) for orbit in eclipse_orbits]
+    rr = np.stack([ephem.rv()[0] for ephem in ephems])
+    vv = np.stack([ephem.rv()[1] for ephem in ephems])
+
+    expected_windows = eclipse_windows(Earth, ephems)
+    windows = eclipse_windows(Earth, (rr, vv), epochs)
+
+    assert np.all(windows["index"] == expected_windows["index"])
+    assert_quantity_allclose(
+        windows["duration"], expected_windows["duration"], atol=1e-2 * u.s
+    )
+    # Windows open at the ends of the interval are clipped
+    assert windows["entry"].min() >= epochs[0]
+    assert windows["exit"].max() <= epochs[-1]
+
+
+def test_eclipse_windows_raises_error_if_arrays_have_no_epochs():
+    rr = vv = np.zeros((2, 10, 3))
+
+    with pytest.raises(ValueError, match="epochs must be given"):
+        eclipse_windows(Earth, (rr * u.km, vv * u.km / u.s))
+
+
+def test_eclipse_windows_times_are_masked_if_not_converged(eclipse_orbits):
+    epoch = eclipse_orbits[0].epoch
+    epochs = time_range(epoch, end=epoch + 3 * u.h, num_values=181)
+    ephems = [orbit.to_ephem(EpochsArray(epochs)) for orbit in eclipse_orbits]
+
+    expected_windows = eclipse_windows(Earth, ephems)
+    windows = eclipse_windows(Earth, ephems, maxiter=1)
+
+    # Only the ends of the windows clipped to the interval are known
+    assert np.all(windows["index"] == expected_windows["index"])
+    assert np.all(
+        windows["entry"].mask == (expected_windows["entry"] > epochs[0])
+    )
+    assert np.all(
+        windows["exit"].mask == (expected_windows["exit"] < epochs[-1])
+    )
@@ -1220,6 +1220,48 @@ def test_change_plane_same_returns_self():
     assert same_iss is iss
 
 
+@pytest.mark.parametrize(
+    "attractor, from_plane, to_plane",
+    [
+        (Earth, Planes.EARTH_EQUATOR, Planes.EARTH_ECLIPTIC),
+        (Earth, Planes.EARTH_ECLIPTIC, Planes.EARTH_EQUATOR),
+        (Sun, Planes.EARTH_EQUATOR, Planes.EARTH_ECLIPTIC),
+    ],
+)
+def test_change_plane_matches_astropy_transformation(
+    attractor, from_plane, to_plane
+):
+    epoch = Time("2022-03-01", scale="tdb")
+    scale = (attractor.R * 2).to(u.km)
+    orbit = Orbit.from_vectors(
+        attractor,
+        [1.0, 0.2, 0.3] * scale,
+        [0.1, 1.0, 0.2] * (scale / (1 * u.h)),
+        epoch,
+        from_plane,
+    )
+    expected = (
+        get_frame(attractor, from_plane, epoch)
+        .realize_frame(
+            orbit.represent_as(CartesianRepresentation, CartesianDifferential)
+        )
+        .transform_to(get_frame(attractor, to_plane, epoch))
+    )
+
+    new_orbit = orbit.change_plane(to_plane)
+
+    assert new_orbit.plane is to_plane
+    assert_quantity_allclose(
+        new_orbit.r, expected.cartesian.xyz, atol=1 * u.mm, rtol=0
+    )
+    # The finite differences used by astropy for the velocities
+    # of the geocentric ecliptic frame add a spurious rotation
+    # of about 50 arcsec per year
+    assert_quantity_allclose(
+        new_orbit.v, expected.velocity.d_xyz, atol=1 * u.mm / u.s, rtol=0
+    )
+
+
 def test_change_plane_twice_restores_original_data():
     new_ss = iss.change_plane(Planes.EARTH_ECLIPTIC).change_plane(iss.plane)
 